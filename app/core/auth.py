@@ -5,9 +5,6 @@
 # This file has been modified with the assistance of IBM Bob AI tool
 
 from fastmcp.server.dependencies import get_http_headers
-import json
-import jwt
-import base64
 
 from app.services.constants import (
     CLOUD_IAM_ENDPOINT,
@@ -23,6 +20,12 @@ from app.shared.exceptions.base import ExternalAPIError
 
 # Application-specific imports
 from app.core.settings import settings, ENV_MODE_SAAS, ENV_MODE_CPD
+from app.core.auth_context import (
+    get_auth_context,
+    get_token_claims as get_token_claims_from_context,
+    get_token_hash,
+)
+from app.core.token_manager import get_token_manager
 from app.shared.utils.http_client import get_http_client
 
 from aiocache import cached
@@ -73,18 +76,49 @@ async def get_access_token() -> str | None:
     Returns a full 'Bearer ...' string or None if nothing available.
     If apikey is provided instead, calls relevant apis for SaaS or CPD
     to get the bearer token
+
+    Within a tool call the token is resolved once and kept in the request-scoped
+    auth context for the rest of the call. A token obtained from an API key is
+    resolved again on every call instead, so long-running work (background jobs)
+    gets the token manager's refreshed token rather than an expired one.
+    """
+    auth_context = get_auth_context()
+    if (
+        auth_context is not None
+        and auth_context.access_token_resolved
+        and auth_context.api_key_hash is None
+    ):
+        return auth_context.access_token
+
+    auth, api_key_hash = await _resolve_access_token()
+
+    if auth_context is not None:
+        auth_context.access_token = auth
+        auth_context.access_token_resolved = True
+        auth_context.api_key_hash = api_key_hash
+    return auth
+
+
+async def _resolve_access_token() -> tuple[str | None, str | None]:
+    """
+    Resolve the Authorization header of the caller.
+
+    Returns:
+        tuple: The "Bearer ..." header value (or None), and the hash of the API
+        key it was obtained from (None when the caller passed a bearer token)
     """
     # get_http_headers() never raises exceptions - returns {} if no HTTP context
     headers = get_http_headers()
     
     auth = headers.get("authorization", "")
+    api_key_hash = None
 
     if not auth:
         api_key_header = headers.get("x-api-key", "")
         if api_key_header:
-            auth = await get_bearer_token_from_apikey(
-                api_key_header, headers.get("username", "")
-            )
+            username = headers.get("username", "")
+            auth = await get_bearer_token_from_apikey(api_key_header, username)
+            api_key_hash = _get_api_key_hash(api_key_header, username)
 
     if not auth and settings.server_transport == "stdio":
         if settings.di_auth_token:
@@ -95,8 +129,32 @@ async def get_access_token() -> str | None:
             apikey = settings.di_apikey
             username = settings.di_username
             auth = await get_bearer_token_from_apikey(apikey, username)
+            api_key_hash = _get_api_key_hash(apikey, username)
+
+    return auth or None, api_key_hash if auth else None
 
-    return auth or None
+
+def _get_api_key_hash(api_key: str, username: str) -> str:
+    return get_token_hash(f"{username}:{api_key}")
+
+
+async def get_caller_hash() -> str:
+    """
+    Identify the caller by a hash that stays the same when its token is refreshed.
+
+    Callers authenticating with an API key are identified by the API key (and
+    username); callers passing a bearer token directly by that token.
+
+    Returns:
+        str: Hex SHA-256 digest identifying the caller
+    """
+    auth_context = get_auth_context()
+    if auth_context is None:
+        auth, api_key_hash = await _resolve_access_token()
+        return api_key_hash or get_token_hash(auth)
+
+    auth = await get_access_token()
+    return auth_context.api_key_hash or get_token_hash(auth)
 
 
 def get_iam_url() -> str:
@@ -134,31 +192,39 @@ async def get_token() -> str:
     return access_token[7:] if access_token else ""
 
 
+async def get_token_claims() -> dict:
+    """
+    Retrieves the claims of the current user's JWT token.
+
+    The payload is decoded once per tool call and shared by all helpers
+    reading claims during that call.
+
+    Returns:
+        dict: The decoded token payload.
+    """
+    token = await get_token()
+    try:
+        return get_token_claims_from_context(token)
+    except ValueError as e:
+        LOGGER.error(f"Failed to decode JWT token payload: {e}")
+        raise ExternalAPIError(str(e))
+    except Exception as e:
+        LOGGER.error(f"Failed to decode JWT token payload: {e}")
+        raise ExternalAPIError(f"Invalid JWT token payload: {str(e)}")
+
+
 async def get_bss_account_id() -> str:
     """
     Retrieves the BSS Account ID from the JWT token.
 
-    This function extracts the BSS Account ID from the JWT token by decoding the payload.
+    This function extracts the BSS Account ID from the claims of the JWT token.
     It assumes the token is in a valid format and contains an "account.bss" key.
 
     Returns:
         str: The BSS Account ID extracted from the token payload.
     """
     if settings.di_env_mode.upper() == ENV_MODE_SAAS:
-        token = await get_token()
-        
-        token_parts = token.split(".")
-        
-        if len(token_parts) < 2:
-            LOGGER.error(f"Invalid JWT token format - expected 3 parts separated by dots, got {len(token_parts)} parts")
-            raise ExternalAPIError(f"Invalid JWT token format - token has {len(token_parts)} parts instead of 3")
-        
-        payload_b64 = token_parts[1]
-        # Add padding if needed for base64 decoding
-        padding = len(payload_b64) % 4
-        if padding:
-            payload_b64 += '=' * (4 - padding)
-        payload = json.loads(base64.urlsafe_b64decode(payload_b64).decode("utf-8"))
+        payload = await get_token_claims()
         return payload.get("account", {}).get("bss", "")
     elif settings.di_env_mode.upper() == ENV_MODE_CPD:
         return "999"
@@ -171,20 +237,14 @@ async def get_user_identifier() -> str:
     """
     Retrieves user identifier from JWT token.
 
-    This function extracts user identifier from JWT token by decoding the payload.
+    This function extracts user identifier from the claims of the JWT token.
     For CPD environments, it returns "uid" field.
     For other environments, it returns "iam_id" field.
 
     Returns:
         str: The user identifier extracted from the token payload.
     """
-    token = await get_token()
-    payload_b64 = token.split(".")[1]
-    # Add padding if needed for base64 decoding
-    padding = len(payload_b64) % 4
-    if padding:
-        payload_b64 += '=' * (4 - padding)
-    payload = json.loads(base64.urlsafe_b64decode(payload_b64).decode("utf-8"))
+    payload = await get_token_claims()
 
     if settings.di_env_mode.upper() == ENV_MODE_CPD:
         return payload.get("uid")
@@ -199,20 +259,13 @@ async def get_user_email_from_token() -> str:
     """
     Retrieves user email from JWT token.
 
-    This function extracts user email from JWT token by decoding the payload.
+    This function extracts user email from the claims of the JWT token.
     It returns the 'email' field from the token if present.
 
     Returns:
         str: The user email extracted from the token payload, or empty string if not found.
     """
-    token = await get_token()
-    payload_b64 = token.split(".")[1]
-    # Add padding if needed for base64 decoding
-    padding = len(payload_b64) % 4
-    if padding:
-        payload_b64 += '=' * (4 - padding)
-    payload = json.loads(base64.urlsafe_b64decode(payload_b64).decode("utf-8"))
-    
+    payload = await get_token_claims()
     return payload.get("email", "")
 
 def is_aws_environment() -> bool:
@@ -271,8 +324,27 @@ def get_header() -> dict:
         )
 
 
-@cached(ttl=3300)  # 55 minutes - shorter than 1 hour token expiration
 async def get_bearer_token_from_apikey(api_key: str, username: str) -> str:
+    """
+    Get a bearer token for an API key.
+
+    Tokens are cached per API key by the token manager until shortly before the
+    expiry in their exp claim, then refreshed in the background. Concurrent
+    requests for the same API key share a single IAM call.
+
+    Args:
+        api_key: The API key
+        username: The username (required for CPD)
+
+    Returns:
+        str: Bearer token including the "Bearer " prefix
+    """
+    return await get_token_manager(_request_bearer_token_from_apikey).get_token(
+        api_key, username
+    )
+
+
+async def _request_bearer_token_from_apikey(api_key: str, username: str) -> str:
 
     LOGGER.info("Getting bearer token for the api key passed in")
 
@@ -327,7 +399,8 @@ async def get_dph_catalog_id_for_user(bearer_token) -> str:
 
     try:
         response = await client.get(
-            f"{settings.di_service_url}/v2/catalogs/ibm-default-hub", headers=headers
+            f"{settings.di_service_url}/v2/catalogs/ibm-default-hub",
+            headers=headers,
         )
         return response.get("metadata", {}).get("guid", "")
 
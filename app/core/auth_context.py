@@ -0,0 +1,138 @@
+# Copyright [2026] [IBM]
+# Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+# See the LICENSE file in the project root for license information.
+
+"""
+Request-scoped authentication context.
+
+A tool invocation resolves its bearer token and decodes the token's claims at
+most once. The first helper that needs them stores them in the context opened
+for the tool call by ``with_request_context``; every later helper in the same
+call (including tasks spawned from it, which inherit the context) reads them
+from there.
+
+Outside of a tool call no context is active and nothing is memoized.
+"""
+
+import base64
+import hashlib
+import json
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+
+@dataclass
+class AuthContext:
+    """Bearer token and decoded claims of the current tool invocation."""
+
+    access_token: Optional[str] = None
+    access_token_resolved: bool = False
+    # Hash of the API key the access token was obtained from, None for bearer tokens
+    api_key_hash: Optional[str] = None
+    claims_token: Optional[str] = None
+    claims: dict[str, Any] = field(default_factory=dict)
+
+
+auth_context_var: ContextVar[Optional[AuthContext]] = ContextVar("auth_context", default=None)
+
+
+def get_auth_context() -> Optional[AuthContext]:
+    """
+    Retrieve the authentication context of the current tool invocation.
+
+    Returns:
+        AuthContext: The active context, or None outside of a tool call.
+    """
+    return auth_context_var.get()
+
+
+def start_auth_context() -> Token:
+    """
+    Open a fresh authentication context for a tool invocation.
+
+    Returns:
+        Token: Token to pass to reset_auth_context when the invocation ends.
+    """
+    return auth_context_var.set(AuthContext())
+
+
+def reset_auth_context(token: Token) -> None:
+    """
+    Restore the authentication context that was active before start_auth_context.
+
+    Args:
+        token: Token returned by start_auth_context
+    """
+    auth_context_var.reset(token)
+
+
+def decode_token_claims(token: str) -> dict[str, Any]:
+    """
+    Decode the payload of a JWT without verifying it.
+
+    Args:
+        token: The JWT, without the "Bearer " prefix
+
+    Returns:
+        dict: The token claims
+
+    Raises:
+        ValueError: If the token is not a JWT or its payload is not valid JSON
+    """
+    token_parts = token.split(".")
+    if len(token_parts) < 2:
+        raise ValueError(
+            f"Invalid JWT token format - token has {len(token_parts)} parts instead of 3"
+        )
+
+    payload_b64 = token_parts[1]
+    # Add padding if needed for base64 decoding
+    payload_b64 += "=" * (-len(payload_b64) % 4)
+    payload = json.loads(base64.urlsafe_b64decode(payload_b64).decode("utf-8"))
+    if not isinstance(payload, dict):
+        raise ValueError("Invalid JWT token format - payload is not a JSON object")
+    return payload
+
+
+def get_token_claims(token: str) -> dict[str, Any]:
+    """
+    Get the claims of a JWT, decoding it only once per tool invocation.
+
+    Args:
+        token: The JWT, without the "Bearer " prefix
+
+    Returns:
+        dict: The token claims
+
+    Raises:
+        ValueError: If the token cannot be decoded
+    """
+    auth_context = get_auth_context()
+    if auth_context is not None and auth_context.claims_token == token:
+        return auth_context.claims
+
+    claims = decode_token_claims(token)
+    if auth_context is not None:
+        auth_context.claims_token = token
+        auth_context.claims = claims
+    return claims
+
+
+def get_token_hash(authorization: Optional[str]) -> str:
+    """
+    Identify the caller behind an Authorization header by a hash of the whole token.
+
+    Used to scope shared state (cached responses, shared pollers, background
+    jobs) to a caller. Unlike the token claims, which are not verified here, the
+    hash cannot be forged without the token itself. A refreshed token yields a
+    new hash, so state of the previous token is no longer reachable.
+
+    Args:
+        authorization: Authorization header value ("Bearer ..."), or the bare token
+
+    Returns:
+        str: Hex SHA-256 digest of the token
+    """
+    token = (authorization or "").removeprefix("Bearer ").removeprefix("bearer ")
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
@@ -0,0 +1,95 @@
+# Copyright [2026] [IBM]
+# Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+# See the LICENSE file in the project root for license information.
+
+"""
+Time budget of the operation in progress, propagated through context variables.
+
+Each tool call can run within a deadline (``TOOL_CALL_DEADLINE_S``, disabled
+by default). Nested scopes can only shorten it, so every nested call sees the remaining budget of its
+tool call: upstream requests cap their timeout to it and retries do not back
+off past it. Background jobs, which outlive their tool call, run in a detached
+scope with their own budget (``BACKGROUND_JOB_DEADLINE_S``).
+
+Work shared between tool calls (coalesced requests, shared pollers) runs in a
+detached scope too, so it does not inherit the budget of the call that happened
+to start it; each call waits for it with ``wait_shared`` within its own budget.
+"""
+
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional, TypeVar
+
+from app.shared.exceptions.base import DeadlineExceededError
+
+T = TypeVar("T")
+
+# Deadline on the time.monotonic() clock
+_deadline_var: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+@contextmanager
+def deadline_scope(timeout_s: Optional[float], detach: bool = False) -> Iterator[None]:
+    """
+    Run the enclosed block within a time budget.
+
+    The deadline of an enclosing scope still applies if it is earlier, unless
+    the scope is detached.
+
+    Args:
+        timeout_s: Budget in seconds, None or 0 for no additional limit
+        detach: Ignore the deadlines of enclosing scopes, for work that outlives
+                the tool call that started it (background jobs)
+    """
+    if not timeout_s or timeout_s <= 0:
+        deadline = None
+    else:
+        deadline = time.monotonic() + timeout_s
+    current = None if detach else _deadline_var.get()
+    if deadline is None and not detach:
+        yield
+        return
+    token = _deadline_var.set(deadline if current is None or deadline is None else min(current, deadline))
+    try:
+        yield
+    finally:
+        _deadline_var.reset(token)
+
+
+def get_remaining_time() -> Optional[float]:
+    """
+    Get the time left until the current deadline.
+
+    Returns:
+        float: Remaining seconds (negative once the deadline passed), or None without a deadline
+    """
+    deadline = _deadline_var.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+async def wait_shared(task: "asyncio.Future[T]", description: str) -> T:
+    """
+    Wait for a task shared with other callers, within the current deadline.
+
+    The task is shielded: a caller giving up, or cancelled, does not cancel it
+    for the others.
+
+    Args:
+        task: The shared task, started in a detached deadline scope
+        description: What is waited for, for the error message
+
+    Returns:
+        The result of the task
+
+    Raises:
+        DeadlineExceededError: If the current deadline passes first
+    """
+    remaining = get_remaining_time()
+    if remaining is None:
+        return await asyncio.shield(task)
+    try:
+        return await asyncio.wait_for(asyncio.shield(task), max(remaining, 0.0))
+    except asyncio.TimeoutError:
+        raise DeadlineExceededError(f"Time budget of the tool call exhausted while waiting for {description}")
@@ -0,0 +1,295 @@
+# Copyright [2026] [IBM]
+# Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+# See the LICENSE file in the project root for license information.
+
+"""
+In-process metrics registry rendered in the Prometheus text format.
+
+Two kinds of sources feed the registry:
+
+- counters and histograms updated where the work happens (tool calls in
+  ``with_request_context``, upstream requests in ``AsyncHttpClient``)
+- collectors registered by components that already keep their own
+  statistics (response cache, token cache, user directory cache, adaptive
+  concurrency limiter); they are read only when the metrics are rendered
+
+With the streamable-HTTP transport the metrics are served on ``/metrics``.
+"""
+
+import bisect
+import math
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.core.settings import settings
+
+METRICS_PREFIX = "wxdi_"
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Histogram buckets in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+WAIT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape_label_value(str(value))}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Counter:
+    """Monotonically increasing counter with labels."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, description: str, label_names: Sequence[str] = ()) -> None:
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        """Increase the counter of the given label values."""
+        self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def get(self, *label_values: str) -> float:
+        """Return the current value of the given label values."""
+        return self._values.get(label_values, 0.0)
+
+    def render(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.label_names, values)} {_format_value(value)}"
+            for values, value in sorted(self._values.items())
+        ]
+
+
+class Histogram:
+    """Histogram with fixed buckets and labels."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        # Per label values: count per bucket (last one is +Inf), sum of observations
+        self._values: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        """Record one observation for the given label values."""
+        counts, total = self._values.setdefault(label_values, ([0] * (len(self.buckets) + 1), [0.0]))
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        total[0] += value
+
+    def get_count(self, *label_values: str) -> int:
+        """Return the number of observations of the given label values."""
+        entry = self._values.get(label_values)
+        return sum(entry[0]) if entry else 0
+
+    def render(self) -> List[str]:
+        lines = []
+        bucket_labels = self.label_names + ("le",)
+        for values, (counts, total) in sorted(self._values.items()):
+            cumulative = 0
+            for upper_bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                labels = _format_labels(bucket_labels, values + (_format_value(upper_bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.label_names, values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total[0])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+@dataclass
+class MetricFamily:
+    """Metric reported by a collector when the metrics are rendered."""
+
+    name: str
+    description: str
+    type_name: str = "gauge"
+    label_names: Tuple[str, ...] = ()
+    samples: List[Tuple[LabelValues, float]] = field(default_factory=list)
+
+    def add(self, value: float, *label_values: str) -> "MetricFamily":
+        """Add a sample for the given label values."""
+        self.samples.append((label_values, value))
+        return self
+
+    def render(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.label_names, values)} {_format_value(value)}"
+            for values, value in self.samples
+        ]
+
+
+Collector = Callable[[], Iterable[MetricFamily]]
+
+
+class MetricsRegistry:
+    """Registry of metrics and collectors of this server process."""
+
+    def __init__(self, prefix: str = METRICS_PREFIX) -> None:
+        self._prefix = prefix
+        self._metrics: Dict[str, object] = {}
+        self._collectors: Dict[str, Collector] = {}
+
+    def counter(self, name: str, description: str, label_names: Sequence[str] = ()) -> Counter:
+        """Get or create a counter."""
+        return self._get_or_create(Counter, name, description, label_names)
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._get_or_create(Histogram, name, description, label_names, buckets=buckets)
+
+    def _get_or_create(self, metric_type, name: str, description: str, label_names: Sequence[str], **kwargs):
+        full_name = self._prefix + name
+        metric = self._metrics.get(full_name)
+        if metric is None:
+            metric = metric_type(full_name, description, label_names, **kwargs)
+            self._metrics[full_name] = metric
+        elif not isinstance(metric, metric_type):
+            raise ValueError(f"Metric '{full_name}' is already registered as a {metric.type_name}")
+        return metric
+
+    def register_collector(self, name: str, collector: Collector) -> None:
+        """
+        Register a function reporting metrics of a component when the metrics are rendered.
+
+        Registering a collector under an existing name replaces it.
+
+        Args:
+            name: Name identifying the collector
+            collector: Function returning the component's metric families (names without prefix)
+        """
+        self._collectors[name] = collector
+
+    def render(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: The metrics, one family after the other
+        """
+        families = list(self._metrics.values())
+        for collector in list(self._collectors.values()):
+            for family in collector():
+                family.name = self._prefix + family.name
+                families.append(family)
+
+        lines = []
+        for family in families:
+            lines.append(f"# HELP {family.name} {family.description}")
+            lines.append(f"# TYPE {family.name} {family.type_name}")
+            lines.extend(family.render())
+        return "\n".join(lines) + "\n"
+
+
+_metrics_registry: Optional[MetricsRegistry] = None
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """
+    Get the global metrics registry instance (singleton pattern).
+
+    Returns:
+        MetricsRegistry: The global metrics registry instance
+    """
+    global _metrics_registry
+    if _metrics_registry is None:
+        _metrics_registry = MetricsRegistry()
+    return _metrics_registry
+
+
+def record_tool_call(tool_name: str, duration_s: float, failed: bool) -> None:
+    """
+    Record a finished tool call.
+
+    Args:
+        tool_name: Name of the tool function
+        duration_s: Duration of the call in seconds
+        failed: Whether the call raised an exception
+    """
+    if not settings.metrics_enabled:
+        return
+    registry = get_metrics_registry()
+    registry.counter("tool_calls_total", "Tool calls", ["tool"]).inc(tool_name)
+    if failed:
+        registry.counter("tool_errors_total", "Tool calls that raised an error", ["tool"]).inc(tool_name)
+    registry.histogram(
+        "tool_duration_seconds", "Duration of tool calls in seconds", ["tool"]
+    ).observe(duration_s, tool_name)
+
+
+def record_upstream_request(endpoint: str, method: str, status: str, duration_s: float) -> None:
+    """
+    Record a finished upstream HTTP request.
+
+    Args:
+        endpoint: Upstream host and endpoint family, e.g. "api.example.com/assets"
+        method: HTTP method
+        status: HTTP status code, "error" if no response was received, "deadline" if the
+                tool call's time budget ran out first, or "too_large" if the body exceeded
+                the maximum size
+        duration_s: Time from sending the request to receiving the response, in seconds
+    """
+    if not settings.metrics_enabled:
+        return
+    registry = get_metrics_registry()
+    registry.counter(
+        "upstream_responses_total", "Upstream HTTP responses by status code", ["endpoint", "method", "status"]
+    ).inc(endpoint, method, status)
+    registry.histogram(
+        "upstream_request_duration_seconds", "Duration of upstream HTTP requests in seconds", ["endpoint", "method"]
+    ).observe(duration_s, endpoint, method)
+
+
+def record_upstream_wait(endpoint: str, wait_s: float) -> None:
+    """
+    Record how long an upstream request waited for its concurrency slots.
+
+    Args:
+        endpoint: Upstream host and endpoint family
+        wait_s: Time spent waiting for the endpoint limit and the global semaphore, in seconds
+    """
+    if not settings.metrics_enabled:
+        return
+    get_metrics_registry().histogram(
+        "upstream_queue_wait_seconds",
+        "Time upstream requests waited for a concurrency slot in seconds",
+        ["endpoint"],
+        buckets=WAIT_BUCKETS,
+    ).observe(wait_s, endpoint)
+
+
+def render_metrics() -> str:
+    """Render the metrics of the global registry in the Prometheus text format."""
+    return get_metrics_registry().render()
@@ -389,6 +389,13 @@ class ServiceRegistry:
         
         return wrapper
 
+    def prepare_tool(self, tool: RegisteredTool) -> tuple[Callable, dict[str, Any]]:
+        """Returns the error-wrapped function and mcp.tool kwargs for a collected tool."""
+        # Wrap all tools with error handler
+        LOGGER.info(f"Wrapping tool '{tool.name}' with error handler")
+        func_to_register = self._create_error_wrapper(tool.func, tool.name)
+        return func_to_register, self._build_tool_kwargs(tool)
+
     def register_all(self, mcp_instance):
         """Registers all collected tools with the FastMCP instance at startup."""
         self._registered_count = 0
@@ -398,16 +405,34 @@ class ServiceRegistry:
             if not tool.enabled:
                 continue
 
-            # Wrap all tools with error handler
-            LOGGER.info(f"Wrapping tool '{tool.name}' with error handler")
-            func_to_register = self._create_error_wrapper(tool.func, tool.name)
-
             # Build kwargs and register tool
-            kwargs = self._build_tool_kwargs(tool)
+            func_to_register, kwargs = self.prepare_tool(tool)
 
             mcp_instance.tool(**kwargs)(func_to_register)
             self._registered_count += 1
 
+    def register_lazy(self, mcp_instance, tools: list[Any]):
+        """
+        Registers tools built from the prebuilt tool index instead of the collected tools.
+
+        The tool modules are imported on the first call of each tool (see app.core.tool_index).
+        """
+        self._registered_count = 0
+        for tool in tools:
+            mcp_instance.add_tool(tool)
+            self._registered_count += 1
+
+    def get_tool(self, name: str) -> RegisteredTool | None:
+        """Returns the collected, enabled tool with the given name, if its module was imported."""
+        for tool in self._tools:
+            if tool.name == name and tool.enabled:
+                return tool
+        return None
+
+    def get_tools(self) -> list[RegisteredTool]:
+        """Returns all collected, enabled tools."""
+        return [tool for tool in self._tools if tool.enabled]
+
     def get_registered_count(self):
         """Returns the number of tools that were actually registered."""
         return self._registered_count
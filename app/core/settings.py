@@ -41,13 +41,91 @@ class Settings(BaseSettings):
     http_max_connections: int = 150  # Max concurrent outgoing connections to external APIs
     http_max_keepalive_connections: int = 50  # Max idle connections kept in pool for reuse
     http_keepalive_expiry: float = 60.0  # Seconds to keep idle connections alive
+    http_max_response_bytes: int = 134217728  # Max response body size (128 MiB), larger responses are rejected; 0 disables
+    json_codec: str = "auto"  # JSON codec for upstream bodies: auto (orjson if installed), orjson or stdlib
+
+    # HTTP/2 Settings (multiplexes concurrent requests over few connections; needs the h2 package)
+    http2_enabled: bool = False  # Negotiate HTTP/2 with upstream hosts, falls back to HTTP/1.1 if h2 is missing
+    http2_max_connections: int = 20  # Max connections in HTTP/2 mode (each one carries many streams)
+    http2_max_keepalive_connections: int = 10  # Max idle connections kept in pool in HTTP/2 mode
+    http2_max_streams_per_host: int = 100  # Max concurrent requests (streams) per upstream host in HTTP/2 mode; 0 disables
     
     # Semaphore Settings (Application-level concurrency control)
     ibm_api_max_concurrent_calls: int = 50  # Max concurrent IBM API calls (protects downstream services)
-    
-    # Retry Settings for Rate Limiting (HTTP 429)
-    retry_max_attempts: int = 3  # Maximum number of retry attempts for rate-limited requests
-    retry_backoff_base: float = 2.0  # Base for exponential backoff (2^0=1s, 2^1=2s, 2^2=4s, 2^3=8s...)
+
+    # Adaptive Concurrency Settings (per upstream host and endpoint family, AIMD-tuned)
+    ibm_api_adaptive_concurrency_enabled: bool = True  # Limit each endpoint family separately inside the global semaphore
+    ibm_api_adaptive_initial_limit: int = 20  # Starting concurrency limit for a newly seen endpoint family
+    ibm_api_adaptive_min_limit: int = 2  # Lower bound the limit never shrinks below
+    ibm_api_adaptive_max_limit: int = 50  # Upper bound the limit never grows above
+    ibm_api_adaptive_latency_tolerance: float = 3.0  # Latency above baseline * tolerance counts as congestion
+    ibm_api_adaptive_backoff_ratio: float = 0.9  # Multiplicative decrease applied on 429/5xx/congestion
+
+    # Tenant Fairness Settings (HTTP transport mode; tenants are the bearer tokens of the requests)
+    tenant_fairness_enabled: bool = True  # Share the IBM API semaphore slots fairly between tenants
+    tenant_max_concurrent_calls: int = 25  # Max slots a single tenant holds at once; 0 lets a tenant use all of them
+
+    # Pagination Settings (offset-paginated listings whose first page reports the total count)
+    pagination_max_concurrent_pages: int = 4  # Pages of one listing fetched at the same time
+
+    # Request Coalescing Settings
+    http_single_flight_enabled: bool = False  # Share one upstream call between concurrent identical GETs
+
+    # Circuit Breaker Settings (per upstream host and endpoint family)
+    circuit_breaker_enabled: bool = True  # Fail calls fast while an upstream endpoint family keeps failing
+    circuit_breaker_window_size: int = 50  # Most recent calls the failure and slow-call rates are computed over
+    circuit_breaker_min_calls: int = 20  # Calls in the window before the breaker can open
+    circuit_breaker_failure_rate_percent: float = 50.0  # Open when this share of calls failed (5xx, connection errors)
+    circuit_breaker_slow_call_threshold_s: float = 30.0  # Calls taking longer than this count as slow
+    circuit_breaker_slow_call_rate_percent: float = 80.0  # Open when this share of calls were slow
+    circuit_breaker_open_s: float = 30.0  # Seconds calls fail fast before probe calls are let through
+    circuit_breaker_half_open_probes: int = 3  # Probe calls that must succeed to close the breaker again
+
+    # Request Hedging Settings (latency-critical GETs send a second request when the first one is slow)
+    http_hedging_enabled: bool = False  # Hedge GETs marked as latency-critical by their callers
+    http_hedging_percentile: float = 95.0  # Hedge once a request is slower than this latency percentile of its endpoint
+    http_hedging_min_delay_ms: int = 50  # Never hedge earlier than this
+    http_hedging_min_samples: int = 20  # Latency samples an endpoint needs before its requests are hedged
+    http_hedging_budget_percent: float = 5.0  # Max extra load from hedges, in percent of hedgeable requests
+
+    # Response Cache Settings (per-endpoint TTLs are declared in each service's manifest.yaml)
+    response_cache_enabled: bool = True  # Cache GET responses of endpoints with a manifest cache policy
+    response_cache_max_entries: int = 2048  # Max cached responses kept before evicting least recently used
+    response_cache_stale_while_revalidate_s: int = 60  # Seconds an expired entry is still served while refreshing
+
+    # API Key Token Cache Settings
+    token_cache_max_entries: int = 1000  # Max API key principals whose bearer tokens are cached
+    token_refresh_margin_s: int = 300  # Refresh a cached token in the background this long before it expires
+    token_default_ttl_s: int = 3300  # Assumed token lifetime when the token has no exp claim
+
+    # User Directory Cache Settings (indexed user/group listings used by user search)
+    user_directory_cache_enabled: bool = True  # Answer user/group lookups from a cached, indexed directory
+    user_directory_cache_max_entries: int = 32  # Max account directories kept before evicting least recently used
+    user_directory_cache_refresh_s: int = 300  # Re-list a directory in the background once it is this old
+    user_directory_cache_max_age_s: int = 3600  # Never serve a directory older than this
+
+    # Metrics Settings
+    metrics_enabled: bool = True  # Record tool/upstream metrics in memory
+    metrics_route_enabled: bool = False  # Serve the metrics on /metrics (HTTP transport)
+    diagnostics_auth_token: str | None = None  # Bearer token required by /metrics and /traces; unset leaves them open to anyone reaching the server
+
+    # Tracing Settings (spans of tool calls and their upstream requests, in OTLP/JSON)
+    tracing_enabled: bool = True  # Record spans of tool calls and upstream requests in memory
+    tracing_route_enabled: bool = False  # Serve the most recent spans on /traces (HTTP transport)
+    tracing_buffer_size: int = 2048  # Finished spans kept in memory
+    tracing_export_path: str | None = None  # Also append finished traces to this file, one export request per line
+
+    # Retry Settings (HTTP 429, and 502/503/504 and connection resets of idempotent requests)
+    retry_max_attempts: int = 3  # Maximum number of attempts per request, including the first one
+    retry_backoff_base: float = 2.0  # Delay growth; each jittered delay is drawn between 1s and (base + 1) x the previous one
+    retry_max_delay_s: float = 30.0  # Longest delay between attempts; a longer Retry-After is not waited for
+    tool_call_deadline_s: float = 0.0  # Time budget of a tool call; requests and retries never run past it (0 disables)
+
+    # Background Job Settings (long-running tools started with run_in_background=true)
+    background_job_deadline_s: float = 3600.0  # Time budget of a background job, replacing the tool call deadline (0 disables)
+    background_job_result_ttl_s: int = 3600  # How long a finished job and its result are kept
+    background_job_max_running: int = 50  # Jobs running at the same time; further submissions are rejected
+    background_job_max_running_per_owner: int = 5  # Jobs a single caller runs at the same time
     
     # Server-side Connection Settings (for HTTP transport mode)
     server_limit_concurrency: int = 300  # Max concurrent incoming client connections
@@ -164,10 +242,21 @@ class Settings(BaseSettings):
     # Log file path
     log_file_path: str | None = None
 
+    # Write logs from a background thread so slow log volumes do not block the event loop
+    log_queue_enabled: bool = True
+    # Maximum number of log records waiting to be written
+    log_queue_size: int = 10000
+    # What to do when the log queue is full: drop_new, drop_oldest or block
+    log_queue_overflow: str = "drop_new"
+
     # wxo compatibile tools
     wxo: bool = False
 
     # experimental tools
     use_experimental: bool = False
 
+    # List tools from the prebuilt tool index (app/core/tool_index.json) and import
+    # each tool module on its first call instead of at startup
+    lazy_tool_loading: bool = False
+
 settings = Settings()
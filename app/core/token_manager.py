@@ -0,0 +1,228 @@
+# Copyright [2026] [IBM]
+# Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+# See the LICENSE file in the project root for license information.
+
+"""
+Bearer token cache for API key authentication.
+
+Tokens obtained from IAM for an API key are cached per principal with:
+
+- a bounded number of entries (least recently used principals are evicted)
+- entries keyed by a hash of the API key and username, never the raw key
+- expiry taken from the token's ``exp`` claim
+- refresh in the background once a token is close to expiry, while the
+  current token keeps being served
+- a per-key lock, so concurrent cache misses for the same API key result
+  in a single IAM call
+"""
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+import jwt
+
+from app.core.metrics import MetricFamily, get_metrics_registry
+from app.core.settings import settings
+from app.shared.logging import LOGGER
+
+TokenFetcher = Callable[[str, str], Awaitable[str]]
+
+
+@dataclass
+class _TokenEntry:
+    token: str
+    expires_at: float
+    refresh_at: float
+
+
+def get_token_expiry(token: str, default_ttl_s: float) -> float:
+    """
+    Get the expiry time of a bearer token as a ``time.time()`` timestamp.
+
+    Args:
+        token: Bearer token, with or without the "Bearer " prefix
+        default_ttl_s: Lifetime assumed when the token has no readable ``exp`` claim
+
+    Returns:
+        float: Expiry timestamp in seconds since the epoch
+    """
+    raw_token = token.removeprefix("Bearer ").strip()
+    try:
+        claims = jwt.decode(
+            raw_token, options={"verify_signature": False, "verify_exp": False}
+        )
+        exp = claims.get("exp")
+        if isinstance(exp, (int, float)):
+            return float(exp)
+    except jwt.PyJWTError as e:
+        LOGGER.debug(f"Could not read exp claim from bearer token: {e}")
+    return time.time() + default_ttl_s
+
+
+class TokenManager:
+    """Bounded per-principal cache of bearer tokens with proactive refresh."""
+
+    def __init__(
+        self,
+        fetcher: TokenFetcher,
+        max_entries: int,
+        refresh_margin_s: float,
+        default_ttl_s: float,
+    ) -> None:
+        """
+        Args:
+            fetcher: Coroutine function exchanging (api_key, username) for a bearer token
+            max_entries: Maximum number of principals kept in the cache
+            refresh_margin_s: Refresh tokens this many seconds before they expire
+            default_ttl_s: Lifetime assumed for tokens without an ``exp`` claim
+        """
+        self._fetcher = fetcher
+        self._max_entries = max_entries
+        self._refresh_margin_s = refresh_margin_s
+        self._default_ttl_s = default_ttl_s
+        self._entries: OrderedDict[str, _TokenEntry] = OrderedDict()
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._refreshing: dict[str, asyncio.Task] = {}
+        self._stats = {"hits": 0, "misses": 0}
+
+    @staticmethod
+    def _cache_key(api_key: str, username: str) -> str:
+        return hashlib.sha256(f"{username}\0{api_key}".encode("utf-8")).hexdigest()
+
+    async def get_token(self, api_key: str, username: str) -> str:
+        """
+        Get a valid bearer token for an API key, fetching it from IAM if needed.
+
+        Args:
+            api_key: The API key
+            username: The username (CPD only, empty for SaaS)
+
+        Returns:
+            str: Bearer token including the "Bearer " prefix
+        """
+        key = self._cache_key(api_key, username)
+        entry = self._get_valid_entry(key)
+        if entry is not None:
+            self._stats["hits"] += 1
+            if time.time() >= entry.refresh_at:
+                self._refresh_in_background(key, api_key, username)
+            return entry.token
+
+        self._stats["misses"] += 1
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                # Another caller may have fetched the token while we were waiting
+                entry = self._get_valid_entry(key)
+                if entry is not None:
+                    return entry.token
+                return await self._fetch_and_store(key, api_key, username)
+        finally:
+            # Do not keep locks of API keys that IAM rejected
+            if key not in self._entries and not lock.locked():
+                self._locks.pop(key, None)
+
+    def _get_valid_entry(self, key: str) -> _TokenEntry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    async def _fetch_and_store(self, key: str, api_key: str, username: str) -> str:
+        token = await self._fetcher(api_key, username)
+        now = time.time()
+        expires_at = get_token_expiry(token, self._default_ttl_s)
+        # Never schedule the refresh earlier than half-way through the token's lifetime
+        refresh_margin = min(self._refresh_margin_s, max(expires_at - now, 0) / 2)
+        self._entries[key] = _TokenEntry(
+            token=token,
+            expires_at=expires_at,
+            refresh_at=expires_at - refresh_margin,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            evicted_key, _ = self._entries.popitem(last=False)
+            lock = self._locks.get(evicted_key)
+            if lock is not None and not lock.locked():
+                del self._locks[evicted_key]
+        return token
+
+    def _refresh_in_background(self, key: str, api_key: str, username: str) -> None:
+        if key in self._refreshing:
+            return
+
+        async def _refresh() -> None:
+            try:
+                async with self._locks.setdefault(key, asyncio.Lock()):
+                    await self._fetch_and_store(key, api_key, username)
+                LOGGER.info("Refreshed bearer token ahead of expiry")
+            except Exception as e:
+                # Keep serving the current token until it actually expires
+                LOGGER.warning(f"Background bearer token refresh failed: {e}")
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.ensure_future(_refresh())
+
+    def invalidate(self, api_key: str, username: str) -> None:
+        """Drop the cached token of an API key, e.g. after the upstream rejected it."""
+        self._entries.pop(self._cache_key(api_key, username), None)
+
+    def get_stats(self) -> dict[str, int]:
+        """Return hit/miss counters, the number of cached principals and refreshes in progress."""
+        return {
+            **self._stats,
+            "size": len(self._entries),
+            "max_entries": self._max_entries,
+            "refreshing": len(self._refreshing),
+        }
+
+
+_token_manager: TokenManager | None = None
+
+
+def _collect_token_cache_metrics() -> list[MetricFamily]:
+    """Report lookups and the size of the bearer token cache."""
+    if _token_manager is None:
+        return []
+    stats = _token_manager.get_stats()
+    return [
+        MetricFamily("token_cache_lookups_total", "Bearer token cache lookups by result", "counter", ("result",))
+        .add(stats["hits"], "hits")
+        .add(stats["misses"], "misses"),
+        MetricFamily("token_cache_entries", "Principals in the bearer token cache").add(stats["size"]),
+    ]
+
+
+get_metrics_registry().register_collector("token_cache", _collect_token_cache_metrics)
+
+
+def get_token_manager(fetcher: TokenFetcher) -> TokenManager:
+    """
+    Get the global token manager instance (singleton pattern).
+
+    Args:
+        fetcher: Coroutine function exchanging (api_key, username) for a bearer token,
+                 used when the instance is first created
+
+    Returns:
+        TokenManager: The global token manager instance
+    """
+    global _token_manager
+    if _token_manager is None:
+        _token_manager = TokenManager(
+            fetcher,
+            max_entries=settings.token_cache_max_entries,
+            refresh_margin_s=settings.token_refresh_margin_s,
+            default_ttl_s=settings.token_default_ttl_s,
+        )
+    return _token_manager
@@ -0,0 +1,190 @@
+# Copyright [2026] [IBM]
+# Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+# See the LICENSE file in the project root for license information.
+
+"""
+Prebuilt tool index for lazy tool loading.
+
+Importing every tool module at startup pulls in heavy dependencies (sqlglot,
+pandas, large pydantic model graphs) before the server can answer
+``initialize``. With ``LAZY_TOOL_LOADING=true`` the server instead lists tools
+from a prebuilt index holding their names, descriptions and JSON schemas, and
+imports a tool's module only when the tool is first called.
+
+The index is only used when it was built from the same sources and with the
+same experimental-tools setting; otherwise the server falls back to importing
+all tool modules at startup.
+
+Regenerate the index with::
+
+    python -m app.core.tool_index
+
+or ``make tool-index``.
+"""
+
+import hashlib
+import importlib
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+from fastmcp.exceptions import ToolError
+from fastmcp.tools import Tool
+from fastmcp.tools.function_tool import FunctionTool
+from fastmcp.tools.tool import ToolResult
+from pydantic import PrivateAttr
+
+from app.core.registry import service_registry
+from app.core.settings import settings
+from app.shared.logging import LOGGER
+
+TOOL_INDEX_VERSION = 1
+TOOL_INDEX_PATH = Path(__file__).parent / "tool_index.json"
+APP_DIR = Path(__file__).resolve().parents[1]
+
+# Tool fields stored in the index, enough to list the tool without importing it
+INDEXED_TOOL_FIELDS = {
+    "name",
+    "title",
+    "description",
+    "tags",
+    "meta",
+    "parameters",
+    "output_schema",
+    "annotations",
+    "timeout",
+}
+
+
+def get_source_fingerprint(app_dir: Path = APP_DIR) -> str:
+    """
+    Hash all Python sources of the application.
+
+    Tool schemas depend on the tool modules and the models they use, so any
+    source change invalidates the index.
+
+    Args:
+        app_dir: Root directory of the application package
+
+    Returns:
+        str: Hex digest over the relative paths and contents of all .py files
+    """
+    digest = hashlib.sha256()
+    for source_file in sorted(app_dir.rglob("*.py")):
+        digest.update(str(source_file.relative_to(app_dir)).encode("utf-8"))
+        digest.update(source_file.read_bytes())
+    return digest.hexdigest()
+
+
+class LazyTool(Tool):
+    """Tool listed from the prebuilt index whose module is imported on first call."""
+
+    _module: str = PrivateAttr()
+    _tool: Tool | None = PrivateAttr(default=None)
+
+    def __init__(self, module: str, **data: Any) -> None:
+        super().__init__(**data)
+        self._module = module
+
+    def _resolve(self) -> Tool:
+        """Import the tool's module and build the real tool from its registration."""
+        if self._tool is None:
+            LOGGER.info(f"Loading module '{self._module}' for tool '{self.name}'")
+            importlib.import_module(self._module)
+            registered = service_registry.get_tool(self.name)
+            if registered is None:
+                raise ToolError(
+                    f"Tool '{self.name}' is not registered by module '{self._module}'. "
+                    "The tool index is out of date, regenerate it with: python -m app.core.tool_index"
+                )
+            func, kwargs = service_registry.prepare_tool(registered)
+            self._tool = FunctionTool.from_function(func, **kwargs)
+        return self._tool
+
+    async def run(self, arguments: dict[str, Any]) -> ToolResult:
+        """Run the tool, importing its module first if this is the first call."""
+        return await self._resolve().run(arguments)
+
+
+def build_tool_index(tools: list[Tool]) -> dict[str, Any]:
+    """
+    Build the tool index from the tools of an eagerly created server.
+
+    Args:
+        tools: Tools listed by the server
+
+    Returns:
+        dict: The index, ready to be written as JSON
+    """
+    modules = {tool.name: tool.func.__module__ for tool in service_registry.get_tools()}
+    return {
+        "version": TOOL_INDEX_VERSION,
+        "fingerprint": get_source_fingerprint(),
+        "use_experimental": settings.use_experimental,
+        "tools": [
+            {
+                "module": modules[tool.name],
+                "tool": tool.model_dump(mode="json", include=INDEXED_TOOL_FIELDS),
+            }
+            for tool in tools
+            if tool.name in modules
+        ],
+    }
+
+
+def load_tool_index(path: Path = TOOL_INDEX_PATH) -> list[LazyTool] | None:
+    """
+    Load lazily imported tools from the prebuilt index.
+
+    Args:
+        path: Path of the index file
+
+    Returns:
+        list[LazyTool] | None: The tools, or None if the index is missing or out of date
+    """
+    if not path.is_file():
+        LOGGER.warning(f"Tool index {path} not found, importing all tool modules")
+        return None
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError) as e:
+        LOGGER.warning(f"Could not read tool index {path}: {e}, importing all tool modules")
+        return None
+
+    if index.get("version") != TOOL_INDEX_VERSION:
+        LOGGER.warning("Tool index version mismatch, importing all tool modules")
+        return None
+    if index.get("use_experimental") != settings.use_experimental:
+        LOGGER.warning("Tool index was built with a different USE_EXPERIMENTAL setting, importing all tool modules")
+        return None
+    if index.get("fingerprint") != get_source_fingerprint():
+        LOGGER.warning("Tool index is out of date, importing all tool modules")
+        return None
+
+    return [LazyTool(entry["module"], **entry["tool"]) for entry in index.get("tools", [])]
+
+
+async def _list_server_tools() -> list[Tool]:
+    from app.main import create_server
+
+    mcp = create_server(lazy=False)
+    return list(await mcp.list_tools())
+
+
+def main() -> None:
+    """Regenerate the tool index from the current sources."""
+    import asyncio
+
+    tools = asyncio.run(_list_server_tools())
+    index = build_tool_index(tools)
+    with open(TOOL_INDEX_PATH, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+        f.write("\n")
+    print(f"✅ Wrote {len(index['tools'])} tools to {TOOL_INDEX_PATH}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,374 @@
+# Copyright [2026] [IBM]
+# Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+# See the LICENSE file in the project root for license information.
+
+"""
+Lightweight span recording for tool calls and their upstream requests.
+
+Every tool call opened by ``with_request_context`` records a server span and
+every upstream request made while it runs records a client span below it:
+
+- the tool span's trace ID is the call's ``transaction_id`` (without dashes),
+  so traces and logs of a call can be joined
+- an upstream span covers all attempts of one request; each attempt is a
+  child span with the time spent waiting for a concurrency slot, and every
+  retry backoff is recorded as an event with its delay
+- finished spans are kept in a bounded ring buffer, optionally served on
+  ``/traces`` with the streamable-HTTP transport, and optionally appended to
+  a file
+- spans carry no identifiers of users' data: IDs in URL paths are replaced
+  by ``{id}`` and failed spans only record the exception type, not its
+  message
+
+Spans are exported in the OTLP/JSON format (``ExportTraceServiceRequest``).
+The file holds one request per line, written by a background thread.
+"""
+
+import atexit
+import json
+import queue
+import re
+import secrets
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+from app.core.settings import settings
+
+SERVICE_NAME = "wxdi-mcp-server"
+SCOPE_NAME = "app.core.tracing"
+
+# OTLP span kinds
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+# OTLP status codes
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+# URL path segments holding identifiers: numbers, and tokens of 8+ characters containing a digit (UUIDs, hex IDs)
+_ID_SEGMENT_PATTERN = re.compile(r"^(\d+|(?=[^/]*\d)[0-9A-Za-z_.:~-]{8,})$")
+
+
+@dataclass
+class Span:
+    """A timed operation within a trace."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: str = ""
+    kind: int = SPAN_KIND_INTERNAL
+    start_time_ns: int = field(default_factory=time.time_ns)
+    end_time_ns: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    status_code: int = STATUS_UNSET
+    status_message: str = ""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute of the span."""
+        self.attributes[key] = value
+
+    def add_to_attribute(self, key: str, value: float) -> None:
+        """Add a value to a numeric attribute, e.g. to accumulate time spent in backoff."""
+        self.attributes[key] = self.attributes.get(key, 0) + value
+
+    def add_event(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> None:
+        """Record a point in time within the span."""
+        self.events.append({"name": name, "time_ns": time.time_ns(), "attributes": attributes or {}})
+
+    def set_error(self, message: str) -> None:
+        """Mark the span as failed."""
+        self.status_code = STATUS_ERROR
+        self.status_message = message
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_time_ns - self.start_time_ns) / 1e6 if self.end_time_ns else 0.0
+
+
+current_span_var: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def get_current_span() -> Optional[Span]:
+    """
+    Retrieve the span of the operation in progress.
+
+    Returns:
+        Span: The current span, or None if tracing is disabled or no span is open.
+    """
+    return current_span_var.get()
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        # OTLP/JSON encodes 64-bit integers as strings
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items()]
+
+
+def span_to_otlp(span: Span) -> Dict[str, Any]:
+    """Convert a span to its OTLP/JSON representation."""
+    otlp_span: Dict[str, Any] = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": span.kind,
+        "startTimeUnixNano": str(span.start_time_ns),
+        "endTimeUnixNano": str(span.end_time_ns),
+        "attributes": _otlp_attributes(span.attributes),
+        "events": [
+            {
+                "name": event["name"],
+                "timeUnixNano": str(event["time_ns"]),
+                "attributes": _otlp_attributes(event["attributes"]),
+            }
+            for event in span.events
+        ],
+        "status": {"code": span.status_code, "message": span.status_message},
+    }
+    if span.parent_span_id:
+        otlp_span["parentSpanId"] = span.parent_span_id
+    return otlp_span
+
+
+def spans_to_otlp(spans: List[Span]) -> Dict[str, Any]:
+    """
+    Build an OTLP/JSON ``ExportTraceServiceRequest`` from spans.
+
+    Args:
+        spans: Finished spans
+
+    Returns:
+        dict: The export request, ready to be JSON encoded
+    """
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": _otlp_attributes({"service.name": SERVICE_NAME})},
+                "scopeSpans": [{"scope": {"name": SCOPE_NAME}, "spans": [span_to_otlp(span) for span in spans]}],
+            }
+        ]
+    }
+
+
+class _FileExporter:
+    """Appends OTLP/JSON export requests to a file from a background thread."""
+
+    def __init__(self, path: str) -> None:
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="span-file-exporter", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def export(self, spans: List[Span]) -> None:
+        self._queue.put(spans)
+
+    def stop(self) -> None:
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+    def _run(self) -> None:
+        with open(self._path, "a", encoding="utf-8") as f:
+            while True:
+                spans = self._queue.get()
+                if spans is None:
+                    return
+                f.write(json.dumps(spans_to_otlp(spans)) + "\n")
+                f.flush()
+
+
+class Tracer:
+    """Records spans and exports finished ones to a ring buffer and an optional file."""
+
+    def __init__(self, buffer_size: int, export_path: Optional[str] = None) -> None:
+        """
+        Args:
+            buffer_size: Number of finished spans kept in memory
+            export_path: File the finished traces are appended to, if any
+        """
+        self._finished: Deque[Span] = deque(maxlen=max(buffer_size, 1))
+        # Spans of traces whose root span is still open, exported together with the root
+        self._pending: Dict[str, List[Span]] = {}
+        self._file_exporter = _FileExporter(export_path) if export_path else None
+
+    @contextmanager
+    def start_span(
+        self,
+        name: str,
+        kind: int = SPAN_KIND_INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None,
+        trace_id: Optional[str] = None,
+    ) -> Iterator[Span]:
+        """
+        Open a span as a child of the current span, or as the root of a new trace.
+
+        An exception leaving the block marks the span as failed and is re-raised.
+
+        Args:
+            name: Name of the operation
+            kind: OTLP span kind
+            attributes: Initial attributes
+            trace_id: Trace ID of a new root span (32 hex characters), random if omitted
+
+        Yields:
+            Span: The open span
+        """
+        parent = current_span_var.get()
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent else (trace_id or secrets.token_hex(16)),
+            span_id=secrets.token_hex(8),
+            parent_span_id=parent.span_id if parent else "",
+            kind=kind,
+            attributes=dict(attributes or {}),
+        )
+        if parent is None and self._file_exporter is not None:
+            self._pending[span.trace_id] = []
+        token = current_span_var.set(span)
+        try:
+            yield span
+            if span.status_code == STATUS_UNSET:
+                span.status_code = STATUS_OK
+        except BaseException as e:
+            # Exception messages may quote URLs, IDs and names of users' data: keep the type only
+            span.set_error(type(e).__name__)
+            raise
+        finally:
+            current_span_var.reset(token)
+            span.end_time_ns = time.time_ns()
+            self._finish(span, is_root=parent is None)
+
+    def _finish(self, span: Span, is_root: bool) -> None:
+        self._finished.append(span)
+        if self._file_exporter is None:
+            return
+        if is_root:
+            self._file_exporter.export(self._pending.pop(span.trace_id, []) + [span])
+        elif span.trace_id in self._pending:
+            self._pending[span.trace_id].append(span)
+        else:
+            # The root already ended, e.g. a background refresh outliving its tool call
+            self._file_exporter.export([span])
+
+    def get_spans(self, trace_id: Optional[str] = None) -> List[Span]:
+        """
+        Get the finished spans in the ring buffer, oldest first.
+
+        Args:
+            trace_id: Only return the spans of this trace
+
+        Returns:
+            List[Span]: The finished spans
+        """
+        return [span for span in self._finished if trace_id is None or span.trace_id == trace_id]
+
+    def clear(self) -> None:
+        """Drop all finished spans from the ring buffer."""
+        self._finished.clear()
+
+
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Tracer:
+    """
+    Get the global tracer instance (singleton pattern).
+
+    Returns:
+        Tracer: The global tracer instance
+    """
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(
+            buffer_size=settings.tracing_buffer_size,
+            export_path=settings.tracing_export_path,
+        )
+    return _tracer
+
+
+@contextmanager
+def start_span(
+    name: str,
+    kind: int = SPAN_KIND_INTERNAL,
+    attributes: Optional[Dict[str, Any]] = None,
+    trace_id: Optional[str] = None,
+) -> Iterator[Optional[Span]]:
+    """
+    Open a span with the global tracer.
+
+    Yields None when tracing is disabled, so callers must not assume a span.
+
+    Args:
+        name: Name of the operation
+        kind: OTLP span kind
+        attributes: Initial attributes
+        trace_id: Trace ID of a new root span (32 hex characters), random if omitted
+    """
+    if not settings.tracing_enabled:
+        yield None
+        return
+    with get_tracer().start_span(name, kind, attributes, trace_id) as span:
+        yield span
+
+
+def scrub_url(url: str) -> str:
+    """
+    Strip a URL of everything that may identify users' data, for span attributes.
+
+    Credentials, query and fragment are dropped and path segments holding
+    identifiers are replaced by ``{id}``, e.g.
+    ``https://host/v2/assets/6f1c...?catalog_id=...`` -> ``https://host/v2/assets/{id}``.
+
+    Args:
+        url: Full request URL
+
+    Returns:
+        str: The scrubbed URL
+    """
+    parts = urlsplit(str(url))
+    path = "/".join("{id}" if _ID_SEGMENT_PATTERN.match(segment) else segment for segment in parts.path.split("/"))
+    netloc = parts.netloc.rsplit("@", 1)[-1]
+    return parts._replace(netloc=netloc, path=path, query="", fragment="").geturl()
+
+
+def trace_id_from_transaction_id(transaction_id: str) -> Optional[str]:
+    """Use a UUID transaction ID as trace ID, or None if it is not a UUID."""
+    trace_id = transaction_id.replace("-", "").lower()
+    if len(trace_id) == 32 and all(c in "0123456789abcdef" for c in trace_id):
+        return trace_id
+    return None
+
+
+def render_traces(trace_id: Optional[str] = None) -> str:
+    """
+    Render the buffered spans as an OTLP/JSON export request.
+
+    Args:
+        trace_id: Only include the spans of this trace
+
+    Returns:
+        str: The JSON encoded export request
+    """
+    spans = get_tracer().get_spans(trace_id) if settings.tracing_enabled else []
+    return json.dumps(spans_to_otlp(spans), separators=(",", ":"))
@@ -9,6 +9,7 @@
 """WXDI MCP Server"""
 
 import argparse
+import hmac
 import importlib
 import pkgutil
 import sys
@@ -17,11 +18,15 @@ from pathlib import Path
 from typing import Any
 
 from fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import Response
 
 import app.services
 from app.core.registry import prompt_registry, service_registry
 from app.core.settings import settings
 from app.core.middleware import ValidationErrorHandlingMiddleware
+from app.core.metrics import METRICS_CONTENT_TYPE, render_metrics
+from app.core.tracing import render_traces
 
 # Ensure the project root is in the Python path for module resolution
 project_root = Path(__file__).parent.parent
@@ -51,43 +56,71 @@ def _import_modules_from_path(module_path: Path, package_prefix: str, module_typ
             print(f"Warning: Could not import {module_type} module '{module_name}': {e}", file=sys.stderr)
 
 
-def _load_tools_and_prompts(service_path: Path, service_name: str):
+def _load_tools_and_prompts(service_path: Path, service_name: str, include_tools: bool = True):
     """Load tools and prompts from a service directory.
     
     Args:
         service_path: Path to the service directory
         service_name: Fully qualified service name (e.g., "app.services.search")
+        include_tools: Whether to import tool modules (False when tools are loaded lazily)
     """
     # Discover and import tools
-    tools_path = service_path / "tools"
-    _import_modules_from_path(tools_path, f"{service_name}.tools", "tool")
+    if include_tools:
+        tools_path = service_path / "tools"
+        _import_modules_from_path(tools_path, f"{service_name}.tools", "tool")
     
     # Discover and import prompts
     prompts_path = service_path / "prompts"
     _import_modules_from_path(prompts_path, f"{service_name}.prompts", "prompt")
 
 
-def discover_and_import_services(package):
-    """Dynamically imports all tool and prompt modules to trigger registration decorators."""
-    for _, service_name, _ in pkgutil.iter_modules(package.__path__, package.__name__ + "."):
+def _get_service_path(parent_path: Path, service_name: str, include_tools: bool) -> Path:
+    """Get the directory of a service, importing the service package only when tools are imported too."""
+    if include_tools:
         service_module = importlib.import_module(service_name)
-        service_path = Path(service_module.__file__).parent
+        return Path(service_module.__file__).parent
+    return parent_path / service_name.rsplit(".", 1)[-1]
+
+
+def discover_and_import_services(package, include_tools: bool = True):
+    """Dynamically imports all tool and prompt modules to trigger registration decorators.
+
+    Args:
+        package: The services package to discover
+        include_tools: Whether to import tool modules; when False only prompt modules are imported
+    """
+    package_path = Path(package.__path__[0])
+    for _, service_name, _ in pkgutil.iter_modules(package.__path__, package.__name__ + "."):
+        service_path = _get_service_path(package_path, service_name, include_tools)
         
         # Special handling for 'internal' directory - recursively discover nested services
         if service_name.endswith('.internal'):
             for _, nested_service_name, _ in pkgutil.iter_modules([str(service_path)], f"{service_name}."):
-                nested_service_module = importlib.import_module(nested_service_name)
-                nested_service_path = Path(nested_service_module.__file__).parent
-                _load_tools_and_prompts(nested_service_path, nested_service_name)
+                nested_service_path = _get_service_path(service_path, nested_service_name, include_tools)
+                _load_tools_and_prompts(nested_service_path, nested_service_name, include_tools)
         else:
             # Regular service discovery
-            _load_tools_and_prompts(service_path, service_name)
+            _load_tools_and_prompts(service_path, service_name, include_tools)
+
 
+def load_services(lazy: bool | None = None) -> tuple[list | None, bool]:
+    """Discovers and imports the service modules that register tools and prompts.
+
+    Args:
+        lazy: List tools from the prebuilt tool index instead of importing the tool modules.
+              Defaults to settings.lazy_tool_loading.
+
+    Returns:
+        tuple: The lazily loaded tools (None when tool modules were imported) and whether
+               the system prompts were loaded
+    """
+    lazy_tools = None
+    if settings.lazy_tool_loading if lazy is None else lazy:
+        from app.core.tool_index import load_tool_index
+        lazy_tools = load_tool_index()
 
-def create_server() -> FastMCP:
-    """Creates and configures the MCP server."""
     print("Discovering services...", file=sys.stderr)
-    discover_and_import_services(app.services)
+    discover_and_import_services(app.services, include_tools=lazy_tools is None)
     
     # Import system-level prompts (not in service subdirectories)
     system_prompts_loaded = False
@@ -97,13 +130,27 @@ def create_server() -> FastMCP:
     except ImportError as e:
         print(f"Warning: Could not import system prompts: {e}", file=sys.stderr)
 
+    return lazy_tools, system_prompts_loaded
+
+
+def build_server(lazy_tools: list | None, system_prompts_loaded: bool) -> FastMCP:
+    """Creates the MCP server and registers the discovered tools and prompts.
+
+    Args:
+        lazy_tools: Tools listed from the tool index, or None to register the imported tools
+        system_prompts_loaded: Whether the system prompts were loaded
+    """
     mcp = FastMCP("WXDI MCP Server", version="1.0.0")
 
     # Add middleware for enhanced error messages
     mcp.add_middleware(ValidationErrorHandlingMiddleware())
 
     # Register tools first to get the actual count
-    service_registry.register_all(mcp)
+    if lazy_tools is None:
+        service_registry.register_all(mcp)
+    else:
+        service_registry.register_lazy(mcp, lazy_tools)
+        print("ℹ Tools are listed from the tool index and loaded on first call.", file=sys.stderr)
     actual_registered_count = service_registry.get_registered_count()
 
     print(f"Registering {actual_registered_count} discovered tools...", file=sys.stderr)
@@ -122,6 +169,65 @@ def create_server() -> FastMCP:
     return mcp
 
 
+def create_server(lazy: bool | None = None) -> FastMCP:
+    """Creates and configures the MCP server.
+
+    Args:
+        lazy: List tools from the prebuilt tool index and import each tool module on its
+              first call. Defaults to settings.lazy_tool_loading. Falls back to importing
+              all tool modules if the index is missing or out of date.
+    """
+    lazy_tools, system_prompts_loaded = load_services(lazy)
+    return build_server(lazy_tools, system_prompts_loaded)
+
+
+def _is_diagnostics_request_authorized(request: Request) -> bool:
+    """Check the bearer token of a request to a diagnostics route against DIAGNOSTICS_AUTH_TOKEN.
+
+    Args:
+        request: The incoming request
+
+    Returns:
+        bool: True if no token is configured or the request carries it
+    """
+    if not settings.diagnostics_auth_token:
+        return True
+    authorization = request.headers.get("authorization", "")
+    token = authorization.removeprefix("Bearer ").removeprefix("bearer ")
+    return hmac.compare_digest(token.encode("utf-8"), settings.diagnostics_auth_token.encode("utf-8"))
+
+
+def add_metrics_route(mcp: FastMCP) -> None:
+    """Serves the in-process metrics in the Prometheus text format on /metrics.
+
+    Requests must carry DIAGNOSTICS_AUTH_TOKEN as bearer token when it is set.
+
+    Args:
+        mcp: The server, which must run with the streamable-HTTP transport
+    """
+    @mcp.custom_route("/metrics", methods=["GET"], include_in_schema=False)
+    async def metrics(request: Request) -> Response:
+        if not _is_diagnostics_request_authorized(request):
+            return Response("Unauthorized", status_code=401, headers={"WWW-Authenticate": "Bearer"})
+        return Response(render_metrics(), media_type=METRICS_CONTENT_TYPE)
+
+
+def add_traces_route(mcp: FastMCP) -> None:
+    """Serves the most recent spans as an OTLP/JSON export request on /traces.
+
+    Spans of a single call can be selected with ?trace_id=<transaction_id without dashes>.
+    Requests must carry DIAGNOSTICS_AUTH_TOKEN as bearer token when it is set.
+
+    Args:
+        mcp: The server, which must run with the streamable-HTTP transport
+    """
+    @mcp.custom_route("/traces", methods=["GET"], include_in_schema=False)
+    async def traces(request: Request) -> Response:
+        if not _is_diagnostics_request_authorized(request):
+            return Response("Unauthorized", status_code=401, headers={"WWW-Authenticate": "Bearer"})
+        return Response(render_traces(request.query_params.get("trace_id")), media_type="application/json")
+
+
 def apply_cli_settings_overrides(args):
     """Apply command line argument overrides to settings and print notifications.
 
@@ -184,6 +290,18 @@ def main():
                 "backlog": settings.server_backlog,
             }
             kwargs["uvicorn_config"] = uvicorn_config
+
+            if settings.metrics_enabled and settings.metrics_route_enabled:
+                add_metrics_route(mcp)
+                print("   Metrics: /metrics", file=sys.stderr)
+                if not settings.diagnostics_auth_token:
+                    print("⚠️ WARNING: /metrics is served without authentication, set DIAGNOSTICS_AUTH_TOKEN.", file=sys.stderr)
+
+            if settings.tracing_enabled and settings.tracing_route_enabled:
+                add_traces_route(mcp)
+                print("   Traces: /traces", file=sys.stderr)
+                if not settings.diagnostics_auth_token:
+                    print("⚠️ WARNING: /traces is served without authentication, set DIAGNOSTICS_AUTH_TOKEN.", file=sys.stderr)
             
             print(
                 f"   Server concurrency settings: "
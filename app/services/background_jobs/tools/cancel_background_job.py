@@ -0,0 +1,45 @@
+# Copyright [2026] [IBM]
+# Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+# See the LICENSE file in the project root for license information.
+
+"""Tool for cancelling a background job started by a long-running tool."""
+
+from typing import Annotated
+
+from pydantic import Field
+
+from app.core.registry import service_registry
+from app.services.background_jobs.tools.get_background_job_status import find_background_job
+from app.shared.logging import LOGGER, auto_context
+from app.shared.models.background_job import BackgroundJobInfo
+from app.shared.utils.job_registry import get_job_registry
+
+
+async def _cancel_background_job(job_id: str) -> BackgroundJobInfo:
+    registry = get_job_registry()
+    job = await find_background_job(job_id)
+    if await registry.cancel(job):
+        LOGGER.info(f"Cancelled background job {job_id} ({job.tool})")
+    else:
+        LOGGER.info(f"Background job {job_id} already finished with status {job.status.value}")
+    return job.to_info(registry.result_ttl_s)
+
+
+@service_registry.tool(
+    name="cancel_background_job",
+    description="""Use this tool to cancel a running background job started by a long-running tool called with run_in_background=true.
+
+    The job stops at its next step. Work it already sent to the platform (for example an import
+    that was already accepted) is not rolled back. Returns the status of the job after cancellation;
+    a job that already finished keeps its status and result.""",
+    annotations={
+        "title": "Cancel Background Job",
+        "destructiveHint": True,
+    },
+)
+@auto_context
+async def cancel_background_job(
+    job_id: Annotated[str, Field(description="ID of the background job, returned by the tool that started it.")],
+) -> BackgroundJobInfo:
+    """Wrapper for cancel_background_job."""
+    return await _cancel_background_job(job_id)
@@ -0,0 +1,107 @@
+# Copyright [2026] [IBM]
+# Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+# See the LICENSE file in the project root for license information.
+
+"""Tool for following a background job started by a long-running tool."""
+
+from typing import Annotated, Optional
+
+from fastmcp import Context
+from pydantic import Field
+
+from app.core.deadline import get_remaining_time
+from app.core.registry import service_registry
+from app.shared.exceptions.base import ServiceError
+from app.shared.logging import LOGGER, auto_context
+from app.shared.models.background_job import BackgroundJobInfo
+from app.shared.utils.job_registry import BackgroundJob, get_job_owner, get_job_registry
+
+# Time kept to build the response when waiting until the end of the tool call's time budget
+RESPONSE_MARGIN_S = 5.0
+
+
+async def find_background_job(job_id: str) -> BackgroundJob:
+    """
+    Find a background job of the current caller.
+
+    Args:
+        job_id: ID of the job
+
+    Returns:
+        BackgroundJob: The job
+
+    Raises:
+        ServiceError: If the caller has no job with this ID
+    """
+    job = get_job_registry().get(job_id, await get_job_owner())
+    if job is None:
+        raise ServiceError(
+            f"No background job found with ID '{job_id}'.",
+            remediation_steps=(
+                "Jobs can only be followed with the API key or access token that started them. Finished jobs "
+                "are discarded after a while, and all jobs when the server restarts. "
+                "Run the tool again if its result is still needed."
+            ),
+        )
+    return job
+
+
+async def _get_background_job_status(
+    job_id: str,
+    wait_seconds: int,
+    ctx: Optional[Context] = None,
+) -> BackgroundJobInfo:
+    registry = get_job_registry()
+    job = await find_background_job(job_id)
+
+    timeout_s = float(wait_seconds)
+    remaining = get_remaining_time()
+    if remaining is not None:
+        timeout_s = min(timeout_s, remaining - RESPONSE_MARGIN_S)
+    if timeout_s > 0 and not job.is_finished:
+        LOGGER.info(f"Waiting up to {timeout_s:.0f}s for background job {job_id}")
+
+        async def forward_progress(updated: BackgroundJob) -> None:
+            if ctx is None or updated.progress is None:
+                return
+            try:
+                await ctx.report_progress(updated.progress, updated.total, updated.progress_message)
+            except Exception as e:
+                LOGGER.debug(f"Failed to send progress notification: {e}")
+
+        await registry.wait(job, timeout_s, on_update=forward_progress)
+
+    return job.to_info(registry.result_ttl_s)
+
+
+@service_registry.tool(
+    name="get_background_job_status",
+    description="""Use this tool to follow a background job started by a long-running tool called with run_in_background=true.
+
+    Returns the status of the job (running, succeeded, failed or cancelled), its latest progress and,
+    once it succeeded, the result the tool would have returned. Set wait_seconds to wait for the job
+    to finish, with progress notifications, instead of calling this tool repeatedly.
+    Finished jobs are kept for a limited time only (see expires_at).""",
+    annotations={
+        "title": "Get Background Job Status",
+        "readOnlyHint": True,
+    },
+)
+@auto_context
+async def get_background_job_status(
+    job_id: Annotated[str, Field(description="ID of the background job, returned by the tool that started it.")],
+    wait_seconds: Annotated[int, Field(description="Seconds to wait for the job to finish before returning its status; 0 returns right away.", ge=0)] = 0,
+    ctx: Optional[Context] = None,
+) -> BackgroundJobInfo:
+    """
+    Wrapper for get_background_job_status.
+
+    Args:
+        job_id: ID of the background job
+        wait_seconds: Seconds to wait for the job to finish
+        ctx: Optional MCP context, used to send progress notifications while waiting
+
+    Returns:
+        BackgroundJobInfo with the status, progress and result of the job
+    """
+    return await _get_background_job_status(job_id, wait_seconds, ctx=ctx)
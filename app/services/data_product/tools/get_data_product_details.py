@@ -406,7 +406,8 @@ async def _build_subscribed_assets_from_api(
         data_asset_response = await tool_helper_service.execute_get_request(
             url=data_asset_url,
             params=params,
-            tool_name="get_data_product_details"
+            tool_name="get_data_product_details",
+            hedge=True,
         )
         
         # Extract the asset name from the API response
@@ -588,7 +589,8 @@ async def _process_part_asset(part: Dict[str, Any], params: Dict[str, str]) -> D
     data_asset_response = await tool_helper_service.execute_get_request(
         url=data_asset_url,
         params=params,
-        tool_name="get_data_product_details"
+        tool_name="get_data_product_details",
+        hedge=True,
     )
 
     # Extract the asset name and description from metadata
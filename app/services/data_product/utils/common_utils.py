@@ -18,7 +18,7 @@ from aiocache import cached
 async def get_dph_catalog_id_for_user() -> str:
     LOGGER.info("In get_dph_catalog_id_for_user, getting DPH catalog id")
     response = await tool_helper_service.execute_get_request(
-        url=f"{tool_helper_service.base_url}/v2/catalogs/ibm-default-hub"
+        url=f"{tool_helper_service.base_url}/v2/catalogs/ibm-default-hub",
     )
     return response.get("metadata", {}).get("guid", "")
 
@@ -2,9 +2,9 @@
 # Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
 # See the LICENSE file in the project root for license information.
 
-import asyncio
 from typing import Any
 from app.shared.logging import LOGGER, auto_context
+from app.shared.utils.async_waiter import wait_for
 from app.shared.utils.tool_helper_service import tool_helper_service
 from app.services.data_product.utils.common_utils import get_dph_catalog_id_for_user
 from app.shared.exceptions.base import ServiceError
@@ -423,53 +423,43 @@ async def check_for_duplicate_data_product_with_asset(
         f"AND (ibm_data_product_version.state:available OR ibm_data_product_version.state:draft)"
     )
     
-    # Retry logic with exponential backoff to handle search index propagation delays
-    for attempt in range(max_retries):
+    async def search_data_product_versions() -> Any:
         try:
-            response = await tool_helper_service.execute_post_request(
+            return await tool_helper_service.execute_post_request(
                 url=f"{tool_helper_service.base_url}/v2/asset_types/ibm_data_product_version/search",
                 params={"catalog_id": dph_catalog_id},
                 json={"query": query},
                 tool_name="check_for_duplicate_data_product_with_asset"
             )
-            
-            # Check if any results found
-            results_size = _get_asset_type_search_results_count(response)
-            
-            if results_size > 0:
-                # Duplicate found!
-                results = _get_asset_type_search_results(response)
-                result = results[0]
-                duplicate_info = _extract_duplicate_info_from_asset_type_search_result(result)
-                
-                LOGGER.info(
-                    f"Found existing data product '{duplicate_info['name']}' "
-                    f"(ID: {duplicate_info['data_product_id']}, State: {duplicate_info['state']}) "
-                    f"with asset {asset_id} on attempt {attempt + 1}"
-                )
-                return duplicate_info
-            
-            # If no results found and we have retries left, wait and try again
-            if attempt < max_retries - 1:
-                delay = initial_delay * (2 ** attempt)
-                LOGGER.info(
-                    f"No duplicate found on attempt {attempt + 1}/{max_retries}. "
-                    f"Waiting {delay}s for search index to update..."
-                )
-                await asyncio.sleep(delay)
-            else:
-                LOGGER.info(f"No existing data product found with asset {asset_id} after {max_retries} attempts")
-                return None
-                
         except Exception as e:
-            LOGGER.error(f"Error checking for duplicates on attempt {attempt + 1}: {str(e)}")
-            if attempt == max_retries - 1:
-                raise
-            delay = initial_delay * (2 ** attempt)
-            LOGGER.info(f"Retrying in {delay}s...")
-            await asyncio.sleep(delay)
-    
-    return None
+            LOGGER.error(f"Error checking for duplicates: {str(e)}")
+            raise
+
+    # Retry with exponential backoff to handle search index propagation delays
+    state = await wait_for(
+        search_data_product_versions,
+        lambda response: _get_asset_type_search_results_count(response) > 0,
+        key=("data_product_duplicate_search", dph_catalog_id, asset_id),
+        label="check_for_duplicate_data_product_with_asset",
+        initial_delay_s=initial_delay,
+        max_delay_s=initial_delay * 2 ** max(max_retries - 2, 0),
+        retry_errors=True,
+        max_attempts=max_retries,
+    )
+    if not state.done:
+        LOGGER.info(f"No existing data product found with asset {asset_id} after {state.attempts} attempts")
+        return None
+
+    # Duplicate found!
+    results = _get_asset_type_search_results(state.value)
+    duplicate_info = _extract_duplicate_info_from_asset_type_search_result(results[0])
+
+    LOGGER.info(
+        f"Found existing data product '{duplicate_info['name']}' "
+        f"(ID: {duplicate_info['data_product_id']}, State: {duplicate_info['state']}) "
+        f"with asset {asset_id} on attempt {state.attempts}"
+    )
+    return duplicate_info
 
 
 def _get_data_asset_items(dp) -> list:
@@ -81,7 +81,8 @@ IMPORT_COMPLETION_STATUSES = [
 GLOSSARY_IMPORT_STATUS_ENDPOINT = "/v3/governance_artifact_types/import/status"
 
 DEFAULT_POLL_MAX_WAIT_SECONDS = 45
-DEFAULT_POLL_INTERVAL_SECONDS = 2.0
+# Longest delay between import status polls; the first polls follow each other faster
+DEFAULT_POLL_INTERVAL_SECONDS = 5.0
 # Max wait time for newly imported categories to become searchable before importing terms
 CATEGORY_PROPAGATION_DELAY_SECONDS = 30.0
 
@@ -4,6 +4,7 @@
 
 """Tool for importing glossary artifacts from CSV files."""
 
+from functools import partial
 from typing import Annotated, Optional
 from pydantic import Field
 from fastmcp import Context
@@ -17,6 +18,8 @@ from app.services.glossary.models.csv_import import (
 from app.services.glossary.utils.csv_validation import validate_csv_content
 from app.services.glossary.utils.csv_import import import_csv_content
 from app.shared.logging import LOGGER, auto_context
+from app.shared.models.background_job import BackgroundJobHandle
+from app.shared.utils.job_registry import submit_background_job
 
 
 async def _glossary_csv_import(
@@ -162,6 +165,9 @@ Set validate_only=true to check CSV format without importing. Returns detailed e
 **Import Mode:**
 Set validate_only=false to import artifacts. Creates categories first, then terms, establishing all relationships.
 
+**Background Mode:**
+Set run_in_background=true for large imports. The tool then returns a job_id right away instead of the import result; call get_background_job_status with it to follow the import and get its result. Validation (validate_only=true) always runs directly.
+
 **Error Handling:**
 Returns structured errors with:
 - Row number (1-based, excluding header)
@@ -184,8 +190,9 @@ async def import_glossary_from_csv(
                                        - 'all': Imported values will replace all existing values in catalog (default) 
                                        - 'specified': Only non-empty imported values replace existing values 
                                        - 'empty': Imported values replace only empty values in catalog""")] = "all",
+    run_in_background: Annotated[bool, Field(description="If true, run the import as a background job and return its job_id right away. Follow it with get_background_job_status.")] = False,
     ctx: Optional[Context] = None,
-) -> CSVImportResult:
+) -> CSVImportResult | BackgroundJobHandle:
     """ 
     Wrapper for import_glossary_from_csv.
 
@@ -193,14 +200,17 @@ async def import_glossary_from_csv(
         csv_content: CSV content as string
         validate_only: If true, only validate without importing
         merge_option: Import merge option (all, specified, empty)
+        run_in_background: If true, import in a background job and return its handle
         ctx: Optional MCP context
         
     Returns:
-        CSVImportResult with import/validation results
+        CSVImportResult with import/validation results, or BackgroundJobHandle of the background import
     """
     request = CSVImportRequest(
         csv_content=csv_content,
         validate_only=validate_only,
         merge_option=merge_option
     )
-    return await _glossary_csv_import(request, ctx=ctx)
\ No newline at end of file
+    if run_in_background and not validate_only:
+        return await submit_background_job("import_glossary_from_csv", partial(_glossary_csv_import, request))
+    return await _glossary_csv_import(request, ctx=ctx)
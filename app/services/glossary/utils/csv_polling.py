@@ -4,7 +4,6 @@
 
 """CSV import polling utilities for glossary import."""
 
-import asyncio
 from typing import Dict, Any
 
 from app.core.settings import settings
@@ -16,6 +15,7 @@ from app.services.glossary.constants import (
 )
 from app.shared.exceptions.base import ServiceError
 from app.shared.logging import LOGGER
+from app.shared.utils.async_waiter import describe_status, report_progress_to_client, wait_for
 from app.shared.utils.tool_helper_service import tool_helper_service
 
 
@@ -26,56 +26,63 @@ async def poll_import_status(
 ) -> Dict[str, Any]:
     """
     Poll the import status endpoint until completion or timeout.
-    
+
+    The status is checked right away, then with growing delays between polls.
+    Concurrent calls waiting for the same process share the polls.
+
     Args:
         process_id: The process ID returned from the import API
-        max_wait_seconds: Maximum time to wait in seconds (default: 120)
-        poll_interval: Time between polls in seconds (default: 2.0)
-        
+        max_wait_seconds: Maximum time to wait in seconds (default: 45)
+        poll_interval: Longest time between polls in seconds (default: 5.0)
+
     Returns:
         Final status response from the API
-        
+
     Raises:
         ServiceError: If polling fails or times out
     """
     # Build the status URL
     url = f"{settings.di_service_url}{GLOSSARY_IMPORT_STATUS_ENDPOINT}/{process_id}"
-    
-    start_time = asyncio.get_event_loop().time()
-    elapsed = 0
-    
+
     LOGGER.info(f"Starting to poll import status for process_id={process_id}")
-    
-    while elapsed < max_wait_seconds:
+
+    async def get_status() -> Dict[str, Any]:
         try:
-            # Poll the status endpoint
             response = await tool_helper_service.execute_get_request(
                 url=url,
                 tool_name="glossary_csv_import_polling"
             )
-            
+
             # Type assertion: glossary import status endpoint returns JSON
             if not isinstance(response, dict):
                 raise ServiceError(f"Unexpected response type from import status endpoint: {type(response)}")
-            
-            status = response.get('status', 'UNKNOWN')
-            LOGGER.info(f"Import status poll: process_id={process_id}, status={status}, elapsed={elapsed:.1f}s")
-            
-            # Check if import is complete
-            if status in IMPORT_COMPLETION_STATUSES:
-                LOGGER.info(f"Import process completed with status: {status}")
-                return response
-            
-            await asyncio.sleep(poll_interval)
-            elapsed = asyncio.get_event_loop().time() - start_time
-            
         except Exception as e:
             LOGGER.error(f"Error polling import status: {str(e)}")
-            # Continue polling unless we've exceeded max wait time
-            if elapsed >= max_wait_seconds:
-                raise ServiceError(f"Import status polling failed: {str(e)}")
-            await asyncio.sleep(poll_interval)
-            elapsed = asyncio.get_event_loop().time() - start_time
-    
+            raise
+
+        LOGGER.info(f"Import status poll: process_id={process_id}, status={response.get('status', 'UNKNOWN')}")
+        return response
+
+    state = await wait_for(
+        get_status,
+        lambda response: response.get('status', 'UNKNOWN') in IMPORT_COMPLETION_STATUSES,
+        timeout_s=max_wait_seconds,
+        key=("glossary_import", process_id),
+        label="glossary_csv_import_polling",
+        max_delay_s=poll_interval,
+        # Continue polling on errors until the max wait time is exceeded
+        retry_errors=True,
+        on_poll=report_progress_to_client(
+            lambda poll: describe_status(poll, lambda response: response.get('status', 'UNKNOWN')),
+            total=max_wait_seconds,
+        ),
+    )
+    if state.done:
+        LOGGER.info(f"Import process completed with status: {state.value.get('status')}")
+        return state.value
+
+    if state.error is not None:
+        raise ServiceError(f"Import status polling failed: {str(state.error)}")
+
     # Timeout reached
-    raise ServiceError(f"Import process timed out after {max_wait_seconds} seconds. Process ID: {process_id}")
\ No newline at end of file
+    raise ServiceError(f"Import process timed out after {max_wait_seconds} seconds. Process ID: {process_id}")
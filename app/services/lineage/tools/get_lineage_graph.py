@@ -33,6 +33,18 @@ from app.shared.ui_message.ui_agentic_utils import (
     CardComponent,
 )
 
+# Fields of the query_lineage response read by this tool; large graphs carry many more per asset
+QUERY_LINEAGE_RESPONSE_FIELDS = [
+    "assets_in_view.id",
+    "assets_in_view.name",
+    "assets_in_view.type",
+    "assets_in_view.tags",
+    "assets_in_view.hierarchical_path",
+    "edges_in_view.source",
+    "edges_in_view.target",
+    "edges_in_view.type",
+]
+
 
 class StreamDirection(Enum):
     """Enum for lineage asset directions."""
@@ -267,6 +279,7 @@ async def _call_get_lineage_graph(
             + LINEAGE_BASE_ENDPOINT
             + "/query_lineage",
             json=payload,
+            fields=QUERY_LINEAGE_RESPONSE_FIELDS,
         )
         return response
     except ExternalAPIError as e:
@@ -27,6 +27,7 @@ from app.shared.exceptions.base import ExternalAPIError, ServiceError, Validatio
 from app.shared.logging import LOGGER, auto_context
 from app.shared.utils.tool_helper_service import tool_helper_service
 from app.shared.utils.helpers import verify_dates
+from app.shared.utils.fuzzy_matcher import FuzzyMatcher
 from app.shared.ui_message.ui_message_context import ui_message_context
 
 
@@ -321,19 +322,12 @@ async def _get_lineage_technology_type(technology_type: str, filters_not_found:
     closest_technology_str = closest_technology.content if not isinstance(closest_technology, str) else closest_technology
     """
 
-    closest_technology = get_close_matches(
-        word=technology_type.lower(),
-        possibilities=[
-            tech_type.get("name", "").lower() for tech_type in technology_types
-        ],
-        n=1,
-        cutoff=0.8,
-    )
+    closest_technology = FuzzyMatcher(
+        [{"name": tech_type.get("name", "")} for tech_type in technology_types]
+    ).closest(technology_type, cutoff=0.8)
 
     if closest_technology:
-        for words in technology_types:
-            if str(words.get("name")).lower() == closest_technology[0].lower():
-                return words.get("name")
+        return closest_technology["name"]
     else:
         filters_not_found.append("technology_name")
     return ""
@@ -370,21 +364,11 @@ async def _get_lineage_asset_type(asset_type: str, filters_not_found: Optional[L
         raise ServiceError("Couldn't find any asset types to filter by",
         remediation_steps="Pick another asset type or do not pass this value")
 
-    closest_name = get_close_matches(
-        word=asset_type.lower(),
-        possibilities=[name.lower() for name in asset_types],
-        n=1,
-        cutoff=0.8,
-    )
+    closest_name = FuzzyMatcher(
+        [{"name": asset_type_name} for asset_type_name in asset_types]
+    ).closest(asset_type, cutoff=0.8)
     if closest_name:
-        for asset_type_name in asset_types:
-            if str(asset_type_name).lower() == closest_name[0].lower():
-                return asset_type_name
-        # If we found a close match but couldn't find it in asset_types (shouldn't happen, but just in case)
-        raise ServiceError(
-            f"Found a close match for '{asset_type}' but couldn't retrieve the asset type details",
-            remediation_steps="Try to call this tool again"
-        )
+        return closest_name["name"]
     else:
         if filters_not_found is not None:
             filters_not_found.append("asset_type")
@@ -34,7 +34,9 @@ from app.services.tool_utils import (
     find_project_id,
 )
 from app.shared.logging import LOGGER, auto_context
+from app.shared.models.background_job import BackgroundJobHandle
 from app.shared.utils.helpers import confirm_uuid
+from app.shared.utils.job_registry import submit_background_job
 
 
 async def _execute_term_generation(
@@ -132,17 +134,23 @@ async def _execute_term_generation(
     - Gets a count of how many draft terms are currently in the workflow, prior to running term generation
     - Executes term generation in batches on the data assets, if there are any failures these are reported back to the user
     - Gets a count of how many draft terms are now in the workflow, after running term generation
-    - Returns: TermGenerationResult with the count of term generated, the failed term generation attempts and URLs to the UI. Provide the response in a user friendly format such as a table""",
+    - Returns: TermGenerationResult with the count of term generated, the failed term generation attempts and URLs to the UI. Provide the response in a user friendly format such as a table
+
+    Term generation on a large MDE can take many minutes. With run_in_background=true (only used when metadata_enrichment_name is provided)
+    the tool returns a BackgroundJobHandle with a job_id right away; call get_background_job_status with it to follow the progress and get the TermGenerationResult.""",
 )
 @auto_context
 async def execute_term_generation(
     project_name: Annotated[str, Field(description="The name of the project you want to execute a metadata enrichment.")],
     metadata_enrichment_name: Annotated[Optional[str], Field(description="The name of the metadata enrichment asset to run on.")] = None,
-) -> TermGenerationResult | MetadataEnrichmentResult:
+    run_in_background: Annotated[bool, Field(description="If true, run term generation as a background job and return its job_id right away. Follow it with get_background_job_status.")] = False,
+) -> TermGenerationResult | MetadataEnrichmentResult | BackgroundJobHandle:
     """Wrapper that expands TermGenerationRequest into individual parameters."""
 
     request = TermGenerationRequest(
         project_name=project_name,
         metadata_enrichment_name=metadata_enrichment_name,
     )
+    if run_in_background and metadata_enrichment_name is not None:
+        return await submit_background_job("execute_term_generation", partial(_execute_term_generation, request))
     return await _execute_term_generation(request)
\ No newline at end of file
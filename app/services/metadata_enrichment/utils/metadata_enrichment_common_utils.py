@@ -2,10 +2,9 @@
 # Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
 # See the LICENSE file in the project root for license information.
 
-import asyncio
 from functools import partial
 from string import Template
-from typing import Final, Optional, Dict, Any, Callable
+from typing import Final, Optional, Dict, Any, Awaitable, Callable
 
 from pydantic import TypeAdapter
 from tenacity import RetryError
@@ -55,7 +54,11 @@ from app.services.tool_utils import (
 )
 from app.shared.exceptions.base import ExternalAPIError, ServiceError, ValidationError
 from app.shared.logging.utils import LOGGER
+from app.shared.utils.async_waiter import describe_status, report_progress_to_client, wait_for
+from app.shared.utils.batch_executor import AdaptiveBatchExecutor, BatchOutcome
 from app.shared.utils.helpers import append_context_to_url, confirm_uuid
+from app.shared.utils.job_registry import report_job_progress
+from app.shared.utils.pagination import fetch_bookmark_pages, fetch_offset_pages
 from app.shared.utils.tool_helper_service import tool_helper_service
 
 UI_BASE_URL = str(tool_helper_service.ui_base_url)
@@ -64,7 +67,7 @@ BASE_URL = str(tool_helper_service.base_url)
 TOOL_NAME: Final = "metadata_enrichment_tool"
 DEFAULT_MDE_NAME = "Metadata_Enrichment_for_MCP_Agent"
 ARTIFACT_TYPE_MDE = "metadata_enrichment_area"
-CHECK_MDE_OPERATION_INTERVAL = 5  # sec
+CHECK_MDE_OPERATION_INTERVAL = 5  # sec, longest delay between checks
 CHECK_MDE_OPERATION_MAX_TRIAL = 5
 
 METADATA_ENRICHMENT_SERVICE_URL = BASE_URL + METADATA_ENRICHMENT_BASE_ENDPOINT
@@ -98,7 +101,11 @@ TASK_INBOX_UI_URL_TEMPLATE = (
 METADATA_ENRICHMENT_AREA_INFO = "metadata_enrichment_area_info"
 AREA_ID = "area_id"
 BATCH_SIZE_MDE = 20
-BATCH_SIZE_TERM_GEN = 1
+BULK_FETCH_MAX_CONCURRENT_BATCHES = 4
+BATCH_SIZE_TERM_GEN = 1  # Initial term generation batch size, adapted to latency and failures
+TERM_GEN_MAX_BATCH_SIZE = 10
+TERM_GEN_MAX_CONCURRENT_BATCHES = 4
+TERM_GEN_TARGET_BATCH_LATENCY_S = 60  # sec
 GET_WORKFLOWS_FROM_CORRELATION_ID_URL = BASE_URL + WORKFLOW_BASE_ENDPOINT + "/all/query"
 GET_TERMS_IN_WORKFLOW_URL = BASE_URL + WORKFLOW_BASE_ENDPOINT
 
@@ -668,15 +675,25 @@ async def confirm_ready_data_scope_operation(
         check_max_trial: int = CHECK_MDE_OPERATION_MAX_TRIAL,
         check_interval: int = CHECK_MDE_OPERATION_INTERVAL,
 ):
-    for _ in range(check_max_trial):
-        await asyncio.sleep(check_interval)
-        result_operation = await call_retrieve_data_scope_operation(
-            project_id, operation_id
-        )
-        if result_operation.status == OperationStatusEnum.SUCCEEDED:
-            return
+    # Checked right away, then with growing delays of at most check_interval,
+    # for as long as check_max_trial fixed intervals would have taken
+    state = await wait_for(
+        lambda: call_retrieve_data_scope_operation(project_id, operation_id),
+        lambda operation: operation.status == OperationStatusEnum.SUCCEEDED,
+        timeout_s=check_max_trial * check_interval,
+        key=("mde_data_scope_operation", project_id, operation_id),
+        label="mde_data_scope_operation",
+        max_delay_s=check_interval,
+        on_poll=report_progress_to_client(
+            lambda poll: describe_status(poll, lambda operation: operation.status),
+            total=check_max_trial * check_interval,
+        ),
+    )
+    if state.done:
+        return
+    last_status = state.value.status if state.value is not None else None
     raise ServiceError(
-        f"The metadata enrichment asset data scope background operation: {operation_id} did not finish. The last status: {result_operation.status}"
+        f"The metadata enrichment asset data scope background operation: {operation_id} did not finish. The last status: {last_status}"
     )
 
 
@@ -1061,6 +1078,8 @@ async def _paginated_post_request(
 ) -> list:
     """
     Helper method for paginated POST requests.
+    Offset pages are fetched concurrently once the first page reports the total count;
+    with bookmarks, the next page is requested while the current one is processed.
     
     Args:
         url: The API endpoint URL
@@ -1073,38 +1092,29 @@ async def _paginated_post_request(
     Returns:
         List of all collected results across all pages
     """
-    all_results = []
-    response = None
-    offset = 0
-
-    while response is None or response.get("next") is not None:
-        # Pagination through offset/limit or bookmark
-        if use_offset:
-            query_params["limit"] = limit
-            query_params["offset"] = offset
-        elif response is not None and response.get("next") is not None:
-            payload["bookmark"] = response["next"]["bookmark"]
+    if use_offset:
+        async def fetch_offset_page(offset: int, page_limit: int) -> Dict[str, Any]:
+            page_params = {**query_params, "limit": page_limit, "offset": offset}
+            LOGGER.debug("Executing query with payload: %s and query_params: %s", payload, page_params)
+            return await tool_helper_service.execute_post_request(
+                url=url,
+                json=payload,
+                params=page_params,
+            )
 
-        LOGGER.info(f"Executing query with payload: {payload} and query_params: {query_params}")
+        # Pages after the first one are fetched concurrently when the total count is reported
+        return await fetch_offset_pages(fetch_offset_page, result_extractor, limit)
 
-        response = await tool_helper_service.execute_post_request(
+    async def fetch_bookmark_page(bookmark: Optional[str]) -> Dict[str, Any]:
+        page_payload = {**payload, "bookmark": bookmark} if bookmark else payload
+        LOGGER.debug("Executing query with payload: %s and query_params: %s", page_payload, query_params)
+        return await tool_helper_service.execute_post_request(
             url=url,
-            json=payload,
+            json=page_payload,
             params=query_params,
         )
 
-        LOGGER.info("Successfully executed POST request")
-
-        # Extract and collect results
-        page_results = result_extractor(response)
-        all_results.extend(page_results)
-
-        # Update offset for next iteration if using offset pagination
-        if use_offset and response.get("next") is not None:
-            if limit is not None:
-                offset += limit
-
-    return all_results
+    return await fetch_bookmark_pages(fetch_bookmark_page, result_extractor)
 
 
 def _check_early_termination(
@@ -1204,68 +1214,53 @@ async def _run_term_generation_batch(
     return successes, failures
 
 
+def _create_term_generation_executor(label: str) -> AdaptiveBatchExecutor[str]:
+    """Create the batch executor running term generation batches concurrently."""
+    return AdaptiveBatchExecutor(
+        max_concurrency=TERM_GEN_MAX_CONCURRENT_BATCHES,
+        initial_batch_size=BATCH_SIZE_TERM_GEN,
+        max_batch_size=TERM_GEN_MAX_BATCH_SIZE,
+        target_latency_s=TERM_GEN_TARGET_BATCH_LATENCY_S,
+        label=label,
+    )
+
+
 async def _retry_failed_assets(
-        failed_asset_ids: list[str],
+        failures: dict[str, None],
+        successes: dict[str, None],
         metadata_enrichment_asset_id: str,
         query_params: Dict[str, Any],
-        term_generation_responses: TermGenerationBatchResponse
 ) -> None:
     """
-    Retry failed assets in batches and update the response object.
-    
+    Retry failed assets once in concurrent batches.
+
+    Assets that succeed on retry move from failures to successes.
+
     Args:
-        failed_asset_ids: List of asset IDs that failed in initial processing
+        failures: Asset IDs that failed in initial processing, in processing order
+        successes: Asset IDs that succeeded so far, in processing order
         metadata_enrichment_asset_id: The MDE asset ID
         query_params: Query parameters for the API request
-        term_generation_responses: Response object to update with retry results
     """
-    LOGGER.info(f"Starting retry phase for {len(failed_asset_ids)} failed assets")
-
-    retried_asset_ids = set()
-    retry_index = 0
-    retry_batch_number = 0
-
-    while retry_index < len(failed_asset_ids):
-        retry_batch_end = min(retry_index + BATCH_SIZE_TERM_GEN, len(failed_asset_ids))
-        retry_batch_asset_ids = failed_asset_ids[retry_index:retry_batch_end]
-        retry_batch_number += 1
-
-        # Filter out already retried assets
-        assets_to_retry = [aid for aid in retry_batch_asset_ids if aid not in retried_asset_ids]
+    LOGGER.info(f"Starting retry phase for {len(failures)} failed assets")
 
-        if not assets_to_retry:
-            retry_index = retry_batch_end
-            continue
+    def record_retry(outcome: BatchOutcome[str]) -> None:
+        for asset_id in outcome.succeeded:
+            failures.pop(asset_id, None)
+            successes[asset_id] = None
 
-        LOGGER.info(f"Retry batch {retry_batch_number}: retrying {len(assets_to_retry)} assets")
-
-        # Process retry batch using helper function
-        retry_successes, retry_failures = await _run_term_generation_batch(
-            batch_asset_ids=assets_to_retry,
+    await _create_term_generation_executor("Retry batch").run(
+        list(failures),
+        partial(
+            _run_term_generation_batch,
             metadata_enrichment_asset_id=metadata_enrichment_asset_id,
-            query_params=query_params
-        )
-
-        # Update tracking for retried assets
-        for asset_id in retry_successes:
-            retried_asset_ids.add(asset_id)
-            term_generation_responses.successes.append(AssetProcessingResult(asset_id=asset_id))
-            # Remove from failures list (was added in initial processing)
-            term_generation_responses.failures = [
-                f for f in term_generation_responses.failures if f.asset_id != asset_id
-            ]
-
-        for asset_id in retry_failures:
-            retried_asset_ids.add(asset_id)
-            # Keep in failures list (already added in initial processing)
-
-        LOGGER.info(f"Retry batch {retry_batch_number} completed: {len(retry_successes)} successes, {len(retry_failures)} final failures")
-
-        # Move to next retry batch
-        retry_index = retry_batch_end
+            query_params=query_params,
+        ),
+        on_batch=record_retry,
+    )
 
     LOGGER.info(
-        f"Retry phase completed. Final results: {len(term_generation_responses.successes)} total successes, {len(term_generation_responses.failures)} total failures")
+        f"Retry phase completed. Final results: {len(successes)} total successes, {len(failures)} total failures")
 
 
 async def call_term_generation_on_metadata_enrichment_asset(
@@ -1275,7 +1270,8 @@ async def call_term_generation_on_metadata_enrichment_asset(
 ) -> TermGenerationBatchResponse:
     """
     Call term generation on a metadata enrichment asset.
-    Processes asset_ids in batches of 1 with retry logic for failures.
+    Processes asset_ids in concurrent batches whose size adapts to the batch latency
+    and failure rate, then retries failed assets once.
     
     Args:
         project_id: The ID of the project containing the MDE
@@ -1293,68 +1289,57 @@ async def call_term_generation_on_metadata_enrichment_asset(
         "project_id": project_id,
     }
 
-    total_assets = len(data_asset_ids)
-    current_index = 0
-    term_generation_responses = TermGenerationBatchResponse()
-
-    # Track failed assets for retry and early termination logic
-    failed_asset_ids = []
-    batch_number = 0
+    # Insertion-ordered sets of asset IDs
+    successes: dict[str, None] = {}
+    failures: dict[str, None] = {}
     consecutive_full_failures = 0
     has_any_success = False
 
-    # Phase 1: Initial batch processing
-    LOGGER.info(f"Starting initial batch processing for {total_assets} assets")
-
-    while current_index < total_assets:
-        batch_end = min(current_index + BATCH_SIZE_TERM_GEN, total_assets)
-        batch_asset_ids = data_asset_ids[current_index:batch_end]
-        batch_number += 1
-
-        LOGGER.info(f"Processing batch {batch_number}: assets {current_index + 1} of {total_assets}")
-
-        # Process batch using helper function
-        batch_successes, batch_failures = await _run_term_generation_batch(
-            batch_asset_ids=batch_asset_ids,
-            metadata_enrichment_asset_id=metadata_enrichment_asset_id,
-            query_params=query_params
-        )
-
-        # Update response tracking
-        for asset_id in batch_successes:
-            term_generation_responses.successes.append(AssetProcessingResult(asset_id=asset_id))
-
-        for asset_id in batch_failures:
-            failed_asset_ids.append(asset_id)
-            term_generation_responses.failures.append(AssetProcessingResult(asset_id=asset_id))
-
-        # Log batch results
-        LOGGER.info(f"Batch {batch_number} completed: {len(batch_successes)} successes, {len(batch_failures)} failures")
-
-        # Check early termination using helper function
+    def record_batch(outcome: BatchOutcome[str]) -> None:
+        nonlocal has_any_success, consecutive_full_failures
+        successes.update(dict.fromkeys(outcome.succeeded))
+        failures.update(dict.fromkeys(outcome.failed))
         has_any_success, consecutive_full_failures = _check_early_termination(
-            batch_number=batch_number,
+            batch_number=outcome.number,
             has_any_success=has_any_success,
             consecutive_full_failures=consecutive_full_failures,
-            batch_success_count=len(batch_successes),
-            batch_total_count=len(batch_asset_ids)
+            batch_success_count=len(outcome.succeeded),
+            batch_total_count=len(outcome.items)
+        )
+        report_job_progress(
+            len(successes) + len(failures),
+            len(data_asset_ids),
+            f"Term generation ran for {len(successes) + len(failures)} of {len(data_asset_ids)} assets",
         )
 
-        # Move to next batch
-        current_index = batch_end
+    # Phase 1: Initial batch processing; the first 2 batches decide on early termination
+    LOGGER.info(f"Starting initial batch processing for {len(data_asset_ids)} assets")
+    await _create_term_generation_executor("Term generation batch").run(
+        data_asset_ids,
+        partial(
+            _run_term_generation_batch,
+            metadata_enrichment_asset_id=metadata_enrichment_asset_id,
+            query_params=query_params,
+        ),
+        on_batch=record_batch,
+        probe_batches=2,
+    )
 
     # Phase 2: Retry failed assets once
-    if failed_asset_ids:
+    if failures:
         await _retry_failed_assets(
-            failed_asset_ids=failed_asset_ids,
+            failures=failures,
+            successes=successes,
             metadata_enrichment_asset_id=metadata_enrichment_asset_id,
             query_params=query_params,
-            term_generation_responses=term_generation_responses
         )
     else:
         LOGGER.info("No failed assets to retry")
 
-    return term_generation_responses
+    return TermGenerationBatchResponse(
+        successes=[AssetProcessingResult(asset_id=asset_id) for asset_id in successes],
+        failures=[AssetProcessingResult(asset_id=asset_id) for asset_id in failures],
+    )
 
 
 async def find_data_asset_ids_for_mde_id(metadata_enrichment_id: str, project_id: str) -> list[str]:
@@ -1460,25 +1445,16 @@ async def get_draft_terms_from_workflow_ids(workflow_ids: list[str]):
     limit = 1000
 
     for workflow_id in workflow_ids:
-        offset: int = 0
-        response = None
-        # Loop while there are more pages to fetch
-        while response is None or response.get("next") is not None:
-            query_params = {
-                "limit": limit,
-                "offset": offset
-            }
-
-            response = await tool_helper_service.execute_get_request(
+        async def fetch_page(offset: int, page_limit: int, workflow_id: str = workflow_id) -> Dict[str, Any]:
+            return await tool_helper_service.execute_get_request(
                 url=GET_TERMS_IN_WORKFLOW_URL + f"/{workflow_id}/artifacts",
-                params=query_params,
+                params={"limit": page_limit, "offset": offset},
             )
 
-            draft_terms_in_workflow.extend(response.get("resources", []))
-
-            if response.get("next") is not None:
-                # 'next' field only exists if pagination is required
-                offset += limit
+        # Pages after the first one are fetched concurrently when the total count is reported
+        draft_terms_in_workflow.extend(
+            await fetch_offset_pages(fetch_page, lambda response: response.get("resources", []), limit)
+        )
 
     return draft_terms_in_workflow
 
@@ -1559,25 +1535,27 @@ async def _get_and_process_data_assets_in_batches(
     Raises:
         ServiceError: If the first 2 consecutive batches have 100% failure rate
     """
-    # Get assets in batches
-    successful_resources, failed_asset_ids = await _get_assets_in_batches(
-        asset_ids=asset_ids,
-        project_id=project_id,
-        batch_size=batch_size
-    )
+    processed_assets: dict[str, DataAssets] = {}
+    processing_failures: list[str] = []
 
-    # Process each successful resource
-    processed_assets = []
-    for resource in successful_resources:
+    async def process_resource(resource: Dict[str, Any]) -> None:
+        asset_id = resource.get("asset_id", "unknown")
         try:
-            data_asset = _process_data_asset_resource(resource)
-            processed_assets.append(data_asset)
+            processed_assets[asset_id] = _process_data_asset_resource(resource)
         except Exception as e:
-            asset_id = resource.get("asset_id", "unknown")
             LOGGER.error(f"Failed to process data asset {asset_id}: {str(e)}")
-            failed_asset_ids.append(asset_id)
+            processing_failures.append(asset_id)
+
+    # Fetch assets in batches, processing each one as its batch arrives
+    failed_asset_ids = await _get_assets_in_batches(
+        asset_ids=asset_ids,
+        project_id=project_id,
+        batch_size=batch_size,
+        process_resource=process_resource,
+    )
 
-    return processed_assets, failed_asset_ids
+    ordered_assets = [processed_assets[asset_id] for asset_id in _in_request_order(processed_assets, asset_ids)]
+    return ordered_assets, failed_asset_ids + processing_failures
 
 
 async def _process_mde_resource(
@@ -1639,47 +1617,45 @@ async def _process_mde_resource(
     )
 
 
+def _in_request_order(results: dict[str, Any], asset_ids: list[str]) -> list[str]:
+    """Order the asset IDs of results like the requested asset IDs (batches complete in any order)."""
+    position = {asset_id: index for index, asset_id in enumerate(asset_ids)}
+    return sorted(results, key=lambda asset_id: position.get(asset_id, len(position)))
+
+
 async def _get_assets_in_batches(
         asset_ids: list[str],
         project_id: str,
         batch_size: int,
-) -> tuple[list[dict], list[str]]:
+        process_resource: Callable[[Dict[str, Any]], Awaitable[None]],
+) -> list[str]:
     """
-    Fetch assets in batches with early termination.
-    Returns raw resources and failed asset IDs.
+    Fetch assets in concurrent batches with early termination.
+    Each fetched resource is processed as soon as its batch arrives, so raw
+    resources are only held for the batches in flight.
     
     Args:
         asset_ids: List of asset IDs to fetch
         project_id: Project ID for the request
         batch_size: Maximum number of assets per batch
+        process_resource: Coroutine function called with every successfully fetched resource
         
     Returns:
-        Tuple of (successful_resources list, failed_asset_ids list)
+        List of asset IDs that could not be fetched
         
     Raises:
         ServiceError: If the first 2 consecutive batches have 100% failure rate
     """
-    successful_resources = []
     failed_asset_ids = []
 
     # Early termination tracking
-    batch_number = 0
     consecutive_full_failures = 0
     has_any_success = False
-    total_assets = len(asset_ids)
-
-    LOGGER.info(f"Starting batch processing for {total_assets} assets")
-
-    for i in range(0, len(asset_ids), batch_size):
-        batch_asset_ids = asset_ids[i:i + batch_size]
-        batch = ",".join(batch_asset_ids)
-        batch_number += 1
-
-        LOGGER.info(f"Processing batch {batch_number}: assets {i + 1}-{min(i + batch_size, total_assets)} of {total_assets}")
 
+    async def fetch_batch(batch_asset_ids: list[str]) -> tuple[list[str], list[str]]:
         query_params = {
             "project_id": project_id,
-            "asset_ids": batch
+            "asset_ids": ",".join(batch_asset_ids)
         }
 
         response = await tool_helper_service.execute_get_request(
@@ -1687,33 +1663,45 @@ async def _get_assets_in_batches(
             params=query_params,
         )
 
-        # Track batch results
-        batch_successes = 0
-        batch_failures = 0
-
+        batch_successes = []
+        batch_failures = []
         for resource in response.get("resources", []):
             asset_id = resource.get("asset_id")
             http_status = resource.get("http_status")
 
             if http_status != 200:
-                failed_asset_ids.append(asset_id)
-                batch_failures += 1
+                batch_failures.append(asset_id)
             else:
-                successful_resources.append(resource)
-                batch_successes += 1
+                batch_successes.append(asset_id)
+                await process_resource(resource)
 
-        LOGGER.info(f"Batch {batch_number} completed: {batch_successes} successes, {batch_failures} failures")
+        return batch_successes, batch_failures
 
-        # Check early termination
+    def record_batch(outcome: BatchOutcome[str]) -> None:
+        nonlocal has_any_success, consecutive_full_failures
+        failed_asset_ids.extend(outcome.failed)
         has_any_success, consecutive_full_failures = _check_early_termination(
-            batch_number=batch_number,
+            batch_number=outcome.number,
             has_any_success=has_any_success,
             consecutive_full_failures=consecutive_full_failures,
-            batch_success_count=batch_successes,
-            batch_total_count=len(batch_asset_ids)
+            batch_success_count=len(outcome.succeeded),
+            batch_total_count=len(outcome.items)
         )
 
-    return successful_resources, failed_asset_ids
+    LOGGER.info(f"Starting batch processing for {len(asset_ids)} assets")
+
+    # Fixed-size batches; the first 2 batches decide on early termination before more are fetched
+    executor = AdaptiveBatchExecutor(
+        max_concurrency=BULK_FETCH_MAX_CONCURRENT_BATCHES,
+        initial_batch_size=batch_size,
+        min_batch_size=batch_size,
+        max_batch_size=batch_size,
+        target_latency_s=settings.request_timeout_s,
+        label="Batch",
+    )
+    await executor.run(asset_ids, fetch_batch, on_batch=record_batch, probe_batches=2)
+
+    return failed_asset_ids
 
 
 async def _get_and_process_mde_assets_in_batches(
@@ -1735,22 +1723,24 @@ async def _get_and_process_mde_assets_in_batches(
     Raises:
         ServiceError: If the first 2 consecutive batches have 100% failure rate
     """
-    # Get full MDEs
-    successful_resources, failed_asset_ids = await _get_assets_in_batches(
-        asset_ids=asset_ids,
-        project_id=project_id,
-        batch_size=batch_size
-    )
-
-    # Process full MDE to extract relevant data for user message
     mde_details: dict[str, MetadataEnrichmentDetails] = {}
-    for resource in successful_resources:
+
+    async def process_resource(resource: Dict[str, Any]) -> None:
+        # Process full MDE to extract relevant data for user message
         asset_id = resource.get("asset_id")
         if asset_id:
-            mde_detail = await _process_mde_resource(resource, project_id)
-            mde_details[asset_id] = mde_detail
+            mde_details[asset_id] = await _process_mde_resource(resource, project_id)
+
+    # Fetch full MDEs in batches, processing each one as its batch arrives
+    failed_asset_ids = await _get_assets_in_batches(
+        asset_ids=asset_ids,
+        project_id=project_id,
+        batch_size=batch_size,
+        process_resource=process_resource,
+    )
 
-    return mde_details, failed_asset_ids
+    ordered_details = {asset_id: mde_details[asset_id] for asset_id in _in_request_order(mde_details, asset_ids)}
+    return ordered_details, failed_asset_ids
 
 
 async def process_mdes_for_user_message(
@@ -153,7 +153,8 @@ async def _get_project_details(project_id: str, known_name: Optional[str] = None
             # Fetch name from the single-project endpoint
             project_response = await tool_helper_service.execute_get_request(
                 url=f"{tool_helper_service.base_url}{PROJECTS_BASE_ENDPOINT}/{project_id}",
-                tool_name="add_asset_to_project"
+                tool_name="add_asset_to_project",
+                hedge=True,
             )
             
             # Type assertion for response
@@ -418,7 +419,8 @@ async def _get_asset_details(asset_id: str, catalog_id_or_name: Optional[str]) -
         response = await tool_helper_service.execute_get_request(
             url=f"{tool_helper_service.base_url}{CAMS_ASSETS_BASE_ENDPOINT}/{asset_id}",
             params={"catalog_id": catalog_id},
-            tool_name="add_asset_to_project"
+            tool_name="add_asset_to_project",
+            hedge=True,
         )
         
         # Type assertion for response
@@ -7,7 +7,7 @@ from app.services.projects.models.add_or_edit_collaborator import (
     CollaboratorMember,
 )
 from app.core.auth import get_bss_account_id
-from app.shared.utils.helpers import is_uuid_bool, get_exact_or_fuzzy_matches
+from app.shared.utils.helpers import is_uuid_bool
 from app.shared.exceptions.base import ServiceError, ValidationError
 from app.services.tool_utils import (
     is_project_exist_by_name,
@@ -689,22 +689,27 @@ async def search_members(
         _fetch_saas_users,
         _fetch_saas_groups,
     )
+    from app.services.user_search.utils.directory_cache import (
+        DIRECTORY_GROUPS,
+        DIRECTORY_USERS,
+        get_user_directory,
+    )
     
     # Get configuration based on environment and member type
     is_cpd = settings.di_env_mode.upper() == "CPD"
     
-    # Fetch data using centralized search utilities
+    # Fetch data using the cached directory shared with the user search utilities
     try:
         if is_cpd:
             if member_type == "group":
-                raw_data = await _fetch_cpd_groups()
+                directory = await get_user_directory(DIRECTORY_GROUPS, _fetch_cpd_groups)
             else:
-                raw_data = await _fetch_cpd_users()
+                directory = await get_user_directory(DIRECTORY_USERS, _fetch_cpd_users)
         else:
             if member_type == "group":
-                raw_data = await _fetch_saas_groups()
+                directory = await get_user_directory(DIRECTORY_GROUPS, _fetch_saas_groups)
             else:
-                raw_data = await _fetch_saas_users()
+                directory = await get_user_directory(DIRECTORY_USERS, _fetch_saas_users)
     except Exception as e:
         LOGGER.error(f"API error while fetching {entity_type}s from account: {str(e)}")
         raise ValidationError(
@@ -713,25 +718,24 @@ async def search_members(
             tool="add_or_edit_collaborator"
         )
     
-    if not raw_data:
+    if not directory.records:
         LOGGER.warning(f"No {entity_type}s available in account {account_id}")
         return []
     
-    # Prepare data for fuzzy matching based on member type and environment
-    candidates = extract_candidates(raw_data, member_type, is_cpd)
-    
     # Define search fields based on member type
     search_fields = ["name"] if member_type == "group" else ["name", "id"]
     
-    # Perform exact match first, then fuzzy match if needed
-    matched_results = get_exact_or_fuzzy_matches(
-        search_word=search_str,
-        candidates=candidates,
-        search_fields=search_fields,
-        max_results=10,
-        cutoff=0.6
+    # Index the candidates normalized for this tool (built once per directory listing)
+    index = directory.get_index(
+        f"collaborator_{member_type}",
+        lambda raw_data: extract_candidates(raw_data, member_type, is_cpd),
+        search_fields,
     )
     
+    # Perform exact match first, then fuzzy match if needed
+    # Copies, so callers never modify the cached directory
+    matched_results = [dict(match) for match in index.match(search_str, cutoff=0.6, max_results=10)]
+    
     entity_word = entity_type if len(matched_results) == 1 else f"{entity_type}s"
     LOGGER.info(f"Found {len(matched_results)} matching {entity_word} for search term '{search_str}'")
     return matched_results
@@ -67,7 +67,8 @@ async def _get_asset_details(
     response = await tool_helper_service.execute_get_request(
         url=f"{str(tool_helper_service.base_url)}{CAMS_ASSETS_BASE_ENDPOINT}/{asset_id}",
         params=params,
-        tool_name="get_asset_details"
+        tool_name="get_asset_details",
+        hedge=True,
     )
 
     output = None
@@ -170,7 +170,7 @@ async def is_project_exist(project_identifier: str):
 
     response = await tool_helper_service.execute_get_request(
         url=str(tool_helper_service.base_url) + PROJECTS_BASE_ENDPOINT,
-        params=params
+        params=params,
     )
 
     projects = [
@@ -238,7 +238,8 @@ async def find_catalog_id(catalog_name: str) -> str:
 
     response = await tool_helper_service.execute_get_request(
         url=str(tool_helper_service.base_url) + CATALOGS_BASE_ENDPOINT,
-        params=params
+        params=params,
+        hedge=True,
     )
 
     result_id = None
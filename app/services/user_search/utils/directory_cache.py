@@ -0,0 +1,234 @@
+# Copyright [2026] [IBM]
+# Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+# See the LICENSE file in the project root for license information.
+
+"""
+Indexed cache of the user and group directory of an account.
+
+Listing the users of a large account takes many paged requests, so the raw
+directory is cached per caller (keyed on a hash of the access token) and
+indexed for lookups:
+
+- every view of the directory (e.g. normalized for user search or for adding
+  collaborators) gets a FuzzyMatcher over its search fields, so its token and
+  prefix index is built once per listing
+- lookups are answered from the index with the same exact-then-token-based
+  fuzzy semantics as ``get_exact_or_fuzzy_matches``
+- once a directory is older than the refresh interval it keeps being served
+  while it is re-listed in the background; the new listing replaces it
+  atomically and only views of a changed directory are re-indexed
+- directories older than the maximum age are never served
+
+The directory APIs offer no change feed, so a refresh re-lists the directory.
+Directories are cached per caller because listing users requires permissions
+the caller may not have.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from app.core.auth import get_access_token
+from app.core.auth_context import get_token_hash
+from app.core.metrics import MetricFamily, get_metrics_registry
+from app.core.settings import settings
+from app.shared.logging import LOGGER
+from app.shared.utils.fuzzy_matcher import FuzzyMatcher
+
+DIRECTORY_USERS = "users"
+DIRECTORY_GROUPS = "groups"
+
+DirectoryFetcher = Callable[[], Awaitable[List[Dict]]]
+DirectoryNormalizer = Callable[[List[Dict]], List[Dict]]
+
+
+@dataclass
+class Directory:
+    """Raw directory listing of an account with lazily built per-view indexes."""
+
+    records: List[Dict]
+    loaded_at: float
+    _indexes: Dict[str, FuzzyMatcher] = field(default_factory=dict)
+
+    def get_index(
+        self,
+        view: str,
+        normalize: DirectoryNormalizer,
+        search_fields: List[str],
+    ) -> FuzzyMatcher:
+        """
+        Get the index of a view of the directory, building it on first use.
+
+        Args:
+            view: Name identifying the normalization and search fields
+            normalize: Function converting the raw records to searchable entries
+            search_fields: Entry fields that are searched
+
+        Returns:
+            FuzzyMatcher: Matcher indexing the normalized entries
+        """
+        index = self._indexes.get(view)
+        if index is None:
+            index = FuzzyMatcher(normalize(self.records), search_fields)
+            self._indexes[view] = index
+        return index
+
+
+class UserDirectoryCache:
+    """Bounded cache of account directories with background refresh."""
+
+    def __init__(self, max_entries: int, refresh_after_s: float, max_age_s: float) -> None:
+        """
+        Args:
+            max_entries: Maximum number of directories kept (least recently used are evicted)
+            refresh_after_s: Re-list a directory in the background once it is this old
+            max_age_s: Never serve a directory older than this
+        """
+        self._max_entries = max_entries
+        self._refresh_after_s = refresh_after_s
+        self._max_age_s = max_age_s
+        self._directories: OrderedDict[str, Directory] = OrderedDict()
+        self._loading: Dict[str, asyncio.Future] = {}
+        self._stats = {"hits": 0, "misses": 0, "refreshes": 0}
+
+    async def get_directory(self, key: str, fetch: DirectoryFetcher) -> Directory:
+        """
+        Get a cached directory, listing it if it is missing or too old.
+
+        Args:
+            key: Cache key identifying the caller and directory kind
+            fetch: Coroutine function listing the raw directory records
+
+        Returns:
+            Directory: The cached directory
+        """
+        now = time.monotonic()
+        directory = self._directories.get(key)
+        if directory is not None and now - directory.loaded_at < self._max_age_s:
+            self._directories.move_to_end(key)
+            self._stats["hits"] += 1
+            if now - directory.loaded_at >= self._refresh_after_s:
+                self._refresh_in_background(key, fetch)
+            return directory
+
+        self._stats["misses"] += 1
+        return await asyncio.shield(self._load(key, fetch))
+
+    def _load(self, key: str, fetch: DirectoryFetcher) -> asyncio.Future:
+        """Start listing a directory unless a listing for the same key is in flight."""
+        loading = self._loading.get(key)
+        if loading is not None:
+            return loading
+
+        async def _list() -> Directory:
+            try:
+                records = await fetch()
+                return self._store(key, records)
+            finally:
+                self._loading.pop(key, None)
+
+        loading = asyncio.ensure_future(_list())
+        # Mark a failure as retrieved even if every waiting caller was cancelled
+        loading.add_done_callback(lambda task: task.cancelled() or task.exception())
+        self._loading[key] = loading
+        return loading
+
+    def _refresh_in_background(self, key: str, fetch: DirectoryFetcher) -> None:
+        if key in self._loading:
+            return
+
+        def _done(task: asyncio.Future) -> None:
+            if task.cancelled():
+                return
+            if task.exception() is not None:
+                # Keep serving the current directory until it reaches its maximum age
+                LOGGER.warning(f"Background refresh of user directory failed: {task.exception()}")
+            else:
+                self._stats["refreshes"] += 1
+
+        self._load(key, fetch).add_done_callback(_done)
+
+    def _store(self, key: str, records: List[Dict]) -> Directory:
+        previous = self._directories.get(key)
+        directory = Directory(records=records, loaded_at=time.monotonic())
+        if previous is not None and previous.records == records:
+            # Nothing changed, keep the indexes that were already built
+            directory._indexes = previous._indexes
+        elif previous is not None:
+            LOGGER.info(
+                f"User directory changed: {len(previous.records)} -> {len(records)} records"
+            )
+
+        self._directories[key] = directory
+        self._directories.move_to_end(key)
+        while len(self._directories) > self._max_entries:
+            self._directories.popitem(last=False)
+        return directory
+
+    def clear(self) -> None:
+        """Drop all cached directories."""
+        self._directories.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return hit/miss/refresh counters and the number of cached directories."""
+        return {**self._stats, "size": len(self._directories), "max_entries": self._max_entries}
+
+
+_user_directory_cache: Optional[UserDirectoryCache] = None
+
+
+def _collect_directory_cache_metrics() -> List[MetricFamily]:
+    """Report lookups, background refreshes and the size of the user directory cache."""
+    if _user_directory_cache is None:
+        return []
+    stats = _user_directory_cache.get_stats()
+    return [
+        MetricFamily(
+            "user_directory_cache_lookups_total", "User directory cache lookups by result", "counter", ("result",)
+        ).add(stats["hits"], "hits").add(stats["misses"], "misses"),
+        MetricFamily(
+            "user_directory_cache_refreshes_total", "Background refreshes of cached user directories", "counter"
+        ).add(stats["refreshes"]),
+        MetricFamily("user_directory_cache_entries", "Directories in the user directory cache").add(stats["size"]),
+    ]
+
+
+get_metrics_registry().register_collector("user_directory_cache", _collect_directory_cache_metrics)
+
+
+def get_user_directory_cache() -> UserDirectoryCache:
+    """
+    Get the global user directory cache instance (singleton pattern).
+
+    Returns:
+        UserDirectoryCache: The global user directory cache instance
+    """
+    global _user_directory_cache
+    if _user_directory_cache is None:
+        _user_directory_cache = UserDirectoryCache(
+            max_entries=settings.user_directory_cache_max_entries,
+            refresh_after_s=settings.user_directory_cache_refresh_s,
+            max_age_s=settings.user_directory_cache_max_age_s,
+        )
+    return _user_directory_cache
+
+
+async def get_user_directory(kind: str, fetch: DirectoryFetcher) -> Directory:
+    """
+    Get the user or group directory of the caller's account.
+
+    Args:
+        kind: DIRECTORY_USERS or DIRECTORY_GROUPS
+        fetch: Coroutine function listing the raw directory records
+
+    Returns:
+        Directory: The (possibly cached) directory
+    """
+    if not settings.user_directory_cache_enabled:
+        return Directory(records=await fetch(), loaded_at=time.monotonic())
+
+    # The token claims are not verified here: key on the token itself, never on its claims
+    key = f"{kind}:{get_token_hash(await get_access_token())}"
+    return await get_user_directory_cache().get_directory(key, fetch)
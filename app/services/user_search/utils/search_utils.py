@@ -5,18 +5,28 @@
 from typing import List, Dict, Tuple, Optional
 from app.core.auth import get_bss_account_id, get_cloud_iam_url_from_service_url
 from app.shared.utils.helpers import get_exact_or_fuzzy_matches
+from app.shared.utils.fuzzy_matcher import FuzzyMatcher
 from app.shared.exceptions.base import ExternalAPIError
 from app.shared.logging import LOGGER
+from app.shared.utils.pagination import fetch_offset_pages
 from app.shared.utils.tool_helper_service import tool_helper_service
 from app.core.settings import settings
 from app.services.user_search.models.search_users import UserSearchResult
 from app.services.user_search.models.search_groups import GroupSearchResult
 from app.services.user_search.models.search_roles import RoleSearchResult
+from app.services.user_search.utils.directory_cache import (
+    DIRECTORY_GROUPS,
+    DIRECTORY_USERS,
+    get_user_directory,
+)
 
 FUZZY_MATCH_THRESHOLD = 0.7
 MAX_RESULTS = 10000
 PAGE_LIMIT = 100
 
+USER_SEARCH_FIELDS = ["username", "email", "display_name"]
+GROUP_SEARCH_FIELDS = ["group_name"]
+
 async def search_users_by_query(
     query: Optional[str] = None
 ) -> Tuple[List[UserSearchResult], int]:
@@ -27,6 +37,8 @@ async def search_users_by_query(
     If no query provided, returns all users in the system.
     Supports both SaaS and CP4D environments with appropriate API endpoints.
     For SaaS, implements proper server-side pagination to fetch all users.
+    The user directory is cached and indexed per account, so repeated lookups
+    do not list the directory again.
     
     Args:
         query: Optional search term (user name, email, username, or user ID). If None, returns all users.
@@ -43,19 +55,21 @@ async def search_users_by_query(
     # Get account ID for SaaS or use CP4D endpoint
     is_cpd = settings.di_env_mode.upper() == "CPD"
     
-    if is_cpd:
-        raw_users = await _fetch_cpd_users()
-        candidates = _normalize_user_data(raw_users, is_cpd)
-    else:
-        all_users = await _fetch_saas_users()
-        candidates = _normalize_user_data(all_users, is_cpd)
+    directory = await get_user_directory(
+        DIRECTORY_USERS, _fetch_cpd_users if is_cpd else _fetch_saas_users
+    )
+    index = directory.get_index(
+        "user_search",
+        lambda raw_users: _normalize_user_data(raw_users, is_cpd),
+        USER_SEARCH_FIELDS,
+    )
     
-    if not candidates:
+    if not index.candidates:
         LOGGER.warning("No users available in the system")
         return [], 0
     
     # Apply query filtering
-    paginated_users, total_count = _apply_user_query_filter(query, candidates)
+    paginated_users, total_count = _apply_user_query_filter(query, index)
     
     # Convert to UserSearchResult objects
     results = _convert_to_user_results(paginated_users)
@@ -74,39 +88,28 @@ async def _fetch_cpd_users() -> List[Dict]:
     Raises:
         ExternalAPIError: If both new and legacy API requests fail
     """
-    offset = 0
-    all_users = []
-    has_next = True
-    
     # Try new API endpoint first (CPD 5.x+) - /usermgmt/v2/usermgmt/users
     users_v2_url = f"{settings.di_service_url}/usermgmt/v2/usermgmt/users"
-    
+
+    async def fetch_page(offset: int, limit: int):
+        return await tool_helper_service.execute_get_request(
+            url=f"{users_v2_url}?offset={offset}&limit={limit}&include_users_count=true", tool_name="search_users"
+        )
+
+    def extract_users(response) -> List[Dict]:
+        if isinstance(response, dict):
+            return response.get("user_data", [])
+        # Fallback for direct list response (older API versions)
+        return response if isinstance(response, list) else []
+
+    def get_user_count(response) -> int:
+        # Ensure total_users is an integer (API might return string); a list response is a single page
+        return int(response.get("user_count", 0)) if isinstance(response, dict) else 0
+
     try:
         LOGGER.info(f"Attempting to fetch users using new API: {users_v2_url}")
-        # Pagination loop for v2 API
-        while has_next:
-            next_url = f"{users_v2_url}?offset={offset}&limit={PAGE_LIMIT}&include_users_count=true"
-            
-            response = await tool_helper_service.execute_get_request(
-                url=next_url, tool_name="search_users"
-            )
-            
-            # Parse response
-            if isinstance(response, dict):
-                # Ensure total_users is an integer (API might return string)
-                total_users = int(response.get("user_count", 0))
-                user_data = response.get("user_data", [])
-            else:
-                # Fallback for direct list response (older API versions)
-                user_data = response if isinstance(response, list) else []
-                total_users = len(user_data)
-            
-            # Add users to result list
-            all_users.extend(user_data)
-            
-            # Update pagination
-            offset += PAGE_LIMIT
-            has_next = offset < total_users if total_users > 0 else False
+        # Pages after the first one are fetched concurrently up to the reported user count
+        all_users = await fetch_offset_pages(fetch_page, extract_users, PAGE_LIMIT, get_total=get_user_count)
         
         if all_users:
             LOGGER.info(f"Successfully fetched {len(all_users)} users using new API (v2)")
@@ -167,18 +170,12 @@ async def _fetch_saas_users() -> List[Dict]:
     return all_users
 
 
-def _apply_user_query_filter(query: Optional[str], candidates: List[Dict]) -> Tuple[List[Dict], int]:
-    """Apply query filter to user candidates."""
+def _apply_user_query_filter(query: Optional[str], index: FuzzyMatcher) -> Tuple[List[Dict], int]:
+    """Apply query filter to the indexed user candidates."""
     if not query or query.strip() == "":
-        return candidates, len(candidates)
+        return index.candidates, len(index.candidates)
     
-    matched_users = get_exact_or_fuzzy_matches(
-        search_word=query,
-        candidates=candidates,
-        search_fields=["username", "email", "display_name"],
-        max_results=MAX_RESULTS,
-        cutoff=FUZZY_MATCH_THRESHOLD
-    )
+    matched_users = index.match(query, cutoff=FUZZY_MATCH_THRESHOLD, max_results=MAX_RESULTS)
     return matched_users, len(matched_users)
 
 
@@ -206,6 +203,7 @@ async def search_groups_by_query(
     If no query provided, returns all groups in the system.
     Supports both SaaS and CP4D environments with appropriate API endpoints.
     For SaaS, implements proper server-side pagination to fetch all groups.
+    The group directory is cached and indexed per account, like the user directory.
     
     Args:
         query: Optional search term (group name or group ID). If None, returns all groups.
@@ -222,19 +220,21 @@ async def search_groups_by_query(
     # Get configuration based on environment
     is_cpd = settings.di_env_mode.upper() == "CPD"
     
-    if is_cpd:
-        raw_groups = await _fetch_cpd_groups()
-        candidates = _normalize_group_data(raw_groups, is_cpd)
-    else:
-        all_groups = await _fetch_saas_groups()
-        candidates = _normalize_group_data(all_groups, is_cpd)
+    directory = await get_user_directory(
+        DIRECTORY_GROUPS, _fetch_cpd_groups if is_cpd else _fetch_saas_groups
+    )
+    index = directory.get_index(
+        "group_search",
+        lambda raw_groups: _normalize_group_data(raw_groups, is_cpd),
+        GROUP_SEARCH_FIELDS,
+    )
     
-    if not candidates:
+    if not index.candidates:
         LOGGER.warning("No groups available in the system")
         return [], 0
     
     # Apply query filtering
-    paginated_groups, total_count = _apply_group_query_filter(query, candidates)
+    paginated_groups, total_count = _apply_group_query_filter(query, index)
     
     # Convert to GroupSearchResult objects
     results = _convert_to_group_results(paginated_groups)
@@ -329,18 +329,12 @@ async def _fetch_saas_groups() -> List[Dict]:
     return all_groups
 
 
-def _apply_group_query_filter(query: Optional[str], candidates: List[Dict]) -> Tuple[List[Dict], int]:
-    """Apply query filter to group candidates."""
+def _apply_group_query_filter(query: Optional[str], index: FuzzyMatcher) -> Tuple[List[Dict], int]:
+    """Apply query filter to the indexed group candidates."""
     if not query or query.strip() == "":
-        return candidates, len(candidates)
+        return index.candidates, len(index.candidates)
     
-    matched_groups = get_exact_or_fuzzy_matches(
-        search_word=query,
-        candidates=candidates,
-        search_fields=["group_name"],
-        max_results=MAX_RESULTS,
-        cutoff=FUZZY_MATCH_THRESHOLD
-    )
+    matched_groups = index.match(query, cutoff=FUZZY_MATCH_THRESHOLD, max_results=MAX_RESULTS)
     return matched_groups, len(matched_groups)
 
 
@@ -12,7 +12,7 @@ This module provides functionality to monitor workflows you've created, with two
 - Deep dive mode (deep_dive=True): Returns comprehensive analysis with task details, activity tracking, and metrics
 """
 
-from typing import Annotated, List, Optional
+from typing import Annotated, Dict, List, Optional, Set
 from datetime import datetime, timezone
 import json
 from pydantic import Field
@@ -28,7 +28,7 @@ from app.services.workflow.models.get_my_workflows import (
 )
 from app.services.workflow.tools.utils import ZERO_MINUTES
 from app.services.workflow.utils.task_utils import _convert_variables_to_dict
-from app.services.workflow.utils.user_mappers import convert_iam_id_to_email
+from app.services.workflow.utils.user_mappers import map_iam_id_to_email, resolve_iam_ids_to_emails
 from app.services.workflow.utils.workflow_request_formatters import (
     format_workflow_requests_as_tables,
     calculate_workflow_statistics
@@ -138,8 +138,9 @@ def _parse_task_title(task_title_raw: str) -> Optional[str]:
         return None
 
 
-async def _create_workflow_from_data(
+def _create_workflow_from_data(
     workflow_data: dict,
+    emails: Dict[str, str],
     workflow_title: Optional[str] = None,
     tasks: Optional[List[TaskDetail]] = None
 ) -> Workflow:
@@ -148,6 +149,7 @@ async def _create_workflow_from_data(
     
     Args:
         workflow_data: Raw workflow data from API
+        emails: Mapping of IAM ID to email address from resolve_iam_ids_to_emails
         workflow_title: Parsed workflow title (optional, for backward compatibility)
         tasks: List of task details (optional, included when include_tasks=True)
         
@@ -178,7 +180,7 @@ async def _create_workflow_from_data(
     
     # Replace IAM ID with email address if available
     created_by_iam_id = metadata.get("created_by")
-    created_by = await convert_iam_id_to_email(created_by_iam_id, "created_by") if created_by_iam_id else None
+    created_by = map_iam_id_to_email(created_by_iam_id, emails)
     
     # Use workflow_state from entity (business state) instead of metadata.state (engine state)
     # entity.workflow_state contains values like "Not started", "Rejected", etc.
@@ -199,6 +201,44 @@ async def _create_workflow_from_data(
     )
 
 
+def _collect_workflow_iam_ids(workflow_list: List[dict], include_tasks: bool) -> Set[str]:
+    """
+    Collect the distinct IAM IDs referenced by a list of workflows.
+    
+    Args:
+        workflow_list: Raw workflow data from API
+        include_tasks: Whether assignees of the workflows' user tasks are needed too
+        
+    Returns:
+        Set of IAM IDs of workflow creators and, optionally, task assignees
+    """
+    iam_ids = set()
+    for workflow_data in workflow_list:
+        created_by = workflow_data.get("metadata", {}).get("created_by")
+        if created_by:
+            iam_ids.add(created_by)
+        if include_tasks:
+            iam_ids.update(_collect_task_iam_ids(workflow_data.get("entity", {}).get("user_tasks", [])))
+    return iam_ids
+
+
+def _collect_task_iam_ids(task_list: List[dict]) -> Set[str]:
+    """
+    Collect the distinct assignee IAM IDs of a list of tasks.
+    
+    Args:
+        task_list: Raw task data from API
+        
+    Returns:
+        Set of assignee IAM IDs
+    """
+    return {
+        task_data.get("entity", {}).get("assignee")
+        for task_data in task_list
+        if task_data.get("entity", {}).get("assignee")
+    }
+
+
 async def _retrieve_my_workflows(
     max_results: int,
     state: Optional[str] = None,
@@ -246,6 +286,9 @@ async def _retrieve_my_workflows(
             workflow_list = response.get('resources', [])
 
         LOGGER.info(f"Retrieved {len(workflow_list)} workflows from API")
+
+        # Resolve every distinct IAM ID once, then build the models from the map
+        emails = await resolve_iam_ids_to_emails(_collect_workflow_iam_ids(workflow_list, include_tasks))
         workflows = []
         
         for idx, workflow_data in enumerate(workflow_list):
@@ -258,15 +301,12 @@ async def _retrieve_my_workflows(
             if include_tasks:
                 task_list = workflow_data.get("entity", {}).get("user_tasks", [])
 
-                tasks = []
-                for task_data in task_list:
-                    task = await _create_task_detail(task_data)
-                    tasks.append(task)
+                tasks = [_create_task_detail(task_data, emails) for task_data in task_list]
 
                 LOGGER.info(f"  Retrieved {len(tasks)} tasks")
             
             # Create workflow object with parsed name and optional tasks
-            workflow = await _create_workflow_from_data(workflow_data, tasks=tasks)
+            workflow = _create_workflow_from_data(workflow_data, emails, tasks=tasks)
             LOGGER.info(f"  Created workflow object with id: {workflow.workflow_id}, name: {workflow.name}")
             workflows.append(workflow)
 
@@ -310,12 +350,13 @@ def _parse_completed_timestamp(completed_str: Optional[str]) -> Optional[datetim
         return None
 
 
-async def _create_task_detail(task_data: dict) -> TaskDetail:
+def _create_task_detail(task_data: dict, emails: Dict[str, str]) -> TaskDetail:
     """
     Create a TaskDetail object from raw task data.
     
     Args:
         task_data: Raw task data from API
+        emails: Mapping of IAM ID to email address from resolve_iam_ids_to_emails
         
     Returns:
         TaskDetail object
@@ -343,7 +384,7 @@ async def _create_task_detail(task_data: dict) -> TaskDetail:
     
     # Replace IAM ID with email address for assignee if available
     assignee_iam_id = entity.get("assignee")
-    assignee = await convert_iam_id_to_email(assignee_iam_id, "assignee") if assignee_iam_id else None
+    assignee = map_iam_id_to_email(assignee_iam_id, emails)
     
     return TaskDetail(
         task_id=metadata.get("task_id"),
@@ -379,11 +420,8 @@ async def _get_tasks_for_workflow(workflow_id: str) -> List[TaskDetail]:
         )
         
         task_list = response.get('resources', [])
-        tasks = []
-        for task_data in task_list:
-            task = await _create_task_detail(task_data)
-            tasks.append(task)
-        return tasks
+        emails = await resolve_iam_ids_to_emails(_collect_task_iam_ids(task_list), "assignee")
+        return [_create_task_detail(task_data, emails) for task_data in task_list]
         
     except Exception as e:
         LOGGER.error(f"Error retrieving tasks for workflow {workflow_id}: {str(e)}")
@@ -591,10 +629,11 @@ def _build_workflow_query_params(
     return params
 
 
-async def _create_workflow_request(
+def _create_workflow_request(
     workflow_data: dict,
     include_tasks: bool,
-    stalled_days: Optional[int]
+    stalled_days: Optional[int],
+    emails: Dict[str, str]
 ) -> WorkflowRequest:
     """
     Create a WorkflowRequest object from raw workflow data.
@@ -603,6 +642,7 @@ async def _create_workflow_request(
         workflow_data: Raw workflow data from API
         include_tasks: Whether to include detailed task information
         stalled_days: Threshold for stalled detection
+        emails: Mapping of IAM ID to email address from resolve_iam_ids_to_emails
         
     Returns:
         WorkflowRequest object
@@ -626,10 +666,7 @@ async def _create_workflow_request(
     # Get tasks from workflow data
     task_list = workflow_data.get("entity", {}).get("user_tasks", [])
 
-    tasks = []
-    for task_data in task_list:
-        task = await _create_task_detail(task_data)
-        tasks.append(task)
+    tasks = [_create_task_detail(task_data, emails) for task_data in task_list]
 
     LOGGER.info(f"  Retrieved {len(tasks)} tasks")
         
@@ -640,7 +677,7 @@ async def _create_workflow_request(
     
     # Replace IAM ID with email address for created_by if available
     created_by_iam_id = metadata.get("created_by")
-    created_by = await convert_iam_id_to_email(created_by_iam_id, "created_by") if created_by_iam_id else None
+    created_by = map_iam_id_to_email(created_by_iam_id, emails)
     
     # Use workflow_state from entity (business state) instead of metadata.state (engine state)
     workflow_state = entity.get("workflow_state", metadata.get("state", "unknown"))
@@ -697,13 +734,13 @@ async def _retrieve_my_workflows_deep_dive(
         
         workflow_list = response.get('resources', [])
         
-        # Process workflows concurrently for better performance
-        workflows = []
-        for workflow_data in workflow_list:
-            workflow = await _create_workflow_request(workflow_data, include_tasks, stalled_days)
-            workflows.append(workflow)
-        
-        return workflows
+        # Resolve every distinct IAM ID once (task assignees are always needed for the
+        # activity metrics), then build the models from the map
+        emails = await resolve_iam_ids_to_emails(_collect_workflow_iam_ids(workflow_list, True))
+        return [
+            _create_workflow_request(workflow_data, include_tasks, stalled_days, emails)
+            for workflow_data in workflow_list
+        ]
         
     except Exception as e:
         LOGGER.error(f"Error retrieving workflow requests: {str(e)}")
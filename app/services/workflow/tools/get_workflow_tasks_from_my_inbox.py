@@ -4,7 +4,7 @@
 
 # This file has been modified with the assistance of IBM Bob AI tool
 
-from typing import Annotated, List, Optional
+from typing import Annotated, Dict, List, Optional, Set
 from datetime import datetime, timezone
 from urllib.parse import urlparse
 import warnings
@@ -16,7 +16,11 @@ from app.services.workflow.models.get_workflow_tasks_from_my_inbox import Task,
 from app.services.workflow.utils.task_formatters import format_tasks_as_table, sort_tasks_by_priority
 from app.services.workflow.utils.task_utils import _convert_variables_to_dict, _parse_task_title_from_json
 from app.services.workflow.tools.utils import ZERO_MINUTES
-from app.services.workflow.utils.user_mappers import convert_iam_id_to_email, process_candidate_users
+from app.services.workflow.utils.user_mappers import (
+    map_candidate_users,
+    map_iam_id_to_email,
+    resolve_iam_ids_to_emails,
+)
 from app.shared.logging import LOGGER, auto_context
 from app.shared.utils.tool_helper_service import tool_helper_service
 from app.shared.utils.client_detection import supports_rich_text_format
@@ -78,12 +82,34 @@ def _parse_due_date(due_date_str: str) -> Optional[datetime]:
     return datetime.fromisoformat(due_date_str.replace("Z", ZERO_MINUTES))
 
 
-async def _create_task_from_data(task_data: dict) -> Task:
+def _collect_task_iam_ids(task_list: List[dict]) -> Set[str]:
+    """
+    Collect the distinct IAM IDs (assignees and candidate users) referenced by a list of tasks.
+    
+    Args:
+        task_list: Raw task data from API
+        
+    Returns:
+        Set of IAM IDs
+    """
+    iam_ids = set()
+    for task_data in task_list:
+        entity = task_data.get("entity", {})
+        if entity.get("assignee"):
+            iam_ids.add(entity["assignee"])
+        candidate_users = entity.get("candidate_users")
+        if isinstance(candidate_users, list):
+            iam_ids.update(iam_id for iam_id in candidate_users if iam_id)
+    return iam_ids
+
+
+def _create_task_from_data(task_data: dict, emails: Dict[str, str]) -> Task:
     """
     Create a Task object from raw task data.
     
     Args:
         task_data: Raw task data from API
+        emails: Mapping of IAM ID to email address from resolve_iam_ids_to_emails
         
     Returns:
         Task object
@@ -99,8 +125,8 @@ async def _create_task_from_data(task_data: dict) -> Task:
     
     # Process IAM ID to email conversions
     assignee_iam_id = entity.get("assignee")
-    assignee = await convert_iam_id_to_email(assignee_iam_id, "assignee") if assignee_iam_id else None
-    candidate_users = await process_candidate_users(entity.get("candidate_users"))
+    assignee = map_iam_id_to_email(assignee_iam_id, emails)
+    candidate_users = map_candidate_users(entity.get("candidate_users"), emails)
     
     # Parse created_at with proper null handling
     created_at_str = metadata.get("created_at")
@@ -160,11 +186,10 @@ async def _retrieve_my_tasklist_from_workflow(
 
         # Schema: resources[]->Items->(metadata, entity)
         item_list = response.get('resources', [])
-        tasks = []
-        for task_data in item_list:
-            task = await _create_task_from_data(task_data)
-            tasks.append(task)
-        return tasks
+
+        # Resolve every distinct IAM ID once, then build the tasks from the map
+        emails = await resolve_iam_ids_to_emails(_collect_task_iam_ids(item_list))
+        return [_create_task_from_data(task_data, emails) for task_data in item_list]
 
     except Exception as e:
         # Log the exception type and details for debugging
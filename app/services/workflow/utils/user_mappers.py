@@ -9,10 +9,14 @@ This module provides centralized functions to convert IAM IDs to user email addr
 with consistent error handling and logging across all workflow tool modules.
 """
 
-from typing import List, Optional
+import asyncio
+from typing import Dict, Iterable, List, Optional
 from app.core.auth import get_user_email_from_iam_id
 from app.shared.logging import LOGGER
 
+# Maximum number of IAM ID lookups in flight at once when resolving a batch
+IAM_ID_RESOLUTION_CONCURRENCY = 10
+
 
 async def convert_iam_id_to_email(iam_id: str, context: str = "user") -> str:
     """
@@ -32,15 +36,66 @@ async def convert_iam_id_to_email(iam_id: str, context: str = "user") -> str:
         return iam_id
 
 
-async def process_candidate_users(candidate_users_raw: List[str]) -> Optional[List[str]]:
+async def resolve_iam_ids_to_emails(
+    iam_ids: Iterable[Optional[str]],
+    context: str = "user"
+) -> Dict[str, str]:
     """
-    Process candidate users list, converting IAM IDs to email addresses.
+    Convert a batch of IAM IDs to email addresses with bounded concurrency.
+    
+    Each distinct IAM ID is looked up once, no matter how often it occurs.
+    
+    Args:
+        iam_ids: IAM IDs to convert (duplicates and empty values are ignored)
+        context: Context for logging (e.g., "assignee", "candidate_user", "created_by")
+        
+    Returns:
+        Mapping of IAM ID to email address (or the IAM ID itself if conversion fails)
+    """
+    distinct_ids = list(dict.fromkeys(iam_id for iam_id in iam_ids if iam_id))
+    if not distinct_ids:
+        return {}
+    
+    semaphore = asyncio.Semaphore(IAM_ID_RESOLUTION_CONCURRENCY)
+    
+    async def _convert(iam_id: str) -> str:
+        async with semaphore:
+            return await convert_iam_id_to_email(iam_id, context)
+    
+    emails = await asyncio.gather(*(_convert(iam_id) for iam_id in distinct_ids))
+    LOGGER.debug(f"Resolved {len(distinct_ids)} distinct IAM IDs to email addresses")
+    return dict(zip(distinct_ids, emails))
+
+
+def map_iam_id_to_email(iam_id: Optional[str], emails: Dict[str, str]) -> Optional[str]:
+    """
+    Look up the email address of an IAM ID in a map built by resolve_iam_ids_to_emails.
+    
+    Args:
+        iam_id: The IAM ID to look up
+        emails: Mapping of IAM ID to email address
+        
+    Returns:
+        Email address if known, the IAM ID otherwise, None if iam_id is empty
+    """
+    if not iam_id:
+        return None
+    return emails.get(iam_id, iam_id)
+
+
+def map_candidate_users(
+    candidate_users_raw: List[str],
+    emails: Dict[str, str]
+) -> Optional[List[str]]:
+    """
+    Map candidate users to email addresses using a map built by resolve_iam_ids_to_emails.
     
     Args:
         candidate_users_raw: Raw list of IAM IDs
+        emails: Mapping of IAM ID to email address
         
     Returns:
-        List of email addresses if successful, None if input is None or empty list
+        List of email addresses, None if input is None or empty list
     """
     if candidate_users_raw is None:
         return None
@@ -51,10 +106,21 @@ async def process_candidate_users(candidate_users_raw: List[str]) -> Optional[Li
     if len(candidate_users_raw) == 0:
         return None
     
-    processed_users = []
-    for iam_id in candidate_users_raw:
-        if iam_id:
-            email = await convert_iam_id_to_email(iam_id, "candidate_user")
-            processed_users.append(email)
+    return [emails.get(iam_id, iam_id) for iam_id in candidate_users_raw if iam_id]
+
+
+async def process_candidate_users(candidate_users_raw: List[str]) -> Optional[List[str]]:
+    """
+    Process candidate users list, converting IAM IDs to email addresses.
+    
+    Args:
+        candidate_users_raw: Raw list of IAM IDs
+        
+    Returns:
+        List of email addresses if successful, None if input is None or empty list
+    """
+    if not isinstance(candidate_users_raw, list) or len(candidate_users_raw) == 0:
+        return map_candidate_users(candidate_users_raw, {})
     
-    return processed_users
\ No newline at end of file
+    emails = await resolve_iam_ids_to_emails(candidate_users_raw, "candidate_user")
+    return map_candidate_users(candidate_users_raw, emails)
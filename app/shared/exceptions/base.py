@@ -35,6 +35,10 @@ class ServiceError(MCPServiceError):
     """General service error for business logic failures."""
 
 
+class CircuitOpenError(ServiceError):
+    """Call rejected without contacting the upstream service because its circuit breaker is open."""
+
+
 class ConfigurationError(MCPServiceError):
     """Configuration-related errors like missing settings or invalid config."""
 
@@ -46,5 +50,14 @@ class ValidationError(MCPServiceError):
 class ExternalAPIError(MCPServiceError):
     """External API communication errors like timeouts or HTTP failures."""
 
+
+class ResponseTooLargeError(ExternalAPIError):
+    """External API response body larger than the configured maximum size."""
+
+
+class DeadlineExceededError(ExternalAPIError):
+    """External API call not started, or timed out, because the time budget of the tool call is spent."""
+
+
 class HostedMcpError(MCPServiceError):
     """Hosted MCP failures."""
@@ -9,6 +9,9 @@ from .constants import (
     BUILD_VERSION,
     DEFAULT_PARAMETERS,
     LOG_FILE_PATH,
+    LOG_QUEUE_ENABLED,
+    LOG_QUEUE_SIZE,
+    LOG_QUEUE_OVERFLOW,
     parameter_values,
     set_parameter_value
 )
@@ -21,6 +24,13 @@ from .filter import (
     set_trace_id,
 )
 
+from .formatter import JsonFormatter
+
+from .queue_handler import (
+    NonBlockingQueueHandler,
+    OverflowPolicy,
+)
+
 from .utils import (
     setup_logging,
     get_logger,
@@ -46,6 +56,9 @@ __all__ = [
     "BUILD_VERSION",
     "DEFAULT_PARAMETERS",
     "LOG_FILE_PATH",
+    "LOG_QUEUE_ENABLED",
+    "LOG_QUEUE_SIZE",
+    "LOG_QUEUE_OVERFLOW",
     "parameter_values",
     "set_parameter_value",
     
@@ -56,6 +69,11 @@ __all__ = [
     "set_transaction_id",
     "set_trace_id",
     
+    # Formatting and queueing
+    "JsonFormatter",
+    "NonBlockingQueueHandler",
+    "OverflowPolicy",
+
     # Utils
     "setup_logging",
     "get_logger",
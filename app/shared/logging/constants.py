@@ -32,6 +32,9 @@ CONTAINER_NAME = "container_name"
 ENVIRONMENT = "environment"
 BUILD_VERSION = "build_version"
 LOG_FILE_PATH = "log_file_path"
+LOG_QUEUE_ENABLED = "log_queue_enabled"
+LOG_QUEUE_SIZE = "log_queue_size"
+LOG_QUEUE_OVERFLOW = "log_queue_overflow"
 
 # Default parameter values
 DEFAULT_PARAMETERS = {
@@ -41,6 +44,9 @@ DEFAULT_PARAMETERS = {
     ENVIRONMENT: ["development", False, str],
     BUILD_VERSION: ["1.3.0", False, str],
     LOG_FILE_PATH: [None, False, str],
+    LOG_QUEUE_ENABLED: [True, False, bool],
+    LOG_QUEUE_SIZE: [10000, False, int],
+    LOG_QUEUE_OVERFLOW: ["drop_new", False, str],
 }
 
 # Global parameter storage
@@ -82,6 +88,9 @@ def _convert_value_to_type(value: str, param_type: type) -> Any:
     Returns:
         Any: The converted value
     """
+    # Values from the Pydantic settings are already typed
+    if isinstance(value, param_type):
+        return value
     if param_type is bool:
         return value.lower() in ('true', '1', 'yes', 'on')
     elif param_type is int:
@@ -0,0 +1,69 @@
+# Copyright [2026] [IBM]
+# Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+# See the LICENSE file in the project root for license information.
+
+"""
+Structured JSON log formatter.
+
+Each record is written as one JSON object per line. Messages are escaped by
+the JSON encoder, so quotes, backslashes and newlines in messages or
+tracebacks no longer produce invalid lines.
+"""
+
+import json
+import logging
+from typing import Any, Dict
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats log records as single-line JSON objects.
+
+    The keys match the previous string-template JSON format, so existing log
+    parsers keep working. Tracebacks are added under ``exception`` and stack
+    information under ``stack_info``.
+    """
+
+    def __init__(self, environment: str, build_version: str):
+        """
+        Args:
+            environment: Value of the ``environment`` field
+            build_version: Value of the ``build_version`` field
+        """
+        super().__init__()
+        self.environment = environment
+        self.build_version = build_version
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a log record as a JSON object.
+
+        Args:
+            record: The log record to format
+
+        Returns:
+            str: The JSON encoded record
+        """
+        entry: Dict[str, Any] = {
+            "environment": self.environment,
+            "build_version": self.build_version,
+            "timestamp": self.formatTime(record),
+            "appname": record.name,
+            "loglevel": record.levelname,
+            "message": record.getMessage(),
+            "threadId": str(record.thread),
+            "thread": record.threadName,
+            "sequence_number": str(getattr(record, "sequence_number", "")),
+            "transaction_id": getattr(record, "transaction_id", ""),
+            "trace_id": getattr(record, "trace_id", ""),
+            "line": str(record.lineno),
+            "method_name": record.funcName,
+            "class_name": record.module,
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        if record.stack_info:
+            entry["stack_info"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
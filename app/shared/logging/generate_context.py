@@ -14,6 +14,11 @@ import time
 import functools
 from typing import Optional, Callable
 
+from app.core.auth_context import reset_auth_context, start_auth_context
+from app.core.deadline import deadline_scope
+from app.core.metrics import record_tool_call
+from app.core.settings import settings
+from app.core.tracing import SPAN_KIND_SERVER, start_span, trace_id_from_transaction_id
 from .filter import (
     set_transaction_id,
     set_trace_id
@@ -46,26 +51,41 @@ def with_request_context(
             # Set context variables
             set_transaction_id(final_transaction_id)
             set_trace_id(final_trace_id)
+
+            # Token and claims are resolved at most once per tool call
+            auth_context_token = start_auth_context()
             
             # Log the start of the tool call
-            LOGGER.info(f"Tool call started - {func.__name__}")
+            LOGGER.info("Tool call started - %s", func.__name__)
             
             start_time = time.perf_counter()
             
             try:
-                # Call the original function
-                result = await func(*args, **kwargs)
+                # Upstream requests of the call are recorded as child spans and share its time budget
+                with start_span(
+                    func.__name__,
+                    kind=SPAN_KIND_SERVER,
+                    attributes={"mcp.tool": func.__name__, "wxdi.trace_id": final_trace_id},
+                    trace_id=trace_id_from_transaction_id(final_transaction_id),
+                ), deadline_scope(settings.tool_call_deadline_s):
+                    # Call the original function
+                    result = await func(*args, **kwargs)
                 
                 execution_time = time.perf_counter() - start_time
-                LOGGER.info(f"Tool call completed - {func.__name__} in {execution_time:.3f}s")
+                LOGGER.info("Tool call completed - %s in %.3fs", func.__name__, execution_time)
+                record_tool_call(func.__name__, execution_time, failed=False)
                 
                 return result
                 
             except Exception as e:
                 execution_time = time.perf_counter() - start_time
-                LOGGER.error(f"Tool call failed - {func.__name__} in {execution_time:.3f}s, error={str(e)}")
+                LOGGER.error("Tool call failed - %s in %.3fs, error=%s", func.__name__, execution_time, str(e))
+                record_tool_call(func.__name__, execution_time, failed=True)
                 raise
 
+            finally:
+                reset_auth_context(auth_context_token)
+
         return context_wrapper
     
     return decorator
@@ -0,0 +1,185 @@
+# Copyright [2026] [IBM]
+# Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+# See the LICENSE file in the project root for license information.
+
+"""
+Non-blocking logging pipeline.
+
+Log calls on the event loop only put the record on a bounded in-memory queue;
+a background thread formats the records and writes them to the file or
+console handlers. A slow disk therefore no longer stalls tool calls.
+
+- Records are enqueued unformatted. Messages whose arguments are immutable
+  values are merged on the writer thread; other arguments are merged when the
+  record is enqueued, so later changes to them do not show up in the log.
+- Traceability IDs are read from the caller's context by the filters on the
+  queue handler, before the record leaves the event loop thread.
+- When the queue is full the overflow policy decides what happens: drop the
+  new record, drop the oldest queued record, or block until there is room. The
+  number of dropped records is logged once the queue accepts records again.
+"""
+
+import atexit
+import copy
+import logging
+import queue
+from enum import Enum
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional
+
+# Argument types that can be merged into the message on the writer thread
+IMMUTABLE_ARG_TYPES = (str, int, float, bool, bytes, type(None), Enum)
+
+
+class OverflowPolicy(str, Enum):
+    """What to do with a record when the log queue is full."""
+
+    DROP_NEW = "drop_new"
+    DROP_OLDEST = "drop_oldest"
+    BLOCK = "block"
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """Queue handler with a bounded queue, an overflow policy and deferred formatting."""
+
+    def __init__(self, log_queue: queue.Queue, overflow_policy: OverflowPolicy = OverflowPolicy.DROP_NEW):
+        """
+        Args:
+            log_queue: Bounded queue shared with the listener
+            overflow_policy: What to do with a record when the queue is full
+        """
+        super().__init__(log_queue)
+        self.overflow_policy = overflow_policy
+        self.dropped_count = 0
+        self._unreported_drops = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Prepare a record for the queue without formatting it.
+
+        Args:
+            record: The record to enqueue
+
+        Returns:
+            logging.LogRecord: A copy of the record that is safe to format on another thread
+        """
+        record = copy.copy(record)
+        if not isinstance(record.msg, str) or (
+            record.args
+            and not (isinstance(record.args, tuple) and all(isinstance(arg, IMMUTABLE_ARG_TYPES) for arg in record.args))
+        ):
+            # Mutable arguments may change before the writer thread gets to the record
+            record.msg = record.getMessage()
+            record.args = None
+        if record.exc_info:
+            # Do not keep the traceback's frames alive while the record is queued
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """
+        Put a record on the queue, applying the overflow policy when it is full.
+
+        Args:
+            record: The prepared record
+        """
+        if self.overflow_policy == OverflowPolicy.BLOCK:
+            self.queue.put(record)
+            return
+
+        if self._unreported_drops:
+            self._report_drops(record)
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if self.overflow_policy == OverflowPolicy.DROP_OLDEST:
+                self._replace_oldest(record)
+            self._unreported_drops += 1
+            self.dropped_count += 1
+
+    def _replace_oldest(self, record: logging.LogRecord) -> None:
+        """Drop the oldest queued record to make room for a new one."""
+        try:
+            self.queue.get_nowait()
+        except queue.Empty:
+            # The writer thread emptied the queue in the meantime
+            pass
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # Another thread filled the freed slot, drop the new record instead
+            pass
+
+    def _report_drops(self, record: logging.LogRecord) -> None:
+        """Log how many records were dropped since the last report, if there is room for it."""
+        report = logging.makeLogRecord(
+            {
+                "name": record.name,
+                "levelno": logging.WARNING,
+                "levelname": logging.getLevelName(logging.WARNING),
+                "msg": "Log queue full, dropped %d log records",
+                "args": (self._unreported_drops,),
+                "sequence_number": getattr(record, "sequence_number", ""),
+                "transaction_id": "",
+                "trace_id": "",
+            }
+        )
+        try:
+            self.queue.put_nowait(report)
+            self._unreported_drops = 0
+        except queue.Full:
+            pass
+
+
+class BlockingStopQueueListener(QueueListener):
+    """Queue listener whose stop waits for room in a full queue and can be called more than once."""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            super().stop()
+
+
+def start_queue_logging(
+    handlers: List[logging.Handler],
+    queue_size: int,
+    overflow_policy: str,
+    filters: Optional[List[logging.Filter]] = None,
+) -> NonBlockingQueueHandler:
+    """
+    Start a background thread writing log records to the given handlers.
+
+    Args:
+        handlers: Handlers that write the records (file or console)
+        queue_size: Maximum number of queued records
+        overflow_policy: "drop_new", "drop_oldest" or "block"
+        filters: Filters that need the caller's context, applied before enqueueing
+
+    Returns:
+        NonBlockingQueueHandler: The handler to attach to the logger
+
+    Raises:
+        ValueError: If the overflow policy is unknown
+    """
+    try:
+        policy = OverflowPolicy(overflow_policy)
+    except ValueError:
+        raise ValueError(
+            f"Invalid log queue overflow policy '{overflow_policy}'. "
+            f"Supported policies: {[p.value for p in OverflowPolicy]}"
+        ) from None
+
+    log_queue: queue.Queue = queue.Queue(maxsize=max(queue_size, 1))
+    queue_handler = NonBlockingQueueHandler(log_queue, policy)
+    for log_filter in filters or []:
+        queue_handler.addFilter(log_filter)
+
+    listener = BlockingStopQueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    # Flush the queued records on interpreter exit
+    atexit.register(listener.stop)
+    queue_handler.listener = listener
+    return queue_handler
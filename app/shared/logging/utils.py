@@ -25,10 +25,15 @@ from .constants import (
     ENVIRONMENT,
     BUILD_VERSION,
     LOG_FILE_PATH,
+    LOG_QUEUE_ENABLED,
+    LOG_QUEUE_SIZE,
+    LOG_QUEUE_OVERFLOW,
     set_parameter_value,
     parameter_values
 )
 from .filter import LoggingTraceabilityFilter
+from .formatter import JsonFormatter
+from .queue_handler import start_queue_logging
 
 def setup_logging(
     logger_name: Optional[str] = None,
@@ -41,6 +46,8 @@ def setup_logging(
 
     This function sets up a logger with either human-readable or JSON format,
     includes traceability information, and configures appropriate handlers.
+    Unless LOG_QUEUE_ENABLED is false, the handlers are fed from a bounded
+    queue by a background thread, so logging never blocks the event loop.
 
     Args:
         logger_name: Name for the logger (defaults to container name from config)
@@ -98,35 +105,25 @@ def setup_logging(
         ch = logging.StreamHandler(sys.stderr)
 
     # Configure formatter based on format type
+    traceability_filters = []
     if final_log_format == HUMAN_LOGGING:
         formatter = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
     elif final_log_format == JSON_LOGGING:
-        formatter = logging.Formatter(
-            '{"environment": "'
-            + parameter_values[ENVIRONMENT]
-            + '", "build_version": "'
-            + parameter_values[BUILD_VERSION]
-            + '", "timestamp": "%(asctime)s", "appname": "%(name)s"'
-            + ', "loglevel": "%(levelname)s", "message": "%(message)s"'
-            + ', "threadId": "%(thread)d", "thread": "%(threadName)s"'
-            + ', "sequence_number": "%(sequence_number)d"'
-            + ', "transaction_id": "%(transaction_id)s"'
-            + ', "trace_id": "%(trace_id)s"'
-            + '", "line": "%(lineno)d", "method_name": "%(funcName)s"'
-            + ', "class_name": "%(module)s"'
-            + '"}'
+        formatter = JsonFormatter(
+            environment=parameter_values[ENVIRONMENT],
+            build_version=parameter_values[BUILD_VERSION],
         )
         # Add traceability filter for JSON logging
-        ch.addFilter(LoggingTraceabilityFilter())
+        traceability_filters.append(LoggingTraceabilityFilter())
     else:
         # Custom format provided
         formatter = logging.Formatter(final_log_format)
 
-    # Set formatter and add handler
+    # Set formatter on the handler that writes the records
     ch.setFormatter(formatter)
-    logger.addHandler(ch)
+    handlers = [ch]
 
     if final_log_file_path:
         # Add console handler for ERROR and CRITICAL levels
@@ -136,7 +133,24 @@ def setup_logging(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
         console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
+
+    if parameter_values[LOG_QUEUE_ENABLED]:
+        # Records are written by a background thread; the traceability filter
+        # must run before enqueueing as it reads the caller's context
+        logger.addHandler(
+            start_queue_logging(
+                handlers,
+                queue_size=parameter_values[LOG_QUEUE_SIZE],
+                overflow_policy=parameter_values[LOG_QUEUE_OVERFLOW],
+                filters=traceability_filters,
+            )
+        )
+    else:
+        for log_filter in traceability_filters:
+            ch.addFilter(log_filter)
+        for handler in handlers:
+            logger.addHandler(handler)
 
     return logger
 
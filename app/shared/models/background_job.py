@@ -0,0 +1,48 @@
+# Copyright [2026] [IBM]
+# Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+# See the LICENSE file in the project root for license information.
+
+"""Models of background jobs started by long-running tools."""
+
+from enum import Enum
+from typing import Any, Optional
+
+from pydantic import Field
+
+from app.shared.models.base_response import BaseResponseModel
+
+
+class BackgroundJobStatus(str, Enum):
+    """Lifecycle states of a background job."""
+
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class BackgroundJobHandle(BaseResponseModel):
+    """Returned by a tool that started its work as a background job."""
+
+    job_id: str = Field(..., description="ID of the background job.")
+    tool: str = Field(..., description="Name of the tool running in the background.")
+    status: BackgroundJobStatus = Field(..., description="Current status of the job.")
+    message: str = Field(..., description="How to follow the job.")
+
+
+class BackgroundJobInfo(BaseResponseModel):
+    """Status, progress and result of a background job."""
+
+    job_id: str = Field(..., description="ID of the background job.")
+    tool: str = Field(..., description="Name of the tool running in the background.")
+    status: BackgroundJobStatus = Field(..., description="Current status of the job.")
+    created_at: str = Field(..., description="Time the job was started (ISO 8601).")
+    finished_at: Optional[str] = Field(None, description="Time the job finished (ISO 8601), if it did.")
+    progress: Optional[float] = Field(None, description="Progress reported by the job, out of total.")
+    total: Optional[float] = Field(None, description="Total the progress counts towards, if known.")
+    progress_message: Optional[str] = Field(None, description="Latest progress message of the job.")
+    result: Optional[Any] = Field(None, description="Result of the tool, once the job succeeded.")
+    failure_reason: Optional[str] = Field(None, description="Why the job failed or was cancelled.")
+    expires_at: Optional[str] = Field(
+        None, description="Time the finished job and its result are discarded (ISO 8601)."
+    )
@@ -0,0 +1,288 @@
+# Copyright [2026] [IBM]
+# Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+# See the LICENSE file in the project root for license information.
+
+"""
+Waiting for upstream jobs and operations to reach a state.
+
+``wait_for`` checks the condition right away, then polls with exponential
+backoff and decorrelated jitter: each delay is drawn between the initial delay
+and ``backoff_factor + 1`` times the previous one, capped at the maximum
+delay. Fast jobs are seen as soon as they finish and slow ones are polled less
+and less often.
+
+- Waiters passing the same ``key`` share one poller, so concurrent tool calls
+  waiting for the same job send one status request per poll instead of one
+  each. Keys are scoped to a hash of the caller's access token; callers never
+  share the responses of another user's requests.
+- Every waiter gets each poll result in its own task, through its ``on_poll``
+  callback. ``report_progress_to_client`` builds a callback sending MCP
+  progress notifications for the current tool call, or recording the progress
+  of the current background job (see ``app.shared.utils.job_registry``).
+- A waiter gives up at its own timeout, or earlier at the deadline of its tool
+  call (see ``app.core.deadline``). The shared poller runs outside of the
+  deadline of the tool call that started it, so it keeps serving the other
+  waiters after that call gives up; it stops when its last waiter leaves.
+"""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Generic, Hashable, Optional, TypeVar
+
+from fastmcp.server.dependencies import get_context
+
+from app.core.auth import get_access_token
+from app.core.auth_context import get_token_hash
+from app.core.deadline import deadline_scope, get_remaining_time
+from app.core.metrics import MetricFamily, get_metrics_registry
+from app.shared.logging import LOGGER
+from app.shared.utils.job_registry import get_current_job
+
+T = TypeVar("T")
+
+DEFAULT_INITIAL_DELAY_S = 0.5
+DEFAULT_MAX_DELAY_S = 10.0
+DEFAULT_BACKOFF_FACTOR = 2.0
+
+
+@dataclass
+class PollState(Generic[T]):
+    """Result of the latest poll of a waited-for condition."""
+
+    value: Optional[T]
+    error: Optional[Exception]
+    attempts: int
+    elapsed_s: float
+    # The condition is met
+    done: bool = False
+    # No poll follows: the condition is met, check raised an error that is not retried, or the attempts ran out
+    final: bool = False
+
+
+PollCallback = Callable[[PollState], Awaitable[None]]
+
+
+class _Poller(Generic[T]):
+    """Polls a condition and hands every result to the queues of its waiters."""
+
+    def __init__(
+        self,
+        label: str,
+        check: Callable[[], Awaitable[T]],
+        is_done: Callable[[T], bool],
+        initial_delay_s: float,
+        max_delay_s: float,
+        backoff_factor: float,
+        retry_errors: bool,
+        max_attempts: Optional[int],
+    ) -> None:
+        self.label = label
+        self._check = check
+        self._is_done = is_done
+        self._initial_delay_s = initial_delay_s
+        self._max_delay_s = max(initial_delay_s, max_delay_s)
+        self._backoff_factor = backoff_factor
+        self._retry_errors = retry_errors
+        self._max_attempts = max_attempts
+        self.queues: set[asyncio.Queue] = set()
+        self.last_state: Optional[PollState[T]] = None
+        self.task: Optional[asyncio.Task] = None
+
+    def _next_delay(self, previous_delay: float) -> float:
+        upper = max(self._initial_delay_s, previous_delay * (self._backoff_factor + 1))
+        return min(random.uniform(self._initial_delay_s, upper), self._max_delay_s)
+
+    async def run(self) -> None:
+        start = time.monotonic()
+        attempts = 0
+        delay = self._initial_delay_s
+        polls = get_metrics_registry().counter("waiter_polls_total", "Status polls sent by waiters", ["waiter"])
+        while True:
+            attempts += 1
+            polls.inc(self.label)
+            exhausted = self._max_attempts is not None and attempts >= self._max_attempts
+            try:
+                value = await self._check()
+                done = self._is_done(value)
+                state = PollState(value, None, attempts, time.monotonic() - start, done, final=done or exhausted)
+            except Exception as e:
+                state = PollState(None, e, attempts, time.monotonic() - start, final=not self._retry_errors or exhausted)
+            self.last_state = state
+            for queue in self.queues:
+                queue.put_nowait(state)
+            if state.final:
+                return
+            delay = self._next_delay(delay)
+            await asyncio.sleep(delay)
+
+
+# Shared pollers by (key, hash of the caller's access token)
+_pollers: dict[tuple[Hashable, str], _Poller] = {}
+
+
+async def wait_for(
+    check: Callable[[], Awaitable[T]],
+    is_done: Callable[[T], bool],
+    timeout_s: Optional[float] = None,
+    key: Optional[Hashable] = None,
+    label: str = "waiter",
+    initial_delay_s: float = DEFAULT_INITIAL_DELAY_S,
+    max_delay_s: float = DEFAULT_MAX_DELAY_S,
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+    retry_errors: bool = False,
+    max_attempts: Optional[int] = None,
+    on_poll: Optional[PollCallback] = None,
+) -> PollState[T]:
+    """
+    Poll a condition until it is met or the timeout passes.
+
+    The first check runs immediately. When another waiter of the same caller
+    already polls the same key, its poller is joined instead of starting a new one.
+
+    Args:
+        check: Coroutine function fetching the current state (e.g. a job status)
+        is_done: Function telling whether a state ends the wait
+        timeout_s: Longest time to wait, shortened by the deadline of the tool call; None for the deadline only
+        key: Identifies what is waited for (e.g. ("glossary_import", process_id)); None to never share the poller
+        label: Name used in log messages and metrics
+        initial_delay_s: Shortest delay between polls
+        max_delay_s: Longest delay between polls
+        backoff_factor: Growth of the delay between polls
+        retry_errors: Keep polling when check raises, instead of raising the error
+        max_attempts: Most polls to send, None for no limit
+        on_poll: Coroutine function called with the state of every poll
+
+    Returns:
+        PollState: The state that met the condition (done=True), or the latest
+                   state when the timeout passed or the attempts ran out (done=False,
+                   with the latest error if the last poll failed and errors are retried)
+
+    Raises:
+        Exception: The error raised by the last check, when errors are not retried
+                   or the attempts ran out on an error
+    """
+    remaining = get_remaining_time()
+    if remaining is not None:
+        timeout_s = max(remaining, 0.0) if timeout_s is None else min(timeout_s, max(remaining, 0.0))
+    end = None if timeout_s is None else time.monotonic() + timeout_s
+
+    poller_key = None
+    poller = None
+    if key is not None:
+        poller_key = (key, get_token_hash(await get_access_token()))
+        poller = _pollers.get(poller_key)
+        if poller is not None:
+            LOGGER.debug(f"{label}: joining the poller of {key}")
+    if poller is None:
+        poller = _Poller(
+            label, check, is_done, initial_delay_s, max_delay_s, backoff_factor, retry_errors, max_attempts
+        )
+        if poller_key is not None:
+            _pollers[poller_key] = poller
+
+    queue: asyncio.Queue[PollState[T]] = asyncio.Queue()
+    poller.queues.add(queue)
+    if poller.task is None:
+        # Every waiter applies its own deadline below; the poller serves them all
+        with deadline_scope(None, detach=True):
+            poller.task = asyncio.create_task(poller.run())
+    elif poller.last_state is not None:
+        queue.put_nowait(poller.last_state)
+
+    state: Optional[PollState[T]] = None
+    try:
+        while True:
+            try:
+                state = await asyncio.wait_for(queue.get(), None if end is None else max(end - time.monotonic(), 0.0))
+            except asyncio.TimeoutError:
+                break
+            if on_poll is not None:
+                await on_poll(state)
+            if state.final:
+                if state.error is not None:
+                    raise state.error
+                return state
+    finally:
+        poller.queues.discard(queue)
+        if not poller.queues:
+            if poller_key is not None and _pollers.get(poller_key) is poller:
+                del _pollers[poller_key]
+            if not poller.task.done():
+                poller.task.cancel()
+
+    LOGGER.info(f"{label}: gave up after {timeout_s:.1f}s")
+    latest = poller.last_state or state
+    if latest is None:
+        return PollState(None, None, 0, timeout_s)
+    return PollState(latest.value, latest.error, latest.attempts, latest.elapsed_s)
+
+
+def report_progress_to_client(
+    describe: Callable[[PollState], str],
+    total: Optional[float] = None,
+) -> Optional[PollCallback]:
+    """
+    Build an on_poll callback sending MCP progress notifications for the current tool call.
+
+    Must be called from the tool call itself, which the callback reports to.
+    Clients only receive the notifications if they sent a progress token.
+    Within a background job the progress is recorded on the job instead, and
+    forwarded to the callers waiting for it.
+
+    Args:
+        describe: Function building the progress message of a poll state
+        total: Expected duration in seconds, reported as the progress total
+
+    Returns:
+        PollCallback: The callback, or None outside of a tool call
+    """
+    job = get_current_job()
+    if job is not None:
+        async def record(state: PollState) -> None:
+            job.update_progress(state.elapsed_s, total, describe(state))
+
+        return record
+
+    try:
+        ctx = get_context()
+    except RuntimeError:
+        return None
+
+    async def report(state: PollState) -> None:
+        try:
+            await ctx.report_progress(state.elapsed_s, total, describe(state))
+        except Exception as e:
+            LOGGER.debug(f"Failed to send progress notification: {e}")
+
+    return report
+
+
+def describe_status(state: PollState[Any], get_status: Callable[[Any], Any]) -> str:
+    """
+    Describe a poll state for progress notifications.
+
+    Args:
+        state: The poll state
+        get_status: Function reading the status from a polled value
+
+    Returns:
+        str: e.g. "Status RUNNING after 12s (4 checks)"
+    """
+    status = f"error: {state.error}" if state.error is not None else f"Status {get_status(state.value)}"
+    return f"{status} after {state.elapsed_s:.0f}s ({state.attempts} checks)"
+
+
+def _collect_waiter_metrics() -> list[MetricFamily]:
+    """Report the shared pollers and the waiters attached to them."""
+    waiters = MetricFamily("waiters_active", "Waiters attached to a shared poller", label_names=("waiter",))
+    counts: dict[str, int] = {}
+    for poller in _pollers.values():
+        counts[poller.label] = counts.get(poller.label, 0) + len(poller.queues)
+    for label, count in counts.items():
+        waiters.add(count, label)
+    return [waiters]
+
+
+get_metrics_registry().register_collector("async_waiter", _collect_waiter_metrics)
@@ -0,0 +1,149 @@
+# Copyright [2026] [IBM]
+# Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+# See the LICENSE file in the project root for license information.
+
+"""
+Concurrent batch executor with adaptive batch sizes.
+
+Items are split into batches that run concurrently, up to a limit. After
+each batch the size of the next batches is adjusted:
+
+- a batch without failures that took less than half the target latency
+  grows the batch size by one
+- a batch slower than the target latency, or with more failed items than
+  the allowed failure rate, halves it
+
+The first ``probe_batches`` batches all complete, and are reported, before
+any further batch starts. A caller that stops early from ``on_batch`` (for
+example when the first batches all failed) therefore does not send more
+requests than a serial loop would.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Generic, Optional, Sequence, TypeVar
+
+from app.shared.logging import LOGGER
+
+T = TypeVar("T")
+
+
+@dataclass
+class BatchOutcome(Generic[T]):
+    """Result of a single batch."""
+
+    number: int
+    items: list[T]
+    succeeded: list[T] = field(default_factory=list)
+    failed: list[T] = field(default_factory=list)
+    latency_s: float = 0.0
+
+
+class AdaptiveBatchExecutor(Generic[T]):
+    """Runs batches of items concurrently, adapting the batch size to latency and failures."""
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        initial_batch_size: int,
+        max_batch_size: int,
+        target_latency_s: float,
+        min_batch_size: int = 1,
+        max_failure_rate: float = 0.5,
+        label: str = "batch",
+    ) -> None:
+        """
+        Args:
+            max_concurrency: Batches running at the same time
+            initial_batch_size: Size of the first batches
+            max_batch_size: Upper bound of the batch size
+            target_latency_s: Batch latency above which the batch size shrinks
+            min_batch_size: Lower bound of the batch size
+            max_failure_rate: Share of failed items in a batch above which the batch size shrinks
+            label: Name used in log messages
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_batch_size = max(1, min_batch_size)
+        self.max_batch_size = max(self.min_batch_size, max_batch_size)
+        self.batch_size = min(max(initial_batch_size, self.min_batch_size), self.max_batch_size)
+        self.target_latency_s = target_latency_s
+        self.max_failure_rate = max_failure_rate
+        self.label = label
+
+    def _adapt(self, outcome: BatchOutcome[T]) -> None:
+        failure_rate = len(outcome.failed) / len(outcome.items) if outcome.items else 0.0
+        if outcome.latency_s > self.target_latency_s or failure_rate > self.max_failure_rate:
+            new_size = max(self.min_batch_size, self.batch_size // 2)
+        elif not outcome.failed and outcome.latency_s < self.target_latency_s / 2:
+            new_size = min(self.max_batch_size, self.batch_size + 1)
+        else:
+            return
+        if new_size != self.batch_size:
+            LOGGER.debug(f"{self.label}: batch size {self.batch_size} -> {new_size}")
+            self.batch_size = new_size
+
+    async def run(
+        self,
+        items: Sequence[T],
+        run_batch: Callable[[list[T]], Awaitable[tuple[list[T], list[T]]]],
+        on_batch: Optional[Callable[[BatchOutcome[T]], None]] = None,
+        probe_batches: int = 0,
+    ) -> None:
+        """
+        Process all items in concurrent batches.
+
+        Args:
+            items: Items to process
+            run_batch: Coroutine function processing one batch, returning its succeeded and failed items
+            on_batch: Called with the outcome of every batch, in completion order; raising
+                      from it stops the executor
+            probe_batches: Leading batches that must all complete before more batches start
+
+        Raises:
+            Exception: The first error raised by run_batch or on_batch; batches still
+                       running are cancelled
+        """
+        total = len(items)
+        next_index = 0
+        started = 0
+        completed = 0
+        pending: set[asyncio.Task] = set()
+        done: set[asyncio.Task] = set()
+
+        async def execute(number: int, batch: list[T]) -> BatchOutcome[T]:
+            start = time.perf_counter()
+            succeeded, failed = await run_batch(batch)
+            return BatchOutcome(number, batch, succeeded, failed, time.perf_counter() - start)
+
+        try:
+            while next_index < total or pending:
+                while next_index < total and len(pending) < self.max_concurrency:
+                    if started >= probe_batches > completed:
+                        break
+                    batch = list(items[next_index:next_index + self.batch_size])
+                    next_index += len(batch)
+                    started += 1
+                    LOGGER.info(f"{self.label} {started}: items {next_index - len(batch) + 1}-{next_index} of {total}")
+                    pending.add(asyncio.create_task(execute(started, batch)))
+
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    outcome = task.result()
+                    completed += 1
+                    self._adapt(outcome)
+                    LOGGER.info(
+                        f"{self.label} {outcome.number} completed in {outcome.latency_s:.1f}s: "
+                        f"{len(outcome.succeeded)} successes, {len(outcome.failed)} failures"
+                    )
+                    if on_batch is not None:
+                        on_batch(outcome)
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
+            for task in done | pending:
+                # Errors of batches that finished alongside the one that stopped the executor
+                if not task.cancelled():
+                    task.exception()
@@ -0,0 +1,343 @@
+# Copyright [2026] [IBM]
+# Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+# See the LICENSE file in the project root for license information.
+
+"""
+Circuit breakers for outgoing IBM API calls, one per upstream host and endpoint family.
+
+A breaker watches the outcome of the most recent calls to its endpoint family
+(for example ``gov_lineage``):
+
+- closed: calls go through. Once the window holds enough calls and the share
+  of failed calls (5xx, connection errors, timeouts) or of slow calls crosses
+  its threshold, the breaker opens.
+- open: calls fail immediately with ``CircuitOpenError`` instead of waiting
+  for a concurrency slot and a timeout, so a degraded backend no longer holds
+  global semaphore slots needed by unrelated tools.
+- half-open: after the open period a few probe calls are let through. The
+  breaker closes when all of them succeed and opens again on the first failure.
+
+4xx responses, including 429, are answered by a healthy backend and do not
+count as failures.
+"""
+
+import time
+from collections import deque
+from enum import Enum
+from typing import Any
+
+from app.core.metrics import MetricFamily, get_metrics_registry
+from app.core.settings import settings
+from app.shared.exceptions.base import CircuitOpenError
+from app.shared.logging import LOGGER
+from app.shared.utils.concurrency_limiter import get_endpoint_key
+
+
+class CircuitState(str, Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+# Value of the state gauge in the metrics
+_STATE_VALUES = {CircuitState.CLOSED: 0, CircuitState.HALF_OPEN: 1, CircuitState.OPEN: 2}
+
+
+class _EndpointBreaker:
+    """Circuit breaker of a single endpoint family."""
+
+    def __init__(
+        self,
+        name: str,
+        window_size: int,
+        min_calls: int,
+        failure_rate: float,
+        slow_call_threshold_s: float,
+        slow_call_rate: float,
+        open_s: float,
+        half_open_probes: int,
+    ) -> None:
+        self.name = name
+        self.min_calls = max(1, min_calls)
+        self.failure_rate = failure_rate
+        self.slow_call_threshold_s = slow_call_threshold_s
+        self.slow_call_rate = slow_call_rate
+        self.open_s = open_s
+        self.half_open_probes = max(1, half_open_probes)
+        self.state = CircuitState.CLOSED
+        self.opened_count = 0
+        self.rejected_count = 0
+        # (failed, slow) of the most recent calls while closed
+        self._outcomes: deque[tuple[bool, bool]] = deque(maxlen=max(window_size, self.min_calls))
+        self._failures = 0
+        self._slow_calls = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+
+    def before_call(self) -> bool:
+        """
+        Let a call through or reject it.
+
+        Returns:
+            bool: True if the call is a half-open probe
+
+        Raises:
+            CircuitOpenError: If the breaker is open or all probes are taken
+        """
+        if self.state == CircuitState.OPEN:
+            if time.monotonic() - self._opened_at < self.open_s:
+                raise self._reject()
+            self.state = CircuitState.HALF_OPEN
+            self._probes_in_flight = 0
+            self._probe_successes = 0
+            LOGGER.info("Circuit breaker for %s half-open, probing the upstream", self.name)
+
+        if self.state == CircuitState.HALF_OPEN:
+            if self._probes_in_flight + self._probe_successes >= self.half_open_probes:
+                raise self._reject()
+            self._probes_in_flight += 1
+            return True
+        return False
+
+    def record(self, is_probe: bool, failed: bool, latency: float | None) -> None:
+        """
+        Record the outcome of a call let through by before_call.
+
+        Args:
+            is_probe: Whether the call was a half-open probe
+            failed: Whether the upstream failed (5xx, connection error, timeout)
+            latency: Time until the response was read, in seconds (None for failures without a response)
+        """
+        slow = latency is not None and latency > self.slow_call_threshold_s
+        if is_probe:
+            self.release_probe()
+            if self.state != CircuitState.HALF_OPEN:
+                return
+            if failed or slow:
+                self._open("probe call failed" if failed else "probe call was slow")
+                return
+            self._probe_successes += 1
+            if self._probe_successes >= self.half_open_probes:
+                self._close()
+            return
+
+        if self.state != CircuitState.CLOSED:
+            # Result of a call that started before the breaker opened
+            return
+        if len(self._outcomes) == self._outcomes.maxlen:
+            old_failed, old_slow = self._outcomes[0]
+            self._failures -= old_failed
+            self._slow_calls -= old_slow
+        self._outcomes.append((failed, slow))
+        self._failures += failed
+        self._slow_calls += slow
+
+        calls = len(self._outcomes)
+        if calls < self.min_calls:
+            return
+        if self._failures * 100 >= self.failure_rate * calls:
+            self._open(f"{self._failures}/{calls} calls failed")
+        elif self._slow_calls * 100 >= self.slow_call_rate * calls:
+            self._open(f"{self._slow_calls}/{calls} calls took longer than {self.slow_call_threshold_s}s")
+
+    def release_probe(self) -> None:
+        """Give back the probe slot of a call that ended or was abandoned (cancelled, rejected body)."""
+        # Probes of an earlier half-open period were already forgotten when the breaker reopened
+        self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def _open(self, reason: str) -> None:
+        self.state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self.opened_count += 1
+        self._reset_window()
+        LOGGER.warning(
+            "Circuit breaker for %s opened (%s), failing calls fast for %.0fs", self.name, reason, self.open_s
+        )
+
+    def _close(self) -> None:
+        self.state = CircuitState.CLOSED
+        self._reset_window()
+        LOGGER.info("Circuit breaker for %s closed, upstream recovered", self.name)
+
+    def _reset_window(self) -> None:
+        self._outcomes.clear()
+        self._failures = 0
+        self._slow_calls = 0
+
+    def _reject(self) -> CircuitOpenError:
+        self.rejected_count += 1
+        retry_in = max(0.0, self.open_s - (time.monotonic() - self._opened_at))
+        return CircuitOpenError(
+            f"Upstream service {self.name} is unavailable: its circuit breaker is open after repeated failures",
+            service=self.name,
+            remediation_steps=f"The service is failing or overloaded. Try again in about {max(1, round(retry_in))}s.",
+        )
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the current state of this breaker."""
+        return {
+            "state": self.state.value,
+            "calls": len(self._outcomes),
+            "failures": self._failures,
+            "slow_calls": self._slow_calls,
+            "opened_count": self.opened_count,
+            "rejected_count": self.rejected_count,
+        }
+
+
+class BreakerCall:
+    """
+    A single call guarded by a circuit breaker. Use as a context manager around the
+    upstream call and report the outcome with ``record_status`` or ``record_failure``.
+    """
+
+    def __init__(self, breaker: _EndpointBreaker | None) -> None:
+        self._breaker = breaker
+        self._is_probe = False
+        self._recorded = False
+
+    def __enter__(self) -> "BreakerCall":
+        if self._breaker is not None:
+            self._is_probe = self._breaker.before_call()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        if self._breaker is not None and self._is_probe and not self._recorded:
+            self._breaker.release_probe()
+        return False
+
+    def record_status(self, status_code: int, latency: float) -> None:
+        """Record the HTTP status code and latency of the upstream response."""
+        self._record(status_code >= 500, latency)
+
+    def record_failure(self) -> None:
+        """Record a connection-level failure (timeout, reset, refused)."""
+        self._record(True, None)
+
+    def _record(self, failed: bool, latency: float | None) -> None:
+        if self._breaker is None or self._recorded:
+            return
+        self._recorded = True
+        self._breaker.record(self._is_probe, failed, latency)
+
+
+class CircuitBreakerRegistry:
+    """Registry of circuit breakers keyed by upstream host and endpoint family."""
+
+    def __init__(
+        self,
+        window_size: int,
+        min_calls: int,
+        failure_rate: float,
+        slow_call_threshold_s: float,
+        slow_call_rate: float,
+        open_s: float,
+        half_open_probes: int,
+    ) -> None:
+        self._config = {
+            "window_size": window_size,
+            "min_calls": min_calls,
+            "failure_rate": failure_rate,
+            "slow_call_threshold_s": slow_call_threshold_s,
+            "slow_call_rate": slow_call_rate,
+            "open_s": open_s,
+            "half_open_probes": half_open_probes,
+        }
+        self._breakers: dict[tuple[str, str], _EndpointBreaker] = {}
+
+    def _get_breaker(self, key: tuple[str, str]) -> _EndpointBreaker:
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = _EndpointBreaker("/".join(key), **self._config)
+            self._breakers[key] = breaker
+        return breaker
+
+    def call(self, url: str) -> BreakerCall:
+        """
+        Guard a call to the given URL.
+
+        Args:
+            url: Full request URL
+
+        Returns:
+            BreakerCall: Context manager raising CircuitOpenError on entry if the breaker is open
+        """
+        return BreakerCall(self._get_breaker(get_endpoint_key(url)))
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Get the state of every known breaker.
+
+        Returns:
+            dict: Mapping of "host/family" to the breaker's state and window counts
+        """
+        return {breaker.name: breaker.snapshot() for breaker in self._breakers.values()}
+
+
+_circuit_breaker_registry: CircuitBreakerRegistry | None = None
+
+
+def get_circuit_breaker_registry() -> CircuitBreakerRegistry:
+    """
+    Get the global circuit breaker registry instance (singleton pattern).
+
+    Returns:
+        CircuitBreakerRegistry: The global registry
+    """
+    global _circuit_breaker_registry
+    if _circuit_breaker_registry is None:
+        _circuit_breaker_registry = CircuitBreakerRegistry(
+            window_size=settings.circuit_breaker_window_size,
+            min_calls=settings.circuit_breaker_min_calls,
+            failure_rate=settings.circuit_breaker_failure_rate_percent,
+            slow_call_threshold_s=settings.circuit_breaker_slow_call_threshold_s,
+            slow_call_rate=settings.circuit_breaker_slow_call_rate_percent,
+            open_s=settings.circuit_breaker_open_s,
+            half_open_probes=settings.circuit_breaker_half_open_probes,
+        )
+    return _circuit_breaker_registry
+
+
+def _collect_circuit_breaker_metrics() -> list[MetricFamily]:
+    """Report the state, openings and rejected calls of every breaker."""
+    if _circuit_breaker_registry is None:
+        return []
+    state = MetricFamily(
+        "circuit_breaker_state",
+        "Circuit breaker state of an endpoint family (0 closed, 1 half-open, 2 open)",
+        label_names=("endpoint",),
+    )
+    opened = MetricFamily(
+        "circuit_breaker_opened_total", "Times the circuit breaker of an endpoint family opened", "counter", ("endpoint",)
+    )
+    rejected = MetricFamily(
+        "circuit_breaker_rejected_total", "Calls failed fast by an open circuit breaker", "counter", ("endpoint",)
+    )
+    for endpoint, stats in _circuit_breaker_registry.get_stats().items():
+        state.add(_STATE_VALUES[CircuitState(stats["state"])], endpoint)
+        opened.add(stats["opened_count"], endpoint)
+        rejected.add(stats["rejected_count"], endpoint)
+    return [state, opened, rejected]
+
+
+get_metrics_registry().register_collector("circuit_breaker", _collect_circuit_breaker_metrics)
+
+
+def get_circuit_breaker_call(url: str) -> BreakerCall:
+    """
+    Guard a call to the given URL with the global circuit breakers.
+
+    When circuit breakers are disabled the returned call does not guard anything.
+
+    Args:
+        url: Full request URL
+
+    Returns:
+        BreakerCall: Context manager raising CircuitOpenError on entry if the breaker is open
+    """
+    if not settings.circuit_breaker_enabled:
+        return BreakerCall(None)
+    return get_circuit_breaker_registry().call(url)
@@ -0,0 +1,345 @@
+# Copyright [2026] [IBM]
+# Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+# See the LICENSE file in the project root for license information.
+
+"""
+Adaptive per-endpoint concurrency limiter for outgoing IBM API calls.
+
+Each upstream host and endpoint family (for example ``api.dataplatform.cloud.ibm.com``
++ ``gov_lineage``) gets its own concurrency limit. Limits are tuned with an
+AIMD (additive increase, multiplicative decrease) policy:
+
+- every healthy response grows the limit by ``1 / limit`` (roughly +1 per window)
+- a 429, a 5xx, a connection failure, or a latency far above the observed
+  baseline shrinks the limit by ``backoff_ratio``
+
+This keeps slow backends such as lineage or glossary import from occupying every
+slot of the global IBM API semaphore, so fast lookups are not starved.
+"""
+
+import asyncio
+import re
+import time
+from collections import deque
+from typing import Any
+from urllib.parse import urlsplit
+
+from app.core.metrics import MetricFamily, get_metrics_registry
+from app.core.settings import settings
+from app.shared.logging import LOGGER
+
+# Path segments such as "v2" or "v3" are API versions, not endpoint families
+_VERSION_SEGMENT_PATTERN = re.compile(r"^v\d+$", re.IGNORECASE)
+
+# Weight of a new latency sample in the moving average
+_LATENCY_EWMA_ALPHA = 0.2
+
+# How fast the latency baseline drifts upwards towards newer samples
+_BASELINE_DRIFT = 0.01
+
+
+def get_endpoint_key(url: str) -> tuple[str, str]:
+    """
+    Derive the (host, endpoint family) key used to group requests.
+
+    The endpoint family is the first path segment that is not an API version,
+    e.g. ``/v2/assets/123`` -> ``assets`` and ``/gov_lineage/v2/query_lineage``
+    -> ``gov_lineage``.
+
+    Args:
+        url: Full request URL
+
+    Returns:
+        tuple[str, str]: Host and endpoint family
+    """
+    parts = urlsplit(str(url))
+    host = parts.netloc.lower()
+    family = ""
+    for segment in parts.path.split("/"):
+        if segment and not _VERSION_SEGMENT_PATTERN.match(segment):
+            family = segment
+            break
+    return host, family or "/"
+
+
+class _EndpointLimit:
+    """Resizable concurrency limit with AIMD tuning for a single endpoint key."""
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        latency_tolerance: float,
+        backoff_ratio: float,
+    ) -> None:
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self.latency_tolerance = latency_tolerance
+        self.backoff_ratio = backoff_ratio
+        self.in_flight = 0
+        self.baseline_latency: float | None = None
+        self.avg_latency: float | None = None
+        self.total_requests = 0
+        self.overload_count = 0
+        self._last_decrease = 0.0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def effective_limit(self) -> int:
+        """Current integer limit on concurrent requests."""
+        return max(self.min_limit, int(self.limit))
+
+    async def acquire(self) -> None:
+        """Wait until a slot is available for this endpoint."""
+        if not self._waiters and self.in_flight < self.effective_limit:
+            self.in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            elif waiter.done() and not waiter.cancelled():
+                # Slot was handed over just before cancellation - give it back
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Release a slot and hand it to the next queued request if allowed."""
+        self.in_flight -= 1
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self.in_flight < self.effective_limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self.in_flight += 1
+            waiter.set_result(None)
+
+    def record(self, latency: float, overloaded: bool) -> None:
+        """
+        Feed one observed request outcome into the AIMD controller.
+
+        Args:
+            latency: Request latency in seconds
+            overloaded: True if the upstream signalled overload (429, 5xx, connection failure)
+        """
+        self.total_requests += 1
+
+        if self.baseline_latency is None or latency < self.baseline_latency:
+            self.baseline_latency = latency
+        else:
+            self.baseline_latency += (latency - self.baseline_latency) * _BASELINE_DRIFT
+
+        if self.avg_latency is None:
+            self.avg_latency = latency
+        else:
+            self.avg_latency += (latency - self.avg_latency) * _LATENCY_EWMA_ALPHA
+
+        too_slow = latency > self.baseline_latency * self.latency_tolerance
+        if overloaded or too_slow:
+            self.overload_count += int(overloaded)
+            self._decrease()
+        else:
+            self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+            self._wake_waiters()
+
+    def _decrease(self) -> None:
+        # Decrease at most once per average round trip so one burst of slow
+        # responses does not collapse the limit to the minimum
+        now = time.monotonic()
+        if now - self._last_decrease < (self.avg_latency or 0.0):
+            return
+        self._last_decrease = now
+        self.limit = max(float(self.min_limit), self.limit * self.backoff_ratio)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the current state of this endpoint limit."""
+        return {
+            "limit": self.effective_limit,
+            "in_flight": self.in_flight,
+            "queued": len(self._waiters),
+            "total_requests": self.total_requests,
+            "overload_count": self.overload_count,
+            "baseline_latency_s": round(self.baseline_latency or 0.0, 4),
+            "avg_latency_s": round(self.avg_latency or 0.0, 4),
+        }
+
+
+class LimiterPermit:
+    """
+    Slot held by a single request. Use as an async context manager, call
+    ``mark_sent`` right before the request is sent and report the outcome with
+    ``record_status`` or ``record_failure`` before leaving it.
+
+    Only the time since ``mark_sent`` counts as latency: waits for other local
+    slots (tenant, global semaphore, HTTP/2 streams) after the permit was
+    granted must not make the upstream look slow.
+    """
+
+    def __init__(self, endpoint_limit: _EndpointLimit | None) -> None:
+        self._endpoint_limit = endpoint_limit
+        self._sent_at: float | None = None
+        self._overloaded: bool | None = None
+
+    async def __aenter__(self) -> "LimiterPermit":
+        if self._endpoint_limit is not None:
+            await self._endpoint_limit.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+        if self._endpoint_limit is None:
+            return False
+        try:
+            if self._overloaded is not None and self._sent_at is not None:
+                latency = time.perf_counter() - self._sent_at
+                self._endpoint_limit.record(latency, self._overloaded)
+        finally:
+            self._endpoint_limit.release()
+        return False
+
+    def mark_sent(self) -> None:
+        """Start measuring the upstream latency; call right before sending the request."""
+        self._sent_at = time.perf_counter()
+
+    def record_status(self, status_code: int) -> None:
+        """Record the HTTP status code returned by the upstream."""
+        self._overloaded = status_code == 429 or status_code >= 500
+
+    def record_failure(self) -> None:
+        """Record a connection-level failure (timeout, reset, refused)."""
+        self._overloaded = True
+
+
+class AdaptiveConcurrencyLimiter:
+    """Registry of adaptive concurrency limits keyed by upstream host and endpoint family."""
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        latency_tolerance: float,
+        backoff_ratio: float,
+    ) -> None:
+        self._initial_limit = initial_limit
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._latency_tolerance = latency_tolerance
+        self._backoff_ratio = backoff_ratio
+        self._limits: dict[tuple[str, str], _EndpointLimit] = {}
+
+    def _get_limit(self, key: tuple[str, str]) -> _EndpointLimit:
+        endpoint_limit = self._limits.get(key)
+        if endpoint_limit is None:
+            endpoint_limit = _EndpointLimit(
+                self._initial_limit,
+                self._min_limit,
+                self._max_limit,
+                self._latency_tolerance,
+                self._backoff_ratio,
+            )
+            self._limits[key] = endpoint_limit
+        return endpoint_limit
+
+    def permit(self, url: str) -> LimiterPermit:
+        """
+        Get a permit for a request to the given URL.
+
+        Args:
+            url: Full request URL
+
+        Returns:
+            LimiterPermit: Async context manager holding a slot for the request's endpoint
+        """
+        return LimiterPermit(self._get_limit(get_endpoint_key(url)))
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Get current limits and queue depths for every known endpoint.
+
+        Returns:
+            dict: Mapping of "host/family" to the endpoint's limit, in-flight and queued counts
+        """
+        return {
+            f"{host}/{family}": endpoint_limit.snapshot()
+            for (host, family), endpoint_limit in self._limits.items()
+        }
+
+    def get_total_queued(self) -> int:
+        """Return the number of requests waiting across all endpoints."""
+        return sum(len(limit._waiters) for limit in self._limits.values())
+
+
+_adaptive_limiter: AdaptiveConcurrencyLimiter | None = None
+
+
+def get_adaptive_concurrency_limiter() -> AdaptiveConcurrencyLimiter:
+    """
+    Get the global adaptive concurrency limiter instance (singleton pattern).
+
+    Returns:
+        AdaptiveConcurrencyLimiter: The global limiter instance
+    """
+    global _adaptive_limiter
+    if _adaptive_limiter is None:
+        _adaptive_limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=settings.ibm_api_adaptive_initial_limit,
+            min_limit=settings.ibm_api_adaptive_min_limit,
+            max_limit=settings.ibm_api_adaptive_max_limit,
+            latency_tolerance=settings.ibm_api_adaptive_latency_tolerance,
+            backoff_ratio=settings.ibm_api_adaptive_backoff_ratio,
+        )
+        LOGGER.info(
+            "Adaptive concurrency limiter initialized: initial=%d, min=%d, max=%d",
+            settings.ibm_api_adaptive_initial_limit,
+            settings.ibm_api_adaptive_min_limit,
+            settings.ibm_api_adaptive_max_limit,
+        )
+    return _adaptive_limiter
+
+
+def _collect_limiter_metrics() -> list[MetricFamily]:
+    """Report the current limit, in-flight and queued requests of every endpoint family."""
+    if _adaptive_limiter is None:
+        return []
+    limits = MetricFamily(
+        "endpoint_concurrency_limit", "Adaptive concurrency limit of an endpoint family", label_names=("endpoint",)
+    )
+    in_flight = MetricFamily(
+        "endpoint_in_flight_requests", "Requests in flight to an endpoint family", label_names=("endpoint",)
+    )
+    queued = MetricFamily(
+        "endpoint_queued_requests", "Requests waiting for a slot of an endpoint family", label_names=("endpoint",)
+    )
+    for endpoint, stats in _adaptive_limiter.get_stats().items():
+        limits.add(stats["limit"], endpoint)
+        in_flight.add(stats["in_flight"], endpoint)
+        queued.add(stats["queued"], endpoint)
+    return [limits, in_flight, queued]
+
+
+get_metrics_registry().register_collector("adaptive_concurrency_limiter", _collect_limiter_metrics)
+
+
+def get_endpoint_permit(url: str) -> LimiterPermit:
+    """
+    Get a permit for a request to the given URL from the global limiter.
+
+    When adaptive concurrency is disabled the returned permit does not limit anything.
+
+    Args:
+        url: Full request URL
+
+    Returns:
+        LimiterPermit: Async context manager holding a slot for the request's endpoint
+    """
+    if not settings.ibm_api_adaptive_concurrency_enabled:
+        return LimiterPermit(None)
+    return get_adaptive_concurrency_limiter().permit(url)
@@ -0,0 +1,228 @@
+# Copyright [2026] [IBM]
+# Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+# See the LICENSE file in the project root for license information.
+
+"""
+Reusable fuzzy matcher over a list of candidate dictionaries.
+
+Candidates are tokenized and indexed once, then any number of lookups can be
+answered without rescanning them:
+
+- ``match`` implements the exact-then-token-based matching of
+  ``get_exact_or_fuzzy_matches``. Exact and prefix tiers come from a sorted
+  token vocabulary, the substring and fuzzy tiers are evaluated once per
+  distinct token instead of once per candidate token, and the difflib ratio is
+  only computed for tokens whose length and character bag can reach the cutoff.
+- ``closest`` implements the whole-value ``difflib.get_close_matches(n=1)``
+  lookup used by ``get_closest_match``, answering exact values from a hash map
+  and raising the pruning threshold to the best score found so far.
+
+Both return the same candidates, with the same scores and order, as the
+difflib based scans they replace.
+"""
+
+import re
+from bisect import bisect_left
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Tuple
+
+# Separators used to split names and emails into tokens
+TOKEN_SEPARATORS = re.compile(r'[._+\-@\s]+')
+
+# Token match scores, best first
+SCORE_EXACT = 1.0
+SCORE_PREFIX = 0.95
+SCORE_CONTAINS = 0.85
+SCORE_FUZZY = 0.7
+
+
+def tokenize(text: str) -> List[str]:
+    """Split lower-cased text into tokens on '.', '_', '+', '-', '@' and whitespace."""
+    return [token for token in TOKEN_SEPARATORS.split(text) if token]
+
+
+def _is_close(matcher: SequenceMatcher, candidate: str, cutoff: float) -> bool:
+    """
+    Same test as ``difflib.get_close_matches(word, [candidate], cutoff=cutoff)``.
+
+    The matcher must have the searched word set as its second sequence.
+    """
+    matcher.set_seq1(candidate)
+    return (
+        matcher.real_quick_ratio() >= cutoff
+        and matcher.quick_ratio() >= cutoff
+        and matcher.ratio() >= cutoff
+    )
+
+
+def score_token(search_token: str, candidate_token: str, cutoff: float) -> float:
+    """
+    Score a candidate token against a search token.
+
+    Scoring hierarchy:
+    - Exact match: 1.0
+    - Starts with: 0.95
+    - Contains: 0.85
+    - Fuzzy match: 0.7
+    """
+    if candidate_token == search_token:
+        return SCORE_EXACT
+    if candidate_token.startswith(search_token):
+        return SCORE_PREFIX
+    if search_token in candidate_token:
+        return SCORE_CONTAINS
+    matcher = SequenceMatcher()
+    matcher.set_seq2(search_token)
+    if _is_close(matcher, candidate_token, cutoff):
+        return SCORE_FUZZY
+    return 0.0
+
+
+class FuzzyMatcher:
+    """Index of candidate dictionaries for exact, prefix, substring and fuzzy lookups."""
+
+    def __init__(self, candidates: List[dict], search_fields: Optional[List[str]] = None) -> None:
+        """
+        Args:
+            candidates: Candidate dictionaries to search through
+            search_fields: Field names to search in (defaults to ["name"])
+        """
+        self.candidates = candidates
+        self.search_fields = search_fields or ["name"]
+        # Indexes are built on first use, so a matcher used only for closest() never tokenizes
+        self._exact: Optional[Dict[str, List[int]]] = None
+        self._postings: Dict[str, List[int]] = {}
+        self._vocabulary: List[str] = []
+        self._closest_values: Optional[Dict[str, int]] = None
+
+    def _build_token_index(self) -> None:
+        self._exact = {}
+        for position, candidate in enumerate(self.candidates):
+            text_parts = [str(candidate.get(f)) for f in self.search_fields if candidate.get(f)]
+            for value in dict.fromkeys(part.lower() for part in text_parts):
+                self._exact.setdefault(value, []).append(position)
+            for token in dict.fromkeys(tokenize(" ".join(text_parts).lower())):
+                self._postings.setdefault(token, []).append(position)
+        self._vocabulary = sorted(self._postings)
+
+    def match(self, search_word: str, cutoff: float = 0.6, max_results: int = 10) -> List[dict]:
+        """
+        Find candidates matching exactly, falling back to token-based fuzzy matching.
+
+        Args:
+            search_word: The word to search for
+            cutoff: Minimum similarity score for fuzzy matching (0.0-1.0)
+            max_results: Maximum number of fuzzy matches to return
+
+        Returns:
+            List[dict]: All exact matches, or the best fuzzy matches (highest score first)
+        """
+        if not search_word or not self.candidates:
+            return []
+
+        if self._exact is None:
+            self._build_token_index()
+        search_lower = search_word.lower().strip()
+        exact_positions = self._exact.get(search_lower)
+        if exact_positions:
+            return [self.candidates[position] for position in exact_positions]
+
+        search_tokens = [t for t in tokenize(search_lower) if len(t) > 1]
+        if not search_tokens:
+            return []
+        return self.match_tokens(search_tokens, cutoff, max_results)
+
+    def match_tokens(self, search_tokens: List[str], cutoff: float, max_results: int) -> List[dict]:
+        """
+        Score candidates by their best matching token and return the top matches.
+
+        Args:
+            search_tokens: Lower-cased search tokens
+            cutoff: Minimum score for a candidate to match (0.0-1.0)
+            max_results: Maximum number of matches to return
+
+        Returns:
+            List[dict]: Matching candidates, highest score first, ties in candidate order
+        """
+        if self._exact is None:
+            self._build_token_index()
+        candidate_scores: Dict[int, float] = {}
+        for token, score in self._score_vocabulary(search_tokens, cutoff).items():
+            for position in self._postings[token]:
+                if score > candidate_scores.get(position, 0.0):
+                    candidate_scores[position] = score
+
+        ranked = sorted(
+            (position for position, score in candidate_scores.items() if score >= cutoff),
+            key=lambda position: (-candidate_scores[position], position),
+        )
+        return [self.candidates[position] for position in ranked[:max_results]]
+
+    def _score_vocabulary(self, search_tokens: List[str], cutoff: float) -> Dict[str, float]:
+        """Return the best score of every indexed token matching any search token."""
+        scores: Dict[str, float] = {}
+        for search_token in search_tokens:
+            # Exact and prefix matches are a contiguous range of the sorted vocabulary
+            start = bisect_left(self._vocabulary, search_token)
+            for token in self._vocabulary[start:]:
+                if not token.startswith(search_token):
+                    break
+                score = SCORE_EXACT if token == search_token else SCORE_PREFIX
+                scores[token] = max(scores.get(token, 0.0), score)
+
+            # A fuzzy match only matters if it can reach the cutoff
+            check_fuzzy = SCORE_FUZZY >= cutoff
+            matcher = SequenceMatcher()
+            matcher.set_seq2(search_token)
+            for token in self._vocabulary:
+                best = scores.get(token, 0.0)
+                if best >= SCORE_CONTAINS:
+                    continue
+                if search_token in token:
+                    scores[token] = SCORE_CONTAINS
+                elif check_fuzzy and best < SCORE_FUZZY and _is_close(matcher, token, cutoff):
+                    scores[token] = SCORE_FUZZY
+        return scores
+
+    def closest(self, search_word: str, cutoff: float = 0.6) -> Optional[dict]:
+        """
+        Find the candidate whose first search field is closest to a word.
+
+        Equivalent to ``difflib.get_close_matches(word, values, n=1, cutoff=cutoff)``
+        on the lower-cased values, returning the first candidate with the winning value.
+
+        Args:
+            search_word: The word to search for
+            cutoff: Minimum similarity ratio (0.0-1.0)
+
+        Returns:
+            Optional[dict]: The closest candidate, or None if none reaches the cutoff
+        """
+        values = self._get_closest_values()
+        word = search_word.lower()
+        if word in values:
+            return self.candidates[values[word]]
+
+        matcher = SequenceMatcher()
+        matcher.set_seq2(word)
+        best: Optional[Tuple[float, str]] = None
+        for value in values:
+            # Only values that can at least tie with the best match so far are scored
+            threshold = max(cutoff, best[0]) if best else cutoff
+            if not _is_close(matcher, value, threshold):
+                continue
+            scored = (matcher.ratio(), value)
+            if best is None or scored > best:
+                best = scored
+        return self.candidates[values[best[1]]] if best else None
+
+    def _get_closest_values(self) -> Dict[str, int]:
+        """Map each distinct lower-cased value of the first search field to its first candidate."""
+        if self._closest_values is None:
+            field = self.search_fields[0]
+            self._closest_values = {}
+            for position, candidate in enumerate(self.candidates):
+                value = candidate.get(field)
+                if value is not None:
+                    self._closest_values.setdefault(str(value).lower(), position)
+        return self._closest_values
@@ -7,13 +7,13 @@
 import json
 import re
 
-from difflib import get_close_matches
 from typing import Callable, List, Optional, Union
 from urllib.parse import urlparse, parse_qs
 from uuid import UUID
 
 from app.core.settings import settings
 from app.shared.exceptions.base import ServiceError
+from app.shared.utils.fuzzy_matcher import FuzzyMatcher, score_token
 
 
 def is_none(value: object) -> bool:
@@ -217,16 +217,9 @@ def get_closest_match(word_list_with_id: list, search_word: str) -> str | None:
         str | None: The 'id' of the dictionary in the list whose 'name' is the closest match to the search word,
                    or None if no match is found.
     """
-    closest_name = get_close_matches(
-        word=search_word.lower(),
-        possibilities=[name["name"].lower() for name in word_list_with_id],
-        n=1,
-        cutoff=0.6,
-    )
-    if closest_name:
-        for words in word_list_with_id:
-            if str(words.get("name")).lower() == closest_name[0].lower():
-                return str(words.get("id"))
+    closest = FuzzyMatcher(word_list_with_id, ["name"]).closest(search_word, cutoff=0.6)
+    if closest:
+        return str(closest.get("id"))
     return None
 
 
@@ -252,14 +245,7 @@ def calculate_best_token_score(search_tokens: List[str], candidate_tokens: List[
     max_score = 0.0
     for search_token in search_tokens:
         for candidate_token in candidate_tokens:
-            if candidate_token == search_token:
-                max_score = max(max_score, 1.0)
-            elif candidate_token.startswith(search_token):
-                max_score = max(max_score, 0.95)
-            elif search_token in candidate_token:
-                max_score = max(max_score, 0.85)
-            elif get_close_matches(search_token, [candidate_token], n=1, cutoff=cutoff):
-                max_score = max(max_score, 0.7)
+            max_score = max(max_score, score_token(search_token, candidate_token, cutoff))
     return max_score
 
 
@@ -270,27 +256,13 @@ def perform_token_based_matching(
     cutoff: float,
     max_results: int
 ) -> List[dict]:
-    """Score candidates based on token matching and return top matches."""
-    candidate_scores = []
-    
-    for candidate in candidates:
-        # Combine search fields into searchable text
-        text_parts = [str(candidate.get(field)) for field in search_fields if candidate.get(field)]
-        if not text_parts:
-            continue
-        
-        search_text = " ".join(text_parts).lower()
-        candidate_tokens = [t for t in re.split(r'[._+\-@\s]+', search_text) if t]
-        
-        # Calculate best match score using helper function
-        max_score = calculate_best_token_score(search_tokens, candidate_tokens, cutoff)
-        
-        if max_score >= cutoff:
-            candidate_scores.append((candidate, max_score))
-    
-    # Sort by score and return top matches
-    candidate_scores.sort(key=lambda x: x[1], reverse=True)
-    return [candidate for candidate, _ in candidate_scores[:max_results]]
+    """
+    Score candidates based on token matching and return top matches.
+
+    Candidates are indexed once by FuzzyMatcher, so every distinct candidate
+    token is compared with the search tokens only once.
+    """
+    return FuzzyMatcher(candidates, search_fields).match_tokens(search_tokens, cutoff, max_results)
 
 def get_exact_or_fuzzy_matches(
     search_word: str,
@@ -304,7 +276,8 @@ def get_exact_or_fuzzy_matches(
     Returns multiple matches to allow caller to handle ambiguity.
     
     This function extracts tokens from email addresses and names to perform
-    intelligent matching
+    intelligent matching. To search the same candidates repeatedly, build a
+    FuzzyMatcher once and call its match method instead.
     
     Args:
         search_word: The word to search for
@@ -319,21 +292,7 @@ def get_exact_or_fuzzy_matches(
     if not search_word or not candidates:
         return []
     
-    search_fields = search_fields or ["name"]
-    search_lower = search_word.lower().strip()
-    
-    # Try exact match first
-    exact_matches = find_exact_matches(candidates, search_fields, search_lower)
-    if exact_matches:
-        return exact_matches
-    
-    # Extract and validate search tokens
-    search_tokens = [t for t in re.split(r'[._+\-@\s]+', search_lower) if t and len(t) > 1]
-    if not search_tokens:
-        return []
-    
-    # Perform token-based fuzzy matching
-    return perform_token_based_matching(candidates, search_tokens, search_fields, cutoff, max_results)
+    return FuzzyMatcher(candidates, search_fields).match(search_word, cutoff, max_results)
 
 def get_project_or_space_type_based_on_context() -> str | None:
     """
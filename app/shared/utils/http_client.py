@@ -6,19 +6,49 @@
 
 """Async HTTP client with connection pooling and error handling."""
 
-from typing import Any, Callable, Awaitable
+from typing import Any, Callable, Sequence
+import asyncio
+import contextlib
+import copy
+import hashlib
+import importlib.util
+import json
 import logging
+import time
 from asyncio import Semaphore
+from urllib.parse import urlsplit
 
 import httpx
 
+from app.core.metrics import (
+    MetricFamily,
+    get_metrics_registry,
+    record_upstream_request,
+    record_upstream_wait,
+)
 from app.core.settings import settings
-from app.shared.exceptions.base import ExternalAPIError
+from app.core.tracing import SPAN_KIND_CLIENT, scrub_url, start_span
+from app.core.deadline import deadline_scope, get_remaining_time, wait_shared
+from app.shared.exceptions.base import DeadlineExceededError, ExternalAPIError, ResponseTooLargeError
+from app.shared.utils.circuit_breaker import get_circuit_breaker_call
+from app.shared.utils.json_codec import get_json_codec
+from app.shared.utils.request_hedging import get_hedging_policy, run_hedged
+from app.shared.utils.response_body import decode_json, read_body, read_error_response
 from app.shared.utils.ssl_utils import get_ssl_verify_setting
+from app.shared.utils.tenant_scheduler import get_tenant_slot
 from app.shared.utils.retry_utils import retry_on_failure
+from app.shared.utils.concurrency_limiter import (
+    get_adaptive_concurrency_limiter,
+    get_endpoint_key,
+    get_endpoint_permit,
+)
 from app.shared.utils.http_constants import (
     APPLICATION_FORM_URL_ENCODED,
     HTTP_CLIENT_STATS_LOG_MSG,
+    HTTP_CLIENT_ENDPOINT_LIMITS_LOG_MSG,
+    IDEMPOTENT_METHODS,
+    RETRYABLE_STATUS_CODES,
+    RETRYABLE_TRANSPORT_ERRORS,
 )
 from app.services.constants import JSON_CONTENT_TYPE
 
@@ -49,6 +79,11 @@ def get_ibm_api_semaphore() -> Semaphore:
     return _ibm_api_semaphore
 
 
+def is_http2_available() -> bool:
+    """Check whether the h2 package needed by httpx for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
 class AsyncHttpClient:
     """
     Async HTTP client with connection pooling and automatic retry logic.
@@ -62,7 +97,14 @@ class AsyncHttpClient:
         self._client: httpx.AsyncClient | None = None
         self._request_count = 0
         self._error_count = 0
+        self._coalesced_count = 0
         self._closed = False
+        # In-flight GET calls shared by identical concurrent requests (single-flight)
+        self._inflight_gets: dict[str, asyncio.Task] = {}
+        # Whether the client negotiates HTTP/2, set when the client is created
+        self._http2 = False
+        # Per-host limits of concurrent streams in HTTP/2 mode
+        self._host_streams: dict[str, Semaphore] = {}
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -88,26 +130,66 @@ class AsyncHttpClient:
             )
             # Note: cert_setting is now None as certificates are loaded into SSL context
 
-            self._client = httpx.AsyncClient(
-                timeout=httpx.Timeout(settings.request_timeout_s),
-                verify=verify_setting,  # Enhanced SSL verification (bool, str, or SSLContext)
-                limits=httpx.Limits(
+            self._http2 = settings.http2_enabled
+            if self._http2 and not is_http2_available():
+                LOGGER.warning(
+                    "HTTP2_ENABLED is set but the h2 package is not installed "
+                    "(install the 'http2' extra), using HTTP/1.1"
+                )
+                self._http2 = False
+
+            if self._http2:
+                # Each connection multiplexes many requests, so a few connections per host suffice
+                limits = httpx.Limits(
+                    max_connections=settings.http2_max_connections,
+                    max_keepalive_connections=settings.http2_max_keepalive_connections,
+                    keepalive_expiry=settings.http_keepalive_expiry,
+                )
+            else:
+                limits = httpx.Limits(
                     max_connections=settings.http_max_connections,
                     max_keepalive_connections=settings.http_max_keepalive_connections,
                     keepalive_expiry=settings.http_keepalive_expiry,
-                ),
+                )
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(settings.request_timeout_s),
+                verify=verify_setting,  # Enhanced SSL verification (bool, str, or SSLContext)
+                limits=limits,
+                http2=self._http2,
             )
             
             # Log connection pool configuration
             LOGGER.info(
-                "HTTP client initialized with connection pool: "
+                "HTTP client initialized with connection pool: protocol=%s, "
                 "max_connections=%d, max_keepalive_connections=%d, keepalive_expiry=%.1fs",
-                settings.http_max_connections,
-                settings.http_max_keepalive_connections,
+                "HTTP/2" if self._http2 else "HTTP/1.1",
+                limits.max_connections,
+                limits.max_keepalive_connections,
                 settings.http_keepalive_expiry
             )
         return self._client
 
+    def _stream_slot(self, url: str) -> contextlib.AbstractAsyncContextManager:
+        """
+        Get the stream slot a request to the given URL holds in HTTP/2 mode.
+
+        HTTP/2 sends all requests to a host over a few connections, so the
+        connection pool no longer bounds the concurrent requests per host.
+
+        Args:
+            url: Full request URL
+
+        Returns:
+            The host's stream semaphore, or a no-op context manager in HTTP/1.1 mode
+        """
+        if not self._http2 or settings.http2_max_streams_per_host <= 0:
+            return contextlib.nullcontext()
+        host = urlsplit(url).netloc
+        streams = self._host_streams.get(host)
+        if streams is None:
+            streams = self._host_streams[host] = Semaphore(settings.http2_max_streams_per_host)
+        return streams
+
     def _log_stats_if_needed(self, semaphore: Semaphore) -> None:
         """
         Log HTTP client statistics periodically (every 50 requests).
@@ -122,84 +204,219 @@ class AsyncHttpClient:
                 self._request_count, self._error_count,
                 available_slots, settings.ibm_api_max_concurrent_calls
             )
+            if settings.ibm_api_adaptive_concurrency_enabled:
+                limiter = get_adaptive_concurrency_limiter()
+                LOGGER.info(
+                    HTTP_CLIENT_ENDPOINT_LIMITS_LOG_MSG,
+                    limiter.get_total_queued(),
+                    {key: stats["limit"] for key, stats in limiter.get_stats().items()},
+                )
 
     async def _make_request(
         self,
-        request_func: Callable[[httpx.AsyncClient], Awaitable[httpx.Response]],
+        request_func: Callable[[httpx.AsyncClient], httpx.Request],
+        url: str,
+        method: str = "GET",
+        fields: Sequence[str] | None = None,
+        max_body_bytes: int | None = None,
+        hedge: bool = False,
     ) -> dict[str, Any]:
         """
         Common request execution logic with semaphore-based concurrency control,
-        retry logic for rate limiting (HTTP 429), and error handling.
+        retry logic for rate limiting and transient failures, and error handling.
+
+        Uses the retry_on_failure decorator to retry 429 errors of any method, and 502/503/504
+        errors and connection failures of idempotent methods, with jittered backoff that honours
+        Retry-After. The retry logic is applied OUTSIDE the semaphore context to release the slot
+        during backoff delays, preventing resource starvation. Attempts and retries stay within
+        the time budget of the tool call.
 
-        Uses the retry_on_failure decorator to handle 429 errors with exponential backoff.
-        The retry logic is applied OUTSIDE the semaphore context to release the slot
-        during backoff delays, preventing resource starvation.
+        Before taking a global semaphore slot, the request waits for a slot of its
+        endpoint family in the adaptive concurrency limiter, so a slow backend cannot
+        hold every global slot. In HTTP transport mode, tenants then take turns for the
+        global slots (see tenant_scheduler). While the endpoint family's circuit breaker is open,
+        the request fails right away without waiting for any slot.
+
+        The response body is streamed and rejected once it exceeds the maximum size.
+        JSON bodies can be reduced to a few fields right after decoding.
+
+        Hedged requests send a second attempt when the first one is slower than the
+        endpoint's latency percentile, within the hedging budget (see request_hedging).
 
         Args:
-            request_func: Async callable that makes the HTTP request and returns the response
+            request_func: Callable building the HTTP request with the given client
+            url: The request URL, used to select the endpoint's concurrency limit
+            method: HTTP method, used to label the request's metrics
+            fields: Dot-separated paths of the JSON fields to keep (lists are traversed),
+                    or None to keep the whole document
+            max_body_bytes: Maximum response body size, defaults to settings.http_max_response_bytes
+                            (0 disables the limit)
+            hedge: Hedge the request; only for idempotent requests
 
         Returns:
             Dict[str, Any]: JSON response data or dict with content and content_type for non-JSON responses
 
         Raises:
             ExternalAPIError: If the request fails or returns an error status
+            ResponseTooLargeError: If the response body exceeds the maximum size
+            CircuitOpenError: If the circuit breaker of the endpoint family is open
         """
-        # Define retry condition: only retry on HTTP 429 (rate limit) errors
-        def should_retry_429(e: Exception) -> bool:
-            return (
-                isinstance(e, httpx.HTTPStatusError)
-                and e.response.status_code == 429
-            )
+        endpoint = "/".join(get_endpoint_key(url))
+        if max_body_bytes is None:
+            max_body_bytes = settings.http_max_response_bytes
+
+        idempotent = method in IDEMPOTENT_METHODS
+
+        # Rate limits are retried for every method, transient failures only where a repeat is safe
+        def should_retry(e: Exception) -> bool:
+            if isinstance(e, httpx.HTTPStatusError):
+                status_code = e.response.status_code
+                return status_code == 429 or (idempotent and status_code in RETRYABLE_STATUS_CODES)
+            return idempotent and isinstance(e, RETRYABLE_TRANSPORT_ERRORS)
         
-        # Apply retry decorator with 429-specific condition
         @retry_on_failure(
             max_retries=settings.retry_max_attempts - 1,  # -1 because decorator counts initial attempt
             backoff_factor=settings.retry_backoff_base,
-            exceptions=(httpx.HTTPStatusError,),
-            retry_condition=should_retry_429,
-            context_label="HTTP_429_retry"
+            exceptions=(httpx.HTTPStatusError, httpx.RequestError),
+            retry_condition=should_retry,
+            context_label=f"HTTP_retry {method} {endpoint}",
+            max_delay=settings.retry_max_delay_s,
         )
         async def _execute_request():
+            if hedge:
+                return await run_hedged(url, _run_attempt)
+            return await _run_attempt(False)
+
+        async def _run_attempt(is_hedge: bool):
+            with start_span("hedge" if is_hedge else "attempt") as attempt_span:
+                return await _execute_attempt(attempt_span)
+
+        async def _execute_attempt(attempt_span):
+            remaining = get_remaining_time()
+            if remaining is not None and remaining <= 0:
+                raise DeadlineExceededError(f"Time budget of the tool call exhausted before {method} {endpoint}")
             semaphore = get_ibm_api_semaphore()
-            async with semaphore:
-                self._request_count += 1
-                self._log_stats_if_needed(semaphore)
+            client = await self.client
+            request = request_func(client)
+            wait_start = time.perf_counter()
+            # An open circuit breaker rejects the call before it waits for any slot
+            with get_circuit_breaker_call(url) as breaker_call:
+                async with (
+                    # Tenants take turns first (HTTP transport mode), so a tenant's queued requests
+                    # wait in its own queue instead of holding endpoint permits other tenants need
+                    get_tenant_slot(request.headers.get("authorization")),
+                    get_endpoint_permit(url) as permit,
+                    semaphore,
+                    self._stream_slot(url),
+                ):
+                    wait_s = time.perf_counter() - wait_start
+                    record_upstream_wait(endpoint, wait_s)
+                    if attempt_span:
+                        attempt_span.set_attribute("wxdi.queue_wait_ms", round(wait_s * 1000, 3))
+                    self._request_count += 1
+                    self._log_stats_if_needed(semaphore)
                 
-                try:
-                    client = await self.client
-                    response = await request_func(client)
-                    response.raise_for_status()
+                    request_start = time.perf_counter()
+                    deadline_capped = False
+                    try:
+                        remaining = get_remaining_time()
+                        if remaining is not None and remaining < settings.request_timeout_s:
+                            # Do not wait for the upstream past the tool call's time budget
+                            deadline_capped = True
+                            timeout = max(remaining, 0.001)
+                            request.extensions["timeout"] = httpx.Timeout(timeout).as_dict()
+                        permit.mark_sent()
+                        streamed = await client.send(request, stream=True)
+                        try:
+                            if streamed.is_error:
+                                # Error bodies are only needed for the error message
+                                response = await read_error_response(streamed, max_body_bytes)
+                            else:
+                                response = streamed
+                                body = await read_body(streamed, max_body_bytes)
+                        finally:
+                            await streamed.aclose()
+                        record_upstream_request(
+                            endpoint, method, str(response.status_code), time.perf_counter() - request_start
+                        )
+                        if attempt_span:
+                            attempt_span.set_attribute("http.status_code", response.status_code)
+                        permit.record_status(response.status_code)
+                        breaker_call.record_status(response.status_code, time.perf_counter() - request_start)
+                        response.raise_for_status()
                     
-                    # Handle different content types
-                    content_type = response.headers.get("content-type", "").lower()
-                    if "application/json" in content_type:
-                        return response.json()
-                    else:
-                        return {"content": response.content, "content_type": content_type}
+                        # Handle different content types
+                        content_type = response.headers.get("content-type", "").lower()
+                        if "application/json" in content_type:
+                            result = decode_json(body, fields)
+                        else:
+                            result = {"content": bytes(body), "content_type": content_type}
+                        if hedge:
+                            get_hedging_policy().record_latency(url, time.perf_counter() - request_start)
+                        return result
+
+                    except asyncio.CancelledError:
+                        if hedge:
+                            # Lost the hedging race (or the call was cancelled): the latency is at least this long
+                            get_hedging_policy().record_latency(url, time.perf_counter() - request_start)
+                        raise
                         
-                except httpx.HTTPStatusError as e:
-                    self._error_count += 1
-                    # If it's a 429, let the retry decorator handle it
-                    if e.response.status_code == 429:
+                    except httpx.HTTPStatusError:
+                        self._error_count += 1
+                        # The retry decorator decides whether to retry, errors are converted below
                         raise
-                    # For non-429 errors, handle and raise immediately
-                    handle_api_exception(e)
-                    raise  # This line is never reached but satisfies type checker
                     
-                except httpx.RequestError as e:
-                    self._error_count += 1
-                    raise ExternalAPIError(f"HTTP request failed: {str(e)}")
-                except Exception as e:
-                    self._error_count += 1
-                    raise ExternalAPIError(f"Request failed: {str(e)}")
+                    except httpx.TimeoutException as e:
+                        if not deadline_capped:
+                            self._error_count += 1
+                            permit.record_failure()
+                            breaker_call.record_failure()
+                            record_upstream_request(endpoint, method, "error", time.perf_counter() - request_start)
+                            raise
+                        # The tool call ran out of time, which says nothing about the health of the upstream
+                        record_upstream_request(endpoint, method, "deadline", time.perf_counter() - request_start)
+                        raise DeadlineExceededError(
+                            f"Time budget of the tool call exhausted while waiting for {method} {endpoint}"
+                        ) from e
+
+                    except httpx.RequestError:
+                        self._error_count += 1
+                        permit.record_failure()
+                        breaker_call.record_failure()
+                        record_upstream_request(endpoint, method, "error", time.perf_counter() - request_start)
+                        raise
+                    except ResponseTooLargeError:
+                        self._error_count += 1
+                        record_upstream_request(endpoint, method, "too_large", time.perf_counter() - request_start)
+                        raise
+                    except Exception as e:
+                        self._error_count += 1
+                        raise ExternalAPIError(f"Request failed: {str(e)}")
         
-        return await _execute_request()
+        # One client span covers all attempts; each attempt is a child span
+        span_attributes = {
+            "http.method": method,
+            "http.url": scrub_url(url),
+            "wxdi.endpoint": endpoint,
+        }
+        with start_span(f"HTTP {method} {endpoint}", kind=SPAN_KIND_CLIENT, attributes=span_attributes):
+            try:
+                return await _execute_request()
+            except httpx.HTTPStatusError as e:
+                handle_api_exception(e)
+                raise  # This line is never reached but satisfies type checker
+            except httpx.RequestError as e:
+                raise ExternalAPIError(f"HTTP request failed: {str(e)}")
 
     async def get(
         self,
         url: str,
         params: dict[str, str] | None = None,
         headers: dict[str, str] | None = None,
+        single_flight: bool | None = None,
+        fields: Sequence[str] | None = None,
+        max_body_bytes: int | None = None,
+        hedge: bool = False,
     ) -> dict[str, Any]:
         """
         Make async GET request with error handling and semaphore-based concurrency control.
@@ -208,6 +425,16 @@ class AsyncHttpClient:
             url: The URL to make the GET request to
             params: Optional query parameters
             headers: Optional HTTP headers to include
+            single_flight: Share one upstream call between concurrent identical requests
+                           (same URL, params and headers, including Authorization).
+                           Defaults to settings.http_single_flight_enabled.
+            fields: Dot-separated paths of the JSON response fields to keep, e.g.
+                    ["items.id", "total"]. Defaults to the whole document.
+            max_body_bytes: Maximum response body size in bytes.
+                            Defaults to settings.http_max_response_bytes.
+            hedge: Send a second request when this one is slower than the endpoint's usual
+                   latency, for latency-critical lookups. Only applies when
+                   settings.http_hedging_enabled is set.
 
         Returns:
             Dict[str, Any]: JSON response data
@@ -215,10 +442,42 @@ class AsyncHttpClient:
         Raises:
             ExternalAPIError: If the request fails or returns an error status
         """
-        async def request_func(client: httpx.AsyncClient) -> httpx.Response:
-            return await client.get(url, params=params, headers=headers or {})
-        
-        return await self._make_request(request_func)
+        def request_func(client: httpx.AsyncClient) -> httpx.Request:
+            return client.build_request("GET", url, params=params, headers=headers or {})
+
+        hedge = hedge and settings.http_hedging_enabled
+        if single_flight is None:
+            single_flight = settings.http_single_flight_enabled
+        if not single_flight:
+            return await self._make_request(
+                request_func, url, fields=fields, max_body_bytes=max_body_bytes, hedge=hedge
+            )
+
+        key = _single_flight_key(url, params, headers, fields, max_body_bytes)
+        task = self._inflight_gets.get(key)
+        if task is None:
+            # The shared call serves every caller, so it must not inherit the deadline of the first one
+            with deadline_scope(None, detach=True):
+                task = asyncio.ensure_future(
+                    self._make_request(request_func, url, fields=fields, max_body_bytes=max_body_bytes, hedge=hedge)
+                )
+            self._inflight_gets[key] = task
+            task.add_done_callback(lambda done: self._finish_single_flight(key, done))
+        else:
+            self._coalesced_count += 1
+            LOGGER.debug("Coalescing GET %s with an identical in-flight request", url)
+
+        # Each caller waits within its own deadline; the shared call is shielded so one caller
+        # giving up does not cancel it for the others. Every caller gets its own copy of the result.
+        result = await wait_shared(task, f"GET {url}")
+        return copy.deepcopy(result)
+
+    def _finish_single_flight(self, key: str, task: asyncio.Task) -> None:
+        """Drop a finished shared GET and mark its exception as retrieved."""
+        if self._inflight_gets.get(key) is task:
+            del self._inflight_gets[key]
+        if not task.cancelled():
+            task.exception()
 
     async def _request_with_body(
         self,
@@ -230,6 +489,8 @@ class AsyncHttpClient:
         headers: dict[str, str] | None = None,
         content: bytes | None = None,
         files: dict[str, Any] | None = None,
+        fields: Sequence[str] | None = None,
+        max_body_bytes: int | None = None,
     ) -> dict[str, Any]:
         """
         Internal helper for HTTP methods with request body (POST, PUT, PATCH).
@@ -243,6 +504,8 @@ class AsyncHttpClient:
             headers: Optional HTTP headers
             content: Raw bytes for binary uploads
             files: Multipart file uploads
+            fields: Dot-separated paths of the JSON response fields to keep
+            max_body_bytes: Maximum response body size in bytes
             
         Returns:
             Dict[str, Any]: JSON response data
@@ -266,19 +529,27 @@ class AsyncHttpClient:
                 f"content={content is not None}, files={files is not None}"
             )
         
-        async def request_func(client: httpx.AsyncClient) -> httpx.Response:
-            method_func = getattr(client, method.lower())
-            return await method_func(
+        request_headers = headers or {}
+        if json is not None and content is None and not files and not data:
+            # Encode once with the configured codec instead of httpx's stdlib encoder on every attempt
+            content = get_json_codec().dumps(json)
+            json = None
+            if not any(key.lower() == "content-type" for key in request_headers):
+                request_headers = {**request_headers, "Content-Type": "application/json"}
+
+        def request_func(client: httpx.AsyncClient) -> httpx.Request:
+            return client.build_request(
+                method,
                 url,
                 json=json,
                 params=params,
-                headers=headers or {},
+                headers=request_headers,
                 data=data,
                 content=content,
                 files=files,
             )
         
-        return await self._make_request(request_func)
+        return await self._make_request(request_func, url, method, fields, max_body_bytes)
 
     async def post(
         self,
@@ -289,6 +560,8 @@ class AsyncHttpClient:
         headers: dict[str, str] | None = None,
         content: bytes | None = None,
         files: dict[str, Any] | None = None,
+        fields: Sequence[str] | None = None,
+        max_body_bytes: int | None = None,
     ) -> dict[str, Any]:
         """
         Make async POST request with error handling and semaphore-based concurrency control.
@@ -306,6 +579,10 @@ class AsyncHttpClient:
                    Do not use with data, json, or content.
             params: Optional query parameters
             headers: Optional HTTP headers
+            fields: Dot-separated paths of the JSON response fields to keep, e.g.
+                    ["items.id", "total"]. Defaults to the whole document.
+            max_body_bytes: Maximum response body size in bytes.
+                            Defaults to settings.http_max_response_bytes.
 
         Returns:
             Dict[str, Any]: JSON response data
@@ -318,7 +595,7 @@ class AsyncHttpClient:
             If multiple are provided, precedence is: files > content > json > data
         """
         return await self._request_with_body(
-            "POST", url, data, json, params, headers, content, files
+            "POST", url, data, json, params, headers, content, files, fields, max_body_bytes
         )
 
     async def put(
@@ -330,6 +607,8 @@ class AsyncHttpClient:
         headers: dict[str, str] | None = None,
         content: bytes | None = None,
         files: dict[str, Any] | None = None,
+        fields: Sequence[str] | None = None,
+        max_body_bytes: int | None = None,
     ) -> dict[str, Any]:
         """
         Make async PUT request with error handling and semaphore-based concurrency control.
@@ -347,6 +626,10 @@ class AsyncHttpClient:
                    Do not use with data, json, or content.
             params: Optional query parameters
             headers: Optional HTTP headers
+            fields: Dot-separated paths of the JSON response fields to keep, e.g.
+                    ["items.id", "total"]. Defaults to the whole document.
+            max_body_bytes: Maximum response body size in bytes.
+                            Defaults to settings.http_max_response_bytes.
 
         Returns:
             Dict[str, Any]: JSON response data
@@ -359,7 +642,7 @@ class AsyncHttpClient:
             If multiple are provided, precedence is: files > content > json > data
         """
         return await self._request_with_body(
-            "PUT", url, data, json, params, headers, content, files
+            "PUT", url, data, json, params, headers, content, files, fields, max_body_bytes
         )
 
     async def patch(
@@ -371,6 +654,8 @@ class AsyncHttpClient:
         headers: dict[str, str] | None = None,
         content: bytes | None = None,
         files: dict[str, Any] | None = None,
+        fields: Sequence[str] | None = None,
+        max_body_bytes: int | None = None,
     ) -> dict[str, Any]:
         """
         Make async PATCH request with error handling and semaphore-based concurrency control.
@@ -388,6 +673,10 @@ class AsyncHttpClient:
                    Do not use with data, json, or content.
             params: Optional query parameters
             headers: Optional HTTP headers
+            fields: Dot-separated paths of the JSON response fields to keep, e.g.
+                    ["items.id", "total"]. Defaults to the whole document.
+            max_body_bytes: Maximum response body size in bytes.
+                            Defaults to settings.http_max_response_bytes.
 
         Returns:
             Dict[str, Any]: JSON response data
@@ -400,7 +689,7 @@ class AsyncHttpClient:
             If multiple are provided, precedence is: files > content > json > data
         """
         return await self._request_with_body(
-            "PATCH", url, data, json, params, headers, content, files
+            "PATCH", url, data, json, params, headers, content, files, fields, max_body_bytes
         )
 
     async def delete(
@@ -408,6 +697,8 @@ class AsyncHttpClient:
         url: str,
         params: dict[str, str] | None = None,
         headers: dict[str, str] | None = None,
+        fields: Sequence[str] | None = None,
+        max_body_bytes: int | None = None,
     ) -> dict[str, Any]:
         """
         Make async DELETE request with error handling and semaphore-based concurrency control.
@@ -416,6 +707,10 @@ class AsyncHttpClient:
             url: The URL to make the DELETE request to
             params: Optional query parameters
             headers: Optional HTTP headers to include
+            fields: Dot-separated paths of the JSON response fields to keep, e.g.
+                    ["items.id", "total"]. Defaults to the whole document.
+            max_body_bytes: Maximum response body size in bytes.
+                            Defaults to settings.http_max_response_bytes.
 
         Returns:
             Dict[str, Any]: JSON response data
@@ -423,10 +718,10 @@ class AsyncHttpClient:
         Raises:
             ExternalAPIError: If the request fails or returns an error status
         """
-        async def request_func(client: httpx.AsyncClient) -> httpx.Response:
-            return await client.delete(url, params=params, headers=headers or {})
+        def request_func(client: httpx.AsyncClient) -> httpx.Request:
+            return client.build_request("DELETE", url, params=params, headers=headers or {})
         
-        return await self._make_request(request_func)
+        return await self._make_request(request_func, url, "DELETE", fields, max_body_bytes)
 
     async def close(self) -> None:
         """
@@ -451,10 +746,74 @@ class AsyncHttpClient:
             self._closed = True
 
 
+def _single_flight_key(
+    url: str,
+    params: dict[str, Any] | None,
+    headers: dict[str, str] | None,
+    fields: Sequence[str] | None = None,
+    max_body_bytes: int | None = None,
+) -> str:
+    """
+    Build the key identifying identical GET requests.
+
+    Headers are part of the key so requests of different principals are never shared.
+    The key is hashed to avoid keeping bearer tokens as dictionary keys.
+    """
+    raw = json.dumps(
+        [
+            str(url),
+            sorted((str(k), str(v)) for k, v in (params or {}).items()),
+            sorted((str(k).lower(), str(v)) for k, v in (headers or {}).items()),
+            sorted(fields) if fields is not None else None,
+            max_body_bytes,
+        ]
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
 # Global shared client instance
 _shared_client: AsyncHttpClient | None = None
 
 
+def _collect_http_client_metrics() -> list[MetricFamily]:
+    """Report the IBM API semaphore usage and coalesced GETs of the shared client."""
+    families = []
+    if _ibm_api_semaphore is not None:
+        families.append(
+            MetricFamily(
+                "ibm_api_semaphore_available",
+                "Free slots of the global IBM API semaphore",
+            ).add(_ibm_api_semaphore._value)
+        )
+        families.append(
+            MetricFamily(
+                "ibm_api_semaphore_limit",
+                "Size of the global IBM API semaphore",
+            ).add(settings.ibm_api_max_concurrent_calls)
+        )
+    if _shared_client is not None:
+        families.append(
+            MetricFamily(
+                "upstream_coalesced_requests_total",
+                "GET requests served by an identical in-flight request",
+                "counter",
+            ).add(_shared_client._coalesced_count)
+        )
+        if _shared_client._host_streams:
+            streams = MetricFamily(
+                "http2_streams_available",
+                "Free HTTP/2 stream slots of an upstream host",
+                label_names=("host",),
+            )
+            for host, semaphore in _shared_client._host_streams.items():
+                streams.add(semaphore._value, host)
+            families.append(streams)
+    return families
+
+
+get_metrics_registry().register_collector("http_client", _collect_http_client_metrics)
+
+
 async def get_async_http_client() -> AsyncHttpClient:
     """
     Get the global shared async HTTP client instance (singleton pattern).
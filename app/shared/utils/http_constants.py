@@ -4,8 +4,25 @@
 
 """Constants for HTTP client utilities."""
 
+import httpx
+
 # Content Types
 APPLICATION_FORM_URL_ENCODED = "application/x-www-form-urlencoded"
 
 # Log Messages
-HTTP_CLIENT_STATS_LOG_MSG = "HTTP client stats: total_requests=%d, errors=%d, semaphore_available=%d/%d"
\ No newline at end of file
+HTTP_CLIENT_STATS_LOG_MSG = "HTTP client stats: total_requests=%d, errors=%d, semaphore_available=%d/%d"
+HTTP_CLIENT_ENDPOINT_LIMITS_LOG_MSG = "HTTP client endpoint limits: queued=%d, limits=%s"
+
+# Retries
+# Methods that can be repeated without changing the result (RFC 9110)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# Transient upstream errors retried for idempotent methods
+RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+# Connection failures and resets retried for idempotent methods (timeouts are not retried)
+RETRYABLE_TRANSPORT_ERRORS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.ReadError,
+    httpx.WriteError,
+    httpx.RemoteProtocolError,
+)
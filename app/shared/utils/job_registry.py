@@ -0,0 +1,408 @@
+# Copyright [2026] [IBM]
+# Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+# See the LICENSE file in the project root for license information.
+
+"""
+In-process registry of background jobs.
+
+Long-running tools (glossary CSV import, term generation) hold the MCP request,
+and one of the ``SERVER_LIMIT_CONCURRENCY`` connection slots, open until their
+work completes. Called with ``run_in_background=true`` they submit their work
+here instead and return a job handle right away; the caller follows the job
+with the ``get_background_job_status`` tool.
+
+- A job runs as an asyncio task of this server process. It keeps the request
+  context of the tool call that started it (request headers, trace) but runs
+  within its own time budget (``BACKGROUND_JOB_DEADLINE_S``) and auth context:
+  its access token is resolved anew, and a token obtained from an API key is
+  refreshed by the token manager while the job runs.
+- A job belongs to the caller that started it, identified by a hash of its
+  API key, or of its bearer token when it passed one directly (the token
+  claims are not verified here, so they cannot prove who the caller is).
+  Other callers can neither see nor cancel it. Refreshing the token of an
+  API key keeps the owner the same.
+- Jobs report progress with ``report_job_progress``. Callers waiting for a job
+  receive it as MCP progress notifications.
+- Finished jobs and their results are kept for ``BACKGROUND_JOB_RESULT_TTL_S``.
+- Jobs live in memory: they are lost when the server restarts, and each
+  replica of the server only knows the jobs it runs.
+"""
+
+import asyncio
+import time
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Optional
+
+from pydantic import BaseModel
+
+from app.core.auth import get_caller_hash
+from app.core.auth_context import reset_auth_context, start_auth_context
+from app.core.deadline import deadline_scope
+from app.core.metrics import MetricFamily, get_metrics_registry
+from app.core.settings import settings
+from app.core.tracing import start_span
+from app.shared.exceptions.base import ServiceError
+from app.shared.logging import LOGGER
+from app.shared.models.background_job import BackgroundJobHandle, BackgroundJobInfo, BackgroundJobStatus
+
+# Time a cancelled job gets to stop before cancel_job returns
+CANCEL_GRACE_PERIOD_S = 5.0
+
+_current_job: ContextVar[Optional["BackgroundJob"]] = ContextVar("background_job", default=None)
+
+
+def _format_timestamp(timestamp: Optional[float]) -> Optional[str]:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
+class BackgroundJob:
+    """A tool's work running in the background, with its status, progress and result."""
+
+    def __init__(self, job_id: str, tool: str, owner: str) -> None:
+        self.id = job_id
+        self.tool = tool
+        self.owner = owner
+        self.status = BackgroundJobStatus.RUNNING
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.progress: Optional[float] = None
+        self.total: Optional[float] = None
+        self.progress_message: Optional[str] = None
+        self.result: Any = None
+        self.failure_reason: Optional[str] = None
+        self.task: Optional[asyncio.Task] = None
+        # Replaced on every update; waiters wait for the event of the state they saw
+        self._changed = asyncio.Event()
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status != BackgroundJobStatus.RUNNING
+
+    def _notify(self) -> None:
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    def update_progress(self, progress: float, total: Optional[float] = None, message: Optional[str] = None) -> None:
+        """
+        Record the progress of the job.
+
+        Args:
+            progress: Work done so far
+            total: Total amount of work, if known
+            message: Description of the current step
+        """
+        self.progress = progress
+        self.total = total
+        if message is not None:
+            self.progress_message = message
+        self._notify()
+
+    def finish(self, status: BackgroundJobStatus, result: Any = None, failure_reason: Optional[str] = None) -> None:
+        """Record the outcome of the job."""
+        self.status = status
+        self.result = result
+        self.failure_reason = failure_reason
+        self.finished_at = time.time()
+        self._notify()
+
+    async def wait_for_change(self, timeout_s: float) -> bool:
+        """
+        Wait for the next progress update or the end of the job.
+
+        Returns:
+            bool: True if the job changed, False when the timeout passed first
+        """
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout_s)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def to_info(self, result_ttl_s: float) -> BackgroundJobInfo:
+        """
+        Describe the job for the caller.
+
+        Args:
+            result_ttl_s: How long finished jobs are kept
+
+        Returns:
+            BackgroundJobInfo: Status, progress and (once finished) result of the job
+        """
+        result = self.result
+        if isinstance(result, BaseModel):
+            result = result.model_dump(mode="json")
+        return BackgroundJobInfo(
+            job_id=self.id,
+            tool=self.tool,
+            status=self.status,
+            created_at=_format_timestamp(self.created_at),
+            finished_at=_format_timestamp(self.finished_at),
+            progress=self.progress,
+            total=self.total,
+            progress_message=self.progress_message,
+            result=result,
+            failure_reason=self.failure_reason,
+            expires_at=_format_timestamp(self.finished_at + result_ttl_s if self.finished_at else None),
+        )
+
+
+class JobRegistry:
+    """Runs background jobs and keeps their results until they expire."""
+
+    def __init__(
+        self,
+        result_ttl_s: float,
+        max_running: int,
+        max_running_per_owner: int,
+        deadline_s: float,
+    ) -> None:
+        """
+        Args:
+            result_ttl_s: How long finished jobs and their results are kept
+            max_running: Jobs running at the same time
+            max_running_per_owner: Jobs a single owner runs at the same time
+            deadline_s: Time budget of a job, 0 for none
+        """
+        self.result_ttl_s = result_ttl_s
+        self.max_running = max(1, max_running)
+        self.max_running_per_owner = max(1, max_running_per_owner)
+        self.deadline_s = deadline_s
+        self._jobs: dict[str, BackgroundJob] = {}
+
+    def submit(self, tool: str, owner: str, run: Callable[[], Awaitable[Any]]) -> BackgroundJob:
+        """
+        Start a job.
+
+        The job runs in a copy of the current context, so it must be submitted
+        from the tool call it belongs to.
+
+        Args:
+            tool: Name of the tool whose work the job runs
+            owner: Owner of the job, from get_job_owner
+            run: Coroutine function doing the work and returning the tool's result
+
+        Returns:
+            BackgroundJob: The running job
+
+        Raises:
+            ServiceError: If too many jobs are running, in total or for the owner
+        """
+        self._evict_expired()
+        running = [job for job in self._jobs.values() if not job.is_finished]
+        if len(running) >= self.max_running:
+            raise ServiceError(
+                f"The server is already running {len(running)} background jobs.",
+                remediation_steps="Retry later, or run the tool without run_in_background.",
+            )
+        owned = sum(1 for job in running if job.owner == owner)
+        if owned >= self.max_running_per_owner:
+            raise ServiceError(
+                f"You already have {owned} background jobs running.",
+                remediation_steps="Wait for one of them to finish with get_background_job_status, or cancel one with cancel_background_job.",
+            )
+
+        job = BackgroundJob(str(uuid.uuid4()), tool, owner)
+        self._jobs[job.id] = job
+        job.task = asyncio.create_task(self._run(job, run), name=f"background-job-{job.id}")
+        LOGGER.info(f"Background job {job.id} started for {tool}")
+        return job
+
+    async def _run(self, job: BackgroundJob, run: Callable[[], Awaitable[Any]]) -> None:
+        _current_job.set(job)
+        # Resolve the token anew instead of reusing the one of the tool call that started the job
+        auth_context_token = start_auth_context()
+        start = time.perf_counter()
+        try:
+            # The tool call that started the job has returned; its deadline no longer applies
+            with start_span(
+                f"{job.tool} (background job)", attributes={"wxdi.job_id": job.id}
+            ), deadline_scope(self.deadline_s, detach=True):
+                result = await run()
+        except asyncio.CancelledError:
+            LOGGER.info(f"Background job {job.id} ({job.tool}) cancelled")
+            job.finish(BackgroundJobStatus.CANCELLED, failure_reason="The job was cancelled.")
+            raise
+        except Exception as e:
+            LOGGER.error(f"Background job {job.id} ({job.tool}) failed: {str(e)}", exc_info=True)
+            job.finish(BackgroundJobStatus.FAILED, failure_reason=str(e))
+        else:
+            LOGGER.info(f"Background job {job.id} ({job.tool}) succeeded in {time.perf_counter() - start:.1f}s")
+            job.finish(BackgroundJobStatus.SUCCEEDED, result=result)
+        finally:
+            reset_auth_context(auth_context_token)
+
+    def get(self, job_id: str, owner: str) -> Optional[BackgroundJob]:
+        """
+        Get a job of the given owner.
+
+        Args:
+            job_id: ID of the job
+            owner: Owner of the job, from get_job_owner
+
+        Returns:
+            BackgroundJob: The job, or None if it does not exist, expired or belongs to someone else
+        """
+        self._evict_expired()
+        job = self._jobs.get(job_id)
+        return job if job is not None and job.owner == owner else None
+
+    async def wait(
+        self,
+        job: BackgroundJob,
+        timeout_s: float,
+        on_update: Optional[Callable[[BackgroundJob], Awaitable[None]]] = None,
+    ) -> BackgroundJob:
+        """
+        Wait for a job to finish.
+
+        Args:
+            job: The job to wait for
+            timeout_s: Longest time to wait
+            on_update: Coroutine function called on every progress update and when the job finishes
+
+        Returns:
+            BackgroundJob: The job, finished or still running when the timeout passed
+        """
+        end = time.monotonic() + max(timeout_s, 0.0)
+        while not job.is_finished:
+            remaining = end - time.monotonic()
+            if remaining <= 0 or not await job.wait_for_change(remaining):
+                break
+            if on_update is not None:
+                await on_update(job)
+        return job
+
+    async def cancel(self, job: BackgroundJob) -> bool:
+        """
+        Cancel a running job and give it a moment to stop.
+
+        Args:
+            job: The job to cancel
+
+        Returns:
+            bool: False if the job had already finished
+        """
+        if job.is_finished or job.task is None:
+            return False
+        job.task.cancel()
+        await asyncio.wait({job.task}, timeout=CANCEL_GRACE_PERIOD_S)
+        return True
+
+    def _evict_expired(self) -> None:
+        expired_before = time.time() - self.result_ttl_s
+        for job_id in [
+            job.id for job in self._jobs.values()
+            if job.finished_at is not None and job.finished_at < expired_before
+        ]:
+            del self._jobs[job_id]
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Count the kept jobs by status.
+
+        Returns:
+            dict: Mapping of status to the number of jobs
+        """
+        counts = {status.value: 0 for status in BackgroundJobStatus}
+        for job in self._jobs.values():
+            counts[job.status.value] += 1
+        return counts
+
+
+_job_registry: Optional[JobRegistry] = None
+
+
+def get_job_registry() -> JobRegistry:
+    """
+    Get the global background job registry instance (singleton pattern).
+
+    Returns:
+        JobRegistry: The global registry
+    """
+    global _job_registry
+    if _job_registry is None:
+        _job_registry = JobRegistry(
+            result_ttl_s=settings.background_job_result_ttl_s,
+            max_running=settings.background_job_max_running,
+            max_running_per_owner=settings.background_job_max_running_per_owner,
+            deadline_s=settings.background_job_deadline_s,
+        )
+    return _job_registry
+
+
+def _collect_job_metrics() -> list[MetricFamily]:
+    """Report the kept background jobs by status."""
+    if _job_registry is None:
+        return []
+    jobs = MetricFamily("background_jobs", "Background jobs kept by the server", label_names=("status",))
+    for status, count in _job_registry.get_stats().items():
+        jobs.add(count, status)
+    return [jobs]
+
+
+get_metrics_registry().register_collector("job_registry", _collect_job_metrics)
+
+
+async def get_job_owner() -> str:
+    """
+    Identify the caller of the current tool call as a job owner.
+
+    Returns:
+        str: Hash of the caller's API key, or of its bearer token when passed directly
+    """
+    return await get_caller_hash()
+
+
+async def submit_background_job(tool: str, run: Callable[[], Awaitable[Any]]) -> BackgroundJobHandle:
+    """
+    Run a tool's work as a background job of the current caller.
+
+    Args:
+        tool: Name of the tool
+        run: Coroutine function doing the work and returning the tool's result
+
+    Returns:
+        BackgroundJobHandle: Handle of the started job
+
+    Raises:
+        ServiceError: If too many jobs are running
+    """
+    owner = await get_job_owner()
+    job = get_job_registry().submit(tool, owner, run)
+    return BackgroundJobHandle(
+        job_id=job.id,
+        tool=tool,
+        status=job.status,
+        message=(
+            f"The {tool} tool is running in the background. Call get_background_job_status "
+            f"with job_id '{job.id}' to follow it and get its result."
+        ),
+    )
+
+
+def get_current_job() -> Optional[BackgroundJob]:
+    """
+    Get the background job the current code runs in.
+
+    Returns:
+        BackgroundJob: The job, or None outside of a background job
+    """
+    return _current_job.get()
+
+
+def report_job_progress(progress: float, total: Optional[float] = None, message: Optional[str] = None) -> None:
+    """
+    Record the progress of the current background job; does nothing outside of one.
+
+    Args:
+        progress: Work done so far
+        total: Total amount of work, if known
+        message: Description of the current step
+    """
+    job = _current_job.get()
+    if job is not None:
+        job.update_progress(progress, total, message)
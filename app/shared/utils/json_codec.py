@@ -0,0 +1,158 @@
+# Copyright [2026] [IBM]
+# Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+# See the LICENSE file in the project root for license information.
+
+"""
+Pluggable JSON codec for upstream request and response bodies.
+
+The codec is selected with the ``JSON_CODEC`` setting:
+
+- ``auto`` (default): orjson when it is installed, the standard library otherwise
+- ``orjson``: orjson, failing on first use when it is not installed
+- ``stdlib``: the standard library ``json`` module
+
+orjson is an optional dependency (``pip install ibm-watsonx-data-intelligence-mcp-server[fast-json]``).
+Input orjson does not handle the way the standard library does falls back to
+the standard library, so both codecs accept and reject the same documents
+and raise the same errors:
+
+- decoding: integers above 64 bits, NaN and Infinity literals, bodies that
+  are not UTF-8
+- encoding: integers above 64 bits, datetimes and dataclasses (passed to
+  ``default`` as the standard library does), NaN and infinity (orjson writes
+  them as null, the standard library rejects them)
+
+The remaining differences when encoding: orjson encodes UUIDs, plain Enum
+members and numpy values, and dictionary keys of these types, which the
+standard library passes to ``default`` or rejects.
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+from app.core.settings import settings
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+SUPPORTED_CODECS = ("auto", "orjson", "stdlib")
+
+# Same errors for both codecs; orjson.JSONDecodeError is a subclass
+JSONDecodeError = json.JSONDecodeError
+
+
+class StdlibJsonCodec:
+    """JSON codec based on the standard library."""
+
+    name = "stdlib"
+
+    def loads(self, data: bytes | bytearray | str) -> Any:
+        """
+        Decode a JSON document.
+
+        Args:
+            data: The document (bytes in UTF-8, UTF-16 or UTF-32, or str)
+
+        Returns:
+            Any: The decoded value
+
+        Raises:
+            JSONDecodeError: If the document is not valid JSON
+        """
+        return json.loads(data)
+
+    def dumps(self, value: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        """
+        Encode a value as compact UTF-8 JSON, as httpx does for ``json=`` request bodies.
+
+        Args:
+            value: The value to encode
+            default: Called for values that cannot be encoded otherwise
+
+        Returns:
+            bytes: The encoded document
+
+        Raises:
+            TypeError: If the value cannot be encoded
+            ValueError: If the value contains NaN or infinity
+        """
+        return json.dumps(
+            value, ensure_ascii=False, separators=(",", ":"), allow_nan=False, default=default
+        ).encode("utf-8")
+
+
+class OrjsonCodec(StdlibJsonCodec):
+    """JSON codec based on orjson, falling back to the standard library where orjson behaves differently."""
+
+    # Hand datetimes and dataclasses to default, as the standard library does
+    _DUMPS_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        if orjson is not None
+        else 0
+    )
+
+    name = "orjson"
+
+    def loads(self, data: bytes | bytearray | str) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Decoded again to accept what the standard library accepts and raise its error otherwise
+            return super().loads(data)
+
+    def dumps(self, value: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        try:
+            encoded = orjson.dumps(value, default=default, option=self._DUMPS_OPTIONS)
+        except TypeError:
+            # Calls default again or raises the standard library's error
+            return super().dumps(value, default)
+        # orjson writes NaN and infinity as null, the standard library raises ValueError for them.
+        # A document with null is decoded back, which is much faster than walking the value in
+        # Python: it only differs from the value with NaN, infinity, tuples, non-string keys or
+        # values passed to default, all of which the standard library then encodes or rejects.
+        if b"null" in encoded and orjson.loads(encoded) != value:
+            return super().dumps(value, default)
+        return encoded
+
+
+JsonCodec = StdlibJsonCodec
+
+
+def create_json_codec(name: str) -> JsonCodec:
+    """
+    Create a JSON codec.
+
+    Args:
+        name: "auto", "orjson" or "stdlib"
+
+    Returns:
+        JsonCodec: The codec
+
+    Raises:
+        ValueError: If the codec is unknown, or orjson is requested but not installed
+    """
+    if name not in SUPPORTED_CODECS:
+        raise ValueError(f"Invalid JSON codec '{name}'. Supported codecs: {list(SUPPORTED_CODECS)}")
+    if name == "stdlib" or (name == "auto" and orjson is None):
+        return StdlibJsonCodec()
+    if orjson is None:
+        raise ValueError("JSON codec 'orjson' requires the orjson package (install the 'fast-json' extra)")
+    return OrjsonCodec()
+
+
+_json_codec: Optional[JsonCodec] = None
+
+
+def get_json_codec() -> JsonCodec:
+    """
+    Get the configured JSON codec instance (singleton pattern).
+
+    Returns:
+        JsonCodec: The codec selected by settings.json_codec
+    """
+    global _json_codec
+    if _json_codec is None:
+        _json_codec = create_json_codec(settings.json_codec)
+    return _json_codec
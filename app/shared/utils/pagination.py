@@ -0,0 +1,172 @@
+# Copyright [2026] [IBM]
+# Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+# See the LICENSE file in the project root for license information.
+
+"""
+Pagination helpers for offset- and bookmark-paginated IBM APIs.
+
+- Offset pagination: the first page is fetched alone. When it reports the
+  total count, the remaining pages are fetched concurrently (at most
+  ``PAGINATION_MAX_CONCURRENT_PAGES`` at a time) and returned in order.
+  Without a total count, pages are followed one by one while the response
+  has a next link.
+- Bookmark pagination: each page needs the bookmark of the previous one, so
+  pages are fetched one by one, but the next page is requested while the
+  items of the current one are being consumed.
+
+``iter_offset_pages`` and ``iter_bookmark_pages`` stream the items of every
+page as an async iterator; ``fetch_offset_pages`` and ``fetch_bookmark_pages``
+collect them into a list. Callers that stop iterating early should close the
+iterator (``contextlib.aclosing``) so prefetched pages are cancelled.
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+from app.core.settings import settings
+
+
+def get_total_count(response: Any) -> Optional[int]:
+    """Get the ``total_count`` of a paginated response, or None if it is not reported."""
+    if isinstance(response, dict) and response.get("total_count") is not None:
+        return int(response["total_count"])
+    return None
+
+
+def has_next_link(response: Any) -> bool:
+    """Check whether a paginated response has a ``next`` link."""
+    return isinstance(response, dict) and response.get("next") is not None
+
+
+def get_next_bookmark(response: Any) -> Optional[str]:
+    """Get the bookmark of the next page from a search response, or None on the last page."""
+    next_page = response.get("next") if isinstance(response, dict) else None
+    return next_page.get("bookmark") if isinstance(next_page, dict) else None
+
+
+async def iter_offset_pages(
+    fetch_page: Callable[[int, int], Awaitable[Any]],
+    extract_items: Callable[[Any], list],
+    limit: int,
+    get_total: Callable[[Any], Optional[int]] = get_total_count,
+    has_more: Callable[[Any], bool] = has_next_link,
+    max_concurrency: Optional[int] = None,
+) -> AsyncIterator[Any]:
+    """
+    Iterate over the items of every page of an offset-paginated endpoint.
+
+    Args:
+        fetch_page: Coroutine function fetching the page at (offset, limit)
+        extract_items: Function extracting the items of a page
+        limit: Number of items per page
+        get_total: Function reading the total item count from the first page (None if unknown)
+        has_more: Function telling whether another page follows, used when the total is unknown
+        max_concurrency: Pages fetched at the same time, defaults to settings.pagination_max_concurrent_pages
+
+    Yields:
+        The items of every page, in page order
+    """
+    response = await fetch_page(0, limit)
+    for item in extract_items(response):
+        yield item
+
+    total = get_total(response)
+    if total is None:
+        offset = 0
+        while has_more(response):
+            offset += limit
+            response = await fetch_page(offset, limit)
+            for item in extract_items(response):
+                yield item
+        return
+
+    concurrency = max(1, max_concurrency or settings.pagination_max_concurrent_pages)
+    offsets = iter(range(limit, total, limit))
+    in_flight: deque[asyncio.Future] = deque()
+    try:
+        for offset in offsets:
+            in_flight.append(asyncio.ensure_future(fetch_page(offset, limit)))
+            if len(in_flight) >= concurrency:
+                break
+        while in_flight:
+            response = await in_flight.popleft()
+            # Keep the window full while the caller consumes this page
+            next_offset = next(offsets, None)
+            if next_offset is not None:
+                in_flight.append(asyncio.ensure_future(fetch_page(next_offset, limit)))
+            for item in extract_items(response):
+                yield item
+    finally:
+        for future in in_flight:
+            if not future.cancel() and not future.cancelled():
+                # Already finished; retrieve its error so it is not reported as unhandled
+                future.exception()
+
+
+async def iter_bookmark_pages(
+    fetch_page: Callable[[Optional[str]], Awaitable[Any]],
+    extract_items: Callable[[Any], list],
+    get_bookmark: Callable[[Any], Optional[str]] = get_next_bookmark,
+) -> AsyncIterator[Any]:
+    """
+    Iterate over the items of every page of a bookmark-paginated endpoint.
+
+    Args:
+        fetch_page: Coroutine function fetching the page after the given bookmark (None for the first page)
+        extract_items: Function extracting the items of a page
+        get_bookmark: Function reading the bookmark of the next page (None on the last page)
+
+    Yields:
+        The items of every page, in page order
+    """
+    response = await fetch_page(None)
+    next_page: Optional[asyncio.Future] = None
+    try:
+        while True:
+            bookmark = get_bookmark(response)
+            # Request the next page while the caller consumes this one
+            next_page = asyncio.ensure_future(fetch_page(bookmark)) if bookmark else None
+            for item in extract_items(response):
+                yield item
+            if next_page is None:
+                return
+            response = await next_page
+            next_page = None
+    finally:
+        if next_page is not None:
+            next_page.cancel()
+
+
+async def fetch_offset_pages(
+    fetch_page: Callable[[int, int], Awaitable[Any]],
+    extract_items: Callable[[Any], list],
+    limit: int,
+    get_total: Callable[[Any], Optional[int]] = get_total_count,
+    has_more: Callable[[Any], bool] = has_next_link,
+    max_concurrency: Optional[int] = None,
+) -> list:
+    """
+    Collect the items of every page of an offset-paginated endpoint (see iter_offset_pages).
+
+    Returns:
+        list: The items of every page, in page order
+    """
+    return [
+        item
+        async for item in iter_offset_pages(fetch_page, extract_items, limit, get_total, has_more, max_concurrency)
+    ]
+
+
+async def fetch_bookmark_pages(
+    fetch_page: Callable[[Optional[str]], Awaitable[Any]],
+    extract_items: Callable[[Any], list],
+    get_bookmark: Callable[[Any], Optional[str]] = get_next_bookmark,
+) -> list:
+    """
+    Collect the items of every page of a bookmark-paginated endpoint (see iter_bookmark_pages).
+
+    Returns:
+        list: The items of every page, in page order
+    """
+    return [item async for item in iter_bookmark_pages(fetch_page, extract_items, get_bookmark)]
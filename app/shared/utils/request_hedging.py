@@ -0,0 +1,254 @@
+# Copyright [2026] [IBM]
+# Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+# See the LICENSE file in the project root for license information.
+
+"""
+Hedged requests for latency-critical idempotent GETs.
+
+A hedged GET sends a second, identical request when the first one has not
+completed within the recent latency percentile of its endpoint family, and
+keeps whichever response arrives first; the other request is cancelled.
+A single slow replica therefore no longer holds a tool call for the full
+request timeout.
+
+- Latency samples are kept per upstream host and endpoint family (the keys of
+  the adaptive concurrency limiter), measured from the moment a request is
+  sent, so time spent waiting for local concurrency slots does not count.
+  No request is hedged before an endpoint has enough samples.
+- The request that loses the race is recorded too, with the time it had been
+  running when it was cancelled. Its latency is at least that long, and
+  leaving it out would skew the percentile towards the fast responses.
+- Every hedge costs one token of the endpoint's budget, and every hedgeable
+  request adds ``HTTP_HEDGING_BUDGET_PERCENT / 100`` tokens, so hedges never
+  add more than that share of extra load (plus a small burst).
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from app.core.metrics import MetricFamily, get_metrics_registry
+from app.core.settings import settings
+from app.shared.logging import LOGGER
+from app.shared.utils.concurrency_limiter import get_endpoint_key
+
+T = TypeVar("T")
+
+# Latency samples kept per endpoint family
+_WINDOW_SIZE = 256
+
+# New samples after which the percentile is recomputed
+_RECOMPUTE_EVERY = 16
+
+# Hedges that can be sent in a burst once the budget has filled up
+_MAX_BUDGET_TOKENS = 10.0
+
+
+class _EndpointHedging:
+    """Latency window and hedge budget of a single endpoint family."""
+
+    def __init__(self) -> None:
+        self.latencies: deque[float] = deque(maxlen=_WINDOW_SIZE)
+        self.tokens = 0.0
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.denied = 0
+        self._threshold: Optional[float] = None
+        self._samples_since_compute = 0
+
+    def record_latency(self, latency: float) -> None:
+        self.latencies.append(latency)
+        self._samples_since_compute += 1
+        if self._samples_since_compute >= _RECOMPUTE_EVERY:
+            self._threshold = None
+
+    def threshold(self, percentile: float) -> float:
+        """Latency at the given percentile of the window."""
+        if self._threshold is None:
+            ordered = sorted(self.latencies)
+            index = min(len(ordered) - 1, int(len(ordered) * percentile / 100))
+            self._threshold = ordered[index]
+            self._samples_since_compute = 0
+        return self._threshold
+
+
+class HedgingPolicy:
+    """Decides when GETs are hedged, based on per-endpoint latency percentiles and hedge budgets."""
+
+    def __init__(self, percentile: float, min_delay_s: float, min_samples: int, budget_percent: float) -> None:
+        """
+        Args:
+            percentile: Latency percentile after which a hedge is sent
+            min_delay_s: Lower bound of the hedge delay
+            min_samples: Latency samples an endpoint needs before its requests are hedged
+            budget_percent: Maximum extra load from hedges, in percent of hedgeable requests
+        """
+        self.percentile = percentile
+        self.min_delay_s = min_delay_s
+        self.min_samples = max(min_samples, 1)
+        self.budget_ratio = budget_percent / 100
+        self._endpoints: dict[tuple[str, str], _EndpointHedging] = {}
+
+    def _get_endpoint(self, url: str) -> _EndpointHedging:
+        key = get_endpoint_key(url)
+        endpoint = self._endpoints.get(key)
+        if endpoint is None:
+            endpoint = self._endpoints[key] = _EndpointHedging()
+        return endpoint
+
+    def record_latency(self, url: str, latency: float) -> None:
+        """
+        Record the latency of a successful GET, or of one cancelled after losing the race.
+
+        Args:
+            url: Request URL
+            latency: Time from sending the request to the decoded response, in seconds;
+                     for a cancelled request the time it had been running (a lower bound)
+        """
+        self._get_endpoint(url).record_latency(latency)
+
+    def get_hedge_delay(self, url: str) -> Optional[float]:
+        """
+        Register a hedgeable request and get how long to wait before hedging it.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            float: Delay in seconds, or None if the endpoint does not have enough samples yet
+        """
+        endpoint = self._get_endpoint(url)
+        endpoint.requests += 1
+        endpoint.tokens = min(_MAX_BUDGET_TOKENS, endpoint.tokens + self.budget_ratio)
+        if len(endpoint.latencies) < self.min_samples:
+            return None
+        return max(self.min_delay_s, endpoint.threshold(self.percentile))
+
+    def try_acquire_hedge(self, url: str) -> bool:
+        """Take one hedge from the endpoint's budget, returning False if it is exhausted."""
+        endpoint = self._get_endpoint(url)
+        if endpoint.tokens < 1.0:
+            endpoint.denied += 1
+            return False
+        endpoint.tokens -= 1.0
+        endpoint.hedges += 1
+        return True
+
+    def record_hedge_win(self, url: str) -> None:
+        """Record that the hedge returned before the original request."""
+        self._get_endpoint(url).hedge_wins += 1
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Get hedging statistics for every known endpoint.
+
+        Returns:
+            dict: Mapping of "host/family" to hedgeable requests, hedges, wins, denied hedges and delay
+        """
+        stats = {}
+        for (host, family), endpoint in self._endpoints.items():
+            delay = (
+                max(self.min_delay_s, endpoint.threshold(self.percentile))
+                if len(endpoint.latencies) >= self.min_samples
+                else None
+            )
+            stats[f"{host}/{family}"] = {
+                "requests": endpoint.requests,
+                "hedges": endpoint.hedges,
+                "hedge_wins": endpoint.hedge_wins,
+                "denied": endpoint.denied,
+                "hedge_delay_s": round(delay, 4) if delay is not None else None,
+            }
+        return stats
+
+
+_hedging_policy: Optional[HedgingPolicy] = None
+
+
+def get_hedging_policy() -> HedgingPolicy:
+    """
+    Get the global hedging policy instance (singleton pattern).
+
+    Returns:
+        HedgingPolicy: The global hedging policy
+    """
+    global _hedging_policy
+    if _hedging_policy is None:
+        _hedging_policy = HedgingPolicy(
+            percentile=settings.http_hedging_percentile,
+            min_delay_s=settings.http_hedging_min_delay_ms / 1000,
+            min_samples=settings.http_hedging_min_samples,
+            budget_percent=settings.http_hedging_budget_percent,
+        )
+    return _hedging_policy
+
+
+async def run_hedged(url: str, attempt: Callable[[bool], Awaitable[T]]) -> T:
+    """
+    Run a request, hedging it once if it is slower than its endpoint's latency percentile.
+
+    The first successful response wins and the other request is cancelled. If both
+    fail, the error of the request that failed first is raised.
+
+    Args:
+        url: Request URL
+        attempt: Coroutine factory sending the request; its argument is True for the hedge
+
+    Returns:
+        The result of the first successful request
+    """
+    policy = get_hedging_policy()
+    delay = policy.get_hedge_delay(url)
+    if delay is None:
+        return await attempt(False)
+
+    primary = asyncio.ensure_future(attempt(False))
+    pending = {primary}
+    try:
+        done, _ = await asyncio.wait(pending, timeout=delay)
+        if done or not policy.try_acquire_hedge(url):
+            return await primary
+
+        LOGGER.debug("Hedging GET %s after %.0f ms", url, delay * 1000)
+        hedge = asyncio.ensure_future(attempt(True))
+        pending.add(hedge)
+        first_error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.cancelled():
+                    first_error = first_error or asyncio.CancelledError()
+                elif task.exception() is None:
+                    if task is hedge:
+                        policy.record_hedge_win(url)
+                    return task.result()
+                else:
+                    first_error = first_error or task.exception()
+        raise first_error
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def _collect_hedging_metrics() -> list[MetricFamily]:
+    """Report hedged requests, hedge wins and denied hedges of every endpoint family."""
+    if _hedging_policy is None:
+        return []
+    hedges = MetricFamily(
+        "hedged_requests_total", "GETs hedged with a second request", "counter", ("endpoint",)
+    )
+    wins = MetricFamily(
+        "hedge_wins_total", "Hedges that returned before the original request", "counter", ("endpoint",)
+    )
+    denied = MetricFamily(
+        "hedges_denied_total", "Hedges not sent because the hedge budget was exhausted", "counter", ("endpoint",)
+    )
+    for endpoint, stats in _hedging_policy.get_stats().items():
+        hedges.add(stats["hedges"], endpoint)
+        wins.add(stats["hedge_wins"], endpoint)
+        denied.add(stats["denied"], endpoint)
+    return [hedges, wins, denied]
+
+
+get_metrics_registry().register_collector("request_hedging", _collect_hedging_metrics)
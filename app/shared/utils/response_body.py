@@ -0,0 +1,154 @@
+# Copyright [2026] [IBM]
+# Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+# See the LICENSE file in the project root for license information.
+
+"""
+Bounded reading and field projection of upstream response bodies.
+
+Responses are read from the connection chunk by chunk, so a body above the
+configured maximum size is rejected as soon as the limit is crossed (or
+right away when Content-Length announces it) instead of after it was fully
+buffered. Error bodies, which only feed error messages, are truncated at the
+same size instead. Callers that only need a few fields of a large JSON document can
+pass field paths; the document is reduced to those fields right after
+decoding, before it is shared, cached or copied.
+
+Field paths are dot-separated keys. Lists are traversed transparently, so
+``assets_in_view.name`` keeps the ``name`` of every element of
+``assets_in_view``, and a path ending at an object keeps the whole object.
+"""
+
+from typing import Any, Dict, Optional, Sequence
+
+import httpx
+
+from app.shared.exceptions.base import ResponseTooLargeError
+from app.shared.utils.json_codec import get_json_codec
+
+# Projection tree: key -> subtree, None keeps the whole value
+FieldTree = Dict[str, Optional["FieldTree"]]
+
+
+async def read_body(response: httpx.Response, max_bytes: int) -> bytearray:
+    """
+    Read the body of a streamed response, enforcing a maximum size.
+
+    The buffer is returned as is, without copying it to bytes; the JSON codecs
+    decode it directly.
+
+    Args:
+        response: Response sent with ``stream=True``
+        max_bytes: Maximum body size in bytes, 0 for no limit
+
+    Returns:
+        bytearray: The decompressed body
+
+    Raises:
+        ResponseTooLargeError: If the body is larger than max_bytes
+    """
+    if max_bytes:
+        content_length = response.headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > max_bytes:
+            raise _too_large(response, max_bytes)
+
+    body = bytearray()
+    async for chunk in response.aiter_bytes():
+        body += chunk
+        if max_bytes and len(body) > max_bytes:
+            raise _too_large(response, max_bytes)
+    return body
+
+
+async def read_error_response(response: httpx.Response, max_bytes: int) -> httpx.Response:
+    """
+    Buffer a streamed error response, truncating its body at a maximum size.
+
+    Args:
+        response: Error response sent with ``stream=True``
+        max_bytes: Maximum body size in bytes, 0 for no limit
+
+    Returns:
+        httpx.Response: A buffered copy of the response with the (truncated) decompressed body,
+                        for raise_for_status and error messages
+    """
+    body = bytearray()
+    async for chunk in response.aiter_bytes():
+        body += chunk
+        if max_bytes and len(body) >= max_bytes:
+            del body[max_bytes:]
+            break
+    # The body is already decompressed and may be truncated
+    headers = [
+        (name, value)
+        for name, value in response.headers.multi_items()
+        if name.lower() not in ("content-encoding", "content-length", "transfer-encoding")
+    ]
+    return httpx.Response(response.status_code, headers=headers, content=bytes(body), request=response.request)
+
+
+def _too_large(response: httpx.Response, max_bytes: int) -> ResponseTooLargeError:
+    return ResponseTooLargeError(
+        f"Response from {response.request.url} exceeds the maximum size of {max_bytes} bytes "
+        "(HTTP_MAX_RESPONSE_BYTES)"
+    )
+
+
+def build_field_tree(fields: Sequence[str]) -> FieldTree:
+    """
+    Build the projection tree of a list of field paths.
+
+    Args:
+        fields: Dot-separated field paths, e.g. ["rows.metadata.name", "total_rows"]
+
+    Returns:
+        FieldTree: Nested keys to keep; a path that is a prefix of another keeps everything below it
+    """
+    tree: FieldTree = {}
+    for path in fields:
+        node = tree
+        keys = [key for key in path.split(".") if key]
+        for position, key in enumerate(keys):
+            if position == len(keys) - 1:
+                node[key] = None
+            elif key not in node:
+                node[key] = {}
+            elif node[key] is None:
+                # A shorter path already keeps the whole value
+                break
+            node = node[key]
+    return tree
+
+
+def project(value: Any, tree: Optional[FieldTree]) -> Any:
+    """
+    Reduce a decoded JSON value to the fields of a projection tree.
+
+    Args:
+        value: Decoded JSON value
+        tree: Projection tree from build_field_tree, None keeps the whole value
+
+    Returns:
+        Any: The projected value; missing fields are omitted
+    """
+    if tree is None:
+        return value
+    if isinstance(value, list):
+        return [project(item, tree) for item in value]
+    if isinstance(value, dict):
+        return {key: project(value[key], subtree) for key, subtree in tree.items() if key in value}
+    return value
+
+
+def decode_json(body: bytes | bytearray, fields: Optional[Sequence[str]] = None) -> Any:
+    """
+    Decode a JSON body, keeping only the given fields.
+
+    Args:
+        body: Raw JSON body (UTF-8, UTF-16 or UTF-32)
+        fields: Field paths to keep, or None to keep the whole document
+
+    Returns:
+        Any: The decoded (and projected) document
+    """
+    data = get_json_codec().loads(body)
+    return project(data, build_field_tree(fields)) if fields else data
@@ -0,0 +1,399 @@
+# Copyright [2026] [IBM]
+# Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+# See the LICENSE file in the project root for license information.
+
+"""
+Tenant-scoped response cache for read-only Data Intelligence GET endpoints.
+
+Which endpoints are cached, and for how long, is declared by each service in the
+``config.cache`` section of its ``manifest.yaml``::
+
+    config:
+      cache:
+        endpoints:
+          - path: /gov_lineage/v2/technologies
+            ttl: 3600
+
+``path`` is matched against the request URL path. ``*`` matches a single path
+segment and a trailing ``**`` matches any remaining segments.
+
+Entries are keyed by a hash of the caller's access token plus URL, query
+parameters and request headers, so responses are never shared between users.
+The cache is bounded (LRU eviction), serves stale entries for a short window
+while refreshing them in the background, and invalidates a principal's entries
+under a path whenever that principal writes to that path.
+
+Concurrent misses and background refreshes of the same entry share one fetch.
+The fetch runs with its own time budget, not the deadline of the tool call
+that started it; every caller waits for it within its own deadline.
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Sequence
+from urllib.parse import urlsplit
+
+import yaml
+
+from app.core.deadline import deadline_scope, wait_shared
+from app.core.manifest import ServiceConfig
+from app.core.metrics import MetricFamily, get_metrics_registry
+from app.core.settings import settings
+from app.shared.logging import LOGGER
+
+SERVICES_DIR = Path(__file__).resolve().parents[2] / "services"
+
+
+@dataclass
+class CachePolicy:
+    """Cache policy for one endpoint path pattern declared in a service manifest."""
+
+    service: str
+    path: str
+    ttl: int
+    pattern: re.Pattern
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    principal: str
+    resource: str
+    expires_at: float
+    stale_until: float
+
+
+def _compile_path_pattern(path: str) -> re.Pattern:
+    """Compile a manifest path pattern (``*`` = one segment, ``**`` = the rest) to a regex."""
+    parts = []
+    for segment in path.strip("/").split("/"):
+        if segment == "**":
+            parts.append(".*")
+        elif segment == "*":
+            parts.append("[^/]+")
+        else:
+            parts.append(re.escape(segment))
+    return re.compile("^/" + "/".join(parts) + "/?$")
+
+
+def _resource_path(url: str) -> str:
+    """Return "host/path/" for a URL, used to relate reads and writes of the same resource."""
+    parts = urlsplit(str(url))
+    return f"{parts.netloc.lower()}{parts.path.rstrip('/')}/"
+
+
+def load_cache_policies(services_dir: Path = SERVICES_DIR) -> list[CachePolicy]:
+    """
+    Load endpoint cache policies from the ``config.cache`` section of all service manifests.
+
+    Args:
+        services_dir: Directory containing the service packages
+
+    Returns:
+        list[CachePolicy]: Declared policies, longest path patterns first
+    """
+    policies: list[CachePolicy] = []
+    for manifest_file in sorted(services_dir.glob("*/manifest.yaml")):
+        try:
+            with open(manifest_file, "r") as f:
+                manifest = yaml.safe_load(f) or {}
+            config = ServiceConfig.model_validate(manifest.get("config") or {})
+        except Exception as e:
+            LOGGER.warning(f"Failed to load cache policy from {manifest_file}: {e}")
+            continue
+
+        service_name = manifest.get("service", {}).get("name", manifest_file.parent.name)
+        for endpoint in (config.cache or {}).get("endpoints", []):
+            path = endpoint.get("path")
+            ttl = endpoint.get("ttl")
+            if not path or not isinstance(ttl, int) or ttl <= 0:
+                LOGGER.warning(f"Ignoring invalid cache endpoint in {manifest_file}: {endpoint}")
+                continue
+            policies.append(
+                CachePolicy(service_name, path, ttl, _compile_path_pattern(path))
+            )
+
+    # More specific (longer) patterns win when several match
+    policies.sort(key=lambda policy: len(policy.path), reverse=True)
+    return policies
+
+
+class ResponseCache:
+    """Bounded LRU cache of GET responses with TTL and stale-while-revalidate."""
+
+    def __init__(
+        self,
+        policies: list[CachePolicy],
+        max_entries: int,
+        stale_while_revalidate_s: float,
+    ) -> None:
+        self._policies = policies
+        self._max_entries = max_entries
+        self._stale_while_revalidate_s = stale_while_revalidate_s
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        # Fetches in progress by cache key, shared by misses and background refreshes
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._stats = {"hits": 0, "stale_hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+        self._service_stats: dict[str, dict[str, int]] = {}
+
+    def get_policy(self, url: str) -> CachePolicy | None:
+        """Return the cache policy for a URL, or None if the endpoint is not cacheable."""
+        path = urlsplit(str(url)).path
+        for policy in self._policies:
+            if policy.pattern.match(path):
+                return policy
+        return None
+
+    @staticmethod
+    def build_key(
+        principal: str,
+        url: str,
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        fields: Sequence[str] | None = None,
+    ) -> str:
+        """Build the cache key for a principal's GET request (and the response fields it keeps)."""
+        raw = json.dumps(
+            [
+                principal,
+                str(url),
+                sorted((str(k), str(v)) for k, v in (params or {}).items()),
+                sorted(
+                    (str(k).lower(), str(v))
+                    for k, v in (headers or {}).items()
+                    if str(k).lower() != "authorization"
+                ),
+                sorted(fields) if fields is not None else None,
+            ]
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    async def get_or_fetch(
+        self,
+        policy: CachePolicy,
+        principal: str,
+        url: str,
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        fetch: Callable[[], Awaitable[Any]],
+        fields: Sequence[str] | None = None,
+    ) -> Any:
+        """
+        Return a cached response or fetch and cache it.
+
+        Args:
+            policy: Cache policy matching the URL
+            principal: Caller identifier from get_token_hash
+            url: Request URL
+            params: Query parameters
+            headers: Request headers
+            fetch: Coroutine factory performing the upstream request
+            fields: Response fields the fetch keeps, None for the whole response
+
+        Returns:
+            Any: A copy of the response, safe for the caller to mutate
+        """
+        key = self.build_key(principal, url, params, headers, fields)
+        now = time.monotonic()
+        entry = self._entries.get(key)
+
+        if entry is not None and now < entry.expires_at:
+            self._entries.move_to_end(key)
+            self._count(policy, "hits")
+            return copy.deepcopy(entry.value)
+
+        if entry is not None and now < entry.stale_until:
+            self._entries.move_to_end(key)
+            self._count(policy, "stale_hits")
+            self._refresh_in_background(key, policy, principal, url, fetch)
+            return copy.deepcopy(entry.value)
+
+        self._count(policy, "misses")
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._start_fetch(key, policy, principal, url, fetch)
+        return copy.deepcopy(await wait_shared(task, f"GET {url}"))
+
+    def _start_fetch(
+        self,
+        key: str,
+        policy: CachePolicy,
+        principal: str,
+        url: str,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> asyncio.Task:
+        """Start a fetch storing its result, shared by all lookups of the key until it finishes."""
+
+        async def _fetch_and_store() -> Any:
+            value = await fetch()
+            self._store(key, policy, principal, url, value)
+            return value
+
+        # The fetch serves every lookup of the key (and outlives a stale lookup): run it in its
+        # own time budget rather than the remaining deadline of the tool call that started it
+        with deadline_scope(settings.tool_call_deadline_s, detach=True):
+            task = asyncio.ensure_future(_fetch_and_store())
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._finish_fetch(key, done))
+        return task
+
+    def _finish_fetch(self, key: str, task: asyncio.Task) -> None:
+        """Drop a finished fetch and mark its exception as retrieved."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception() is not None:
+            LOGGER.debug(f"Fetch of cached response failed: {task.exception()}")
+
+    def _refresh_in_background(
+        self,
+        key: str,
+        policy: CachePolicy,
+        principal: str,
+        url: str,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> None:
+        if key in self._inflight:
+            return
+
+        async def _refresh() -> Any:
+            try:
+                return await fetch()
+            except Exception as e:
+                LOGGER.warning(f"Background refresh of cached response for {url} failed: {e}")
+                raise
+
+        self._start_fetch(key, policy, principal, url, _refresh)
+
+    def _store(self, key: str, policy: CachePolicy, principal: str, url: str, value: Any) -> None:
+        if not isinstance(value, (dict, list)):
+            return
+        now = time.monotonic()
+        self._entries[key] = _CacheEntry(
+            value=value,
+            principal=principal,
+            resource=_resource_path(url),
+            expires_at=now + policy.ttl,
+            stale_until=now + policy.ttl + self._stale_while_revalidate_s,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def invalidate(self, principal: str, url: str) -> None:
+        """
+        Drop a principal's cached responses related to the path of a write request.
+
+        An entry is related when its path is the written path, a parent of it
+        (e.g. the collection listing) or a child of it. Called before write requests
+        so a tool reading back what it just changed does not get a stale response.
+
+        Args:
+            principal: Caller identifier from get_token_hash
+            url: URL of the write request
+        """
+        resource = _resource_path(url)
+        stale_keys = [
+            key
+            for key, entry in self._entries.items()
+            if entry.principal == principal
+            and (resource.startswith(entry.resource) or entry.resource.startswith(resource))
+        ]
+        for key in stale_keys:
+            del self._entries[key]
+        self._stats["invalidations"] += len(stale_keys)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+
+    def _count(self, policy: CachePolicy, stat: str) -> None:
+        self._stats[stat] += 1
+        service_stats = self._service_stats.setdefault(
+            policy.service, {"hits": 0, "stale_hits": 0, "misses": 0}
+        )
+        service_stats[stat] += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache hit/miss metrics.
+
+        Returns:
+            dict: Global counters, hit ratio, current size and per-service counters
+        """
+        lookups = self._stats["hits"] + self._stats["stale_hits"] + self._stats["misses"]
+        hit_ratio = (self._stats["hits"] + self._stats["stale_hits"]) / lookups if lookups else 0.0
+        return {
+            **self._stats,
+            "hit_ratio": round(hit_ratio, 4),
+            "size": len(self._entries),
+            "max_entries": self._max_entries,
+            "services": copy.deepcopy(self._service_stats),
+        }
+
+
+_response_cache: ResponseCache | None = None
+
+
+def _collect_response_cache_metrics() -> list[MetricFamily]:
+    """Report lookups per service and result, the hit ratio and the size of the response cache."""
+    if _response_cache is None:
+        return []
+    stats = _response_cache.get_stats()
+    lookups = MetricFamily(
+        "response_cache_lookups_total",
+        "Response cache lookups by service and result",
+        "counter",
+        ("service", "result"),
+    )
+    for service, service_stats in sorted(stats["services"].items()):
+        for result in ("hits", "stale_hits", "misses"):
+            lookups.add(service_stats[result], service, result)
+    return [
+        lookups,
+        MetricFamily("response_cache_hit_ratio", "Share of response cache lookups served from the cache").add(
+            stats["hit_ratio"]
+        ),
+        MetricFamily("response_cache_entries", "Responses in the response cache").add(stats["size"]),
+        MetricFamily("response_cache_evictions_total", "Responses evicted from the response cache", "counter").add(
+            stats["evictions"]
+        ),
+        MetricFamily(
+            "response_cache_invalidations_total", "Responses invalidated by write requests", "counter"
+        ).add(stats["invalidations"]),
+    ]
+
+
+get_metrics_registry().register_collector("response_cache", _collect_response_cache_metrics)
+
+
+def get_response_cache() -> ResponseCache:
+    """
+    Get the global response cache instance (singleton pattern).
+
+    Policies are loaded from the service manifests on first use.
+
+    Returns:
+        ResponseCache: The global response cache instance
+    """
+    global _response_cache
+    if _response_cache is None:
+        policies = load_cache_policies()
+        _response_cache = ResponseCache(
+            policies,
+            max_entries=settings.response_cache_max_entries,
+            stale_while_revalidate_s=settings.response_cache_stale_while_revalidate_s,
+        )
+        LOGGER.info(
+            "Response cache initialized with %d endpoint policies, max_entries=%d",
+            len(policies),
+            settings.response_cache_max_entries,
+        )
+    return _response_cache
@@ -2,10 +2,29 @@
 # Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
 # See the LICENSE file in the project root for license information.
 
+"""
+Retry engine for coroutines.
+
+Delays between attempts use decorrelated jitter: each delay is drawn between
+the base delay and ``backoff_factor + 1`` times the previous delay, capped at
+``max_delay``. Concurrent callers that failed together therefore spread their
+retries instead of retrying in lockstep.
+
+- A ``Retry-After`` header on the exception's response (seconds or HTTP date)
+  is the minimum delay; when it exceeds ``max_delay`` the call is not retried.
+- No retry is attempted when its delay would end past the deadline of the tool
+  call (see ``app.core.deadline``).
+"""
+
 import asyncio
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from functools import wraps
-from typing import Optional, Tuple, Type, Callable
+from typing import Any, Callable, Optional, Tuple, Type
 
+from app.core.deadline import get_remaining_time
+from app.core.tracing import get_current_span
 from app.shared.logging import LOGGER
 from botocore.exceptions import ClientError
 
@@ -26,34 +45,107 @@ def _should_retry_exception(
     return retry_condition(exception) if retry_condition else True
 
 
-async def _handle_retry_attempt(
+def get_retry_after(exception: Exception) -> Optional[float]:
+    """
+    Get the delay requested by a Retry-After header of the exception's HTTP response.
+
+    Args:
+        exception: The exception that was raised, e.g. an httpx.HTTPStatusError
+
+    Returns:
+        float: Seconds to wait, or None if the exception has no such header
+    """
+    headers: Any = getattr(getattr(exception, "response", None), "headers", None)
+    value = headers.get("retry-after", "").strip() if headers is not None else ""
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _get_backoff_delay(
+    attempt: int,
+    previous_delay: float,
+    base_delay: float,
+    backoff_factor: float,
+    max_delay: Optional[float],
+    jitter: bool,
+) -> float:
+    """Delay before the next attempt, without Retry-After and deadline."""
+    if jitter:
+        delay = random.uniform(base_delay, max(base_delay, previous_delay * (backoff_factor + 1)))
+    else:
+        delay = base_delay * backoff_factor ** attempt
+    return min(delay, max_delay) if max_delay is not None else delay
+
+
+def _get_retry_delay(
     label: str,
     attempt: int,
     total_attempts: int,
     exception: Exception,
-    backoff_factor: float
-) -> None:
+    backoff_delay: float,
+    max_delay: Optional[float],
+    retry_after: Optional[Callable[[Exception], Optional[float]]],
+) -> Optional[float]:
     """
-    Handle logging and delay for a retry attempt.
-    
+    Decide whether to retry and how long to wait first.
+
     Args:
         label: Context label for logging
         attempt: Current attempt number (0-indexed)
         total_attempts: Total number of attempts allowed
         exception: The exception that triggered the retry
-        backoff_factor: Base for exponential backoff calculation
+        backoff_delay: Delay computed by the backoff policy
+        max_delay: Longest acceptable delay
+        retry_after: Extracts the delay requested by the server from the exception
+
+    Returns:
+        float: Seconds to wait before the next attempt, or None to give up
     """
-    if attempt < total_attempts - 1:
-        delay = backoff_factor ** attempt
-        LOGGER.warning(
-            f"[{label}] Attempt {attempt + 1}/{total_attempts} failed: {exception}. "
-            f"Retrying in {delay}s..."
-        )
-        await asyncio.sleep(delay)
-    else:
+    if attempt >= total_attempts - 1:
+        LOGGER.error(f"[{label}] All {total_attempts} attempts failed: {exception}")
+        return None
+
+    delay = backoff_delay
+    requested = retry_after(exception) if retry_after else None
+    if requested is not None:
+        if max_delay is not None and requested > max_delay:
+            LOGGER.error(
+                f"[{label}] Attempt {attempt + 1}/{total_attempts} failed: {exception}. "
+                f"Not retrying, Retry-After of {requested:.0f}s exceeds the maximum delay of {max_delay:.0f}s"
+            )
+            return None
+        delay = max(delay, requested)
+
+    remaining = get_remaining_time()
+    if remaining is not None and delay >= remaining:
         LOGGER.error(
-            f"[{label}] All {total_attempts} attempts failed: {exception}"
+            f"[{label}] Attempt {attempt + 1}/{total_attempts} failed: {exception}. "
+            f"Not retrying, {max(remaining, 0.0):.1f}s left of the call's time budget"
         )
+        return None
+    return delay
+
+
+async def _wait_before_retry(label: str, attempt: int, total_attempts: int, exception: Exception, delay: float) -> None:
+    """Log the failed attempt, record the backoff on the current span and wait."""
+    LOGGER.warning(
+        f"[{label}] Attempt {attempt + 1}/{total_attempts} failed: {exception}. "
+        f"Retrying in {delay:.2f}s..."
+    )
+    span = get_current_span()
+    if span:
+        span.add_event("retry_backoff", {"label": label, "attempt": attempt + 1, "delay_s": float(delay)})
+        span.add_to_attribute("wxdi.backoff_ms", delay * 1000)
+    await asyncio.sleep(delay)
 
 
 def retry_on_failure(
@@ -62,27 +154,38 @@ def retry_on_failure(
     exceptions: Tuple[Type[Exception], ...] = (Exception,),
     context_label: Optional[str] = None,
     retry_condition: Optional[Callable[[Exception], bool]] = None,
+    base_delay: float = 1.0,
+    max_delay: Optional[float] = None,
+    jitter: bool = True,
+    retry_after: Optional[Callable[[Exception], Optional[float]]] = get_retry_after,
 ):
     """
-    Async decorator to retry a coroutine on failure with exponential backoff.
+    Async decorator to retry a coroutine on failure with jittered exponential backoff.
 
     Args:
         max_retries: Maximum number of retry attempts (total attempts = max_retries + 1)
-        backoff_factor: Base for exponential backoff delay (delay = backoff_factor ** attempt).
-                        With the default of 2.0: attempt 0 → 1s, attempt 1 → 2s, attempt 2 → 4s, etc.
+        backoff_factor: Growth of the delay between attempts. With jitter, each delay is drawn
+                        between base_delay and (backoff_factor + 1) times the previous delay;
+                        without it, delay = base_delay * backoff_factor ** attempt
+                        (with the default of 2.0: 1s, 2s, 4s, etc.).
         exceptions: Tuple of exception types to catch and retry on. Defaults to (Exception,).
         context_label: Optional label included in log messages for context (e.g. a document number).
                        Defaults to the decorated function's __name__.
         retry_condition: Optional callable that takes an exception and returns True if retry should occur.
                         If None, all exceptions in the exceptions tuple will be retried.
                         Example: lambda e: hasattr(e, 'response') and e.response.status_code == 429
+        base_delay: Shortest delay between attempts, in seconds
+        max_delay: Longest delay between attempts, in seconds. A longer Retry-After stops the retries.
+        jitter: Randomize the delays (decorrelated jitter)
+        retry_after: Callable returning the delay requested by the server for an exception, if any.
+                     Defaults to reading the Retry-After header of the exception's response.
     """
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
             label = context_label if context_label is not None else func.__name__
-            last_exception: Optional[Exception] = None
             total_attempts = max_retries + 1
+            previous_delay = base_delay
             
             for attempt in range(total_attempts):
                 try:
@@ -91,12 +194,18 @@ def retry_on_failure(
                     if not _should_retry_exception(e, retry_condition):
                         raise
                     
-                    last_exception = e
-                    await _handle_retry_attempt(label, attempt, total_attempts, e, backoff_factor)
+                    backoff_delay = _get_backoff_delay(
+                        attempt, previous_delay, base_delay, backoff_factor, max_delay, jitter
+                    )
+                    delay = _get_retry_delay(
+                        label, attempt, total_attempts, e, backoff_delay, max_delay, retry_after
+                    )
+                    if delay is None:
+                        raise
+                    previous_delay = backoff_delay
+                    await _wait_before_retry(label, attempt, total_attempts, e, delay)
             
-            if last_exception is not None:
-                raise last_exception
-            raise RuntimeError(f"[{label}] retry_on_failure called with max_retries=0")
+            raise RuntimeError(f"[{label}] retry_on_failure called with max_retries < 0")
         return wrapper
     return decorator
 
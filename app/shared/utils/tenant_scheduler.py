@@ -0,0 +1,271 @@
+# Copyright [2026] [IBM]
+# Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+# See the LICENSE file in the project root for license information.
+
+"""
+Fair sharing of the global IBM API slots between tenants.
+
+In HTTP transport mode one server, and one global IBM API semaphore, serve
+every tenant. Without a scheduler, a tenant running a bulk glossary import or
+a large remote asset import queues hundreds of requests and every other
+tenant waits behind them.
+
+With the scheduler, every upstream request first waits in the queue of its
+tenant, identified by a hash of its bearer token. The token claims (account,
+user) are not verified by this server, so they cannot be trusted to tell
+tenants apart: a forged token could otherwise queue in, and use up the share
+of, another account.
+
+- A free slot goes to the waiting tenant that received the least service
+  (stride scheduling), so tenants with requests waiting take turns.
+- A tenant never holds more than ``TENANT_MAX_CONCURRENT_CALLS`` slots, even
+  when others are idle.
+- A tenant that was idle does not bank credit: it rejoins at the current
+  virtual time.
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, Optional
+
+from app.core.auth_context import get_token_hash
+from app.core.metrics import MetricFamily, get_metrics_registry
+from app.core.settings import settings
+from app.shared.logging import LOGGER
+
+# Tenant of requests sent without a bearer token (IAM token exchange)
+ANONYMOUS_TENANT = "anonymous"
+
+
+def get_tenant_key(authorization: Optional[str]) -> str:
+    """
+    Identify the tenant of an upstream request from its Authorization header.
+
+    Args:
+        authorization: Authorization header value ("Bearer ...")
+
+    Returns:
+        str: Hash of the bearer token, or ANONYMOUS_TENANT without a token
+    """
+    token = (authorization or "").removeprefix("Bearer ").removeprefix("bearer ").strip()
+    if not token:
+        return ANONYMOUS_TENANT
+    return get_token_hash(token)
+
+
+class _TenantQueue:
+    """Waiting requests and service received by a single tenant."""
+
+    def __init__(self, cap: int) -> None:
+        self.cap = cap
+        self.in_flight = 0
+        # Virtual time of the tenant's next slot; lower goes first
+        self.pass_value = 0.0
+        self.waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def is_idle(self) -> bool:
+        return self.in_flight == 0 and not self.waiters
+
+    @property
+    def is_eligible(self) -> bool:
+        """Whether the tenant has a request waiting and is below its cap."""
+        return bool(self.waiters) and self.in_flight < self.cap
+
+
+class TenantScheduler:
+    """Fair queueing of upstream requests between tenants, with a per-tenant cap."""
+
+    def __init__(self, capacity: int, cap: int) -> None:
+        """
+        Args:
+            capacity: Slots shared by all tenants (the size of the global IBM API semaphore)
+            cap: Maximum concurrent slots of a single tenant, 0 for no cap
+        """
+        self.capacity = max(1, capacity)
+        self.cap = cap if cap > 0 else self.capacity
+        self.in_flight = 0
+        self._virtual_time = 0.0
+        self._tenants: dict[str, _TenantQueue] = {}
+
+    def _get_tenant(self, tenant: str) -> _TenantQueue:
+        queue = self._tenants.get(tenant)
+        if queue is None:
+            queue = _TenantQueue(self.cap)
+            # Rejoin at the current virtual time, without credit for the time spent idle
+            queue.pass_value = self._virtual_time
+            self._tenants[tenant] = queue
+        return queue
+
+    def _grant(self, queue: _TenantQueue) -> None:
+        queue.in_flight += 1
+        self.in_flight += 1
+        self._virtual_time = max(self._virtual_time, queue.pass_value)
+        queue.pass_value += 1.0
+
+    async def acquire(self, tenant: str) -> None:
+        """
+        Wait until the tenant is granted a slot.
+
+        Args:
+            tenant: Tenant key of the request
+        """
+        queue = self._get_tenant(tenant)
+        # Waiting requests only remain while all slots are taken or their tenant is at its cap
+        if self.in_flight < self.capacity and queue.in_flight < queue.cap and not queue.waiters:
+            self._grant(queue)
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        queue.waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter in queue.waiters:
+                queue.waiters.remove(waiter)
+                self._forget_if_idle(tenant, queue)
+            elif waiter.done() and not waiter.cancelled():
+                # Slot was handed over just before cancellation - give it back
+                self.release(tenant)
+            raise
+
+    def release(self, tenant: str) -> None:
+        """
+        Give back a slot of the tenant and hand free slots to the next tenants in line.
+
+        Args:
+            tenant: Tenant key the slot was acquired for
+        """
+        queue = self._tenants[tenant]
+        queue.in_flight -= 1
+        self.in_flight -= 1
+        self._dispatch()
+        self._forget_if_idle(tenant, queue)
+
+    def _dispatch(self) -> None:
+        while self.in_flight < self.capacity:
+            eligible = [queue for queue in self._tenants.values() if queue.is_eligible]
+            if not eligible:
+                return
+            queue = min(eligible, key=lambda q: q.pass_value)
+            waiter = queue.waiters.popleft()
+            if waiter.done():
+                continue
+            self._grant(queue)
+            waiter.set_result(None)
+
+    def _forget_if_idle(self, tenant: str, queue: _TenantQueue) -> None:
+        if queue.is_idle and self._tenants.get(tenant) is queue:
+            del self._tenants[tenant]
+
+    def slot(self, tenant: str) -> "TenantSlot":
+        """
+        Get a slot of the given tenant.
+
+        Args:
+            tenant: Tenant key of the request
+
+        Returns:
+            TenantSlot: Async context manager holding one of the tenant's slots
+        """
+        return TenantSlot(self, tenant)
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Get the in-flight and queued requests of every active tenant.
+
+        Returns:
+            dict: Mapping of tenant to its cap, in-flight and queued requests
+        """
+        return {
+            tenant: {
+                "cap": queue.cap,
+                "in_flight": queue.in_flight,
+                "queued": len(queue.waiters),
+            }
+            for tenant, queue in self._tenants.items()
+        }
+
+
+class TenantSlot:
+    """Slot of the tenant scheduler held by a single request, used as an async context manager."""
+
+    def __init__(self, scheduler: Optional[TenantScheduler], tenant: str) -> None:
+        self._scheduler = scheduler
+        self._tenant = tenant
+
+    async def __aenter__(self) -> "TenantSlot":
+        if self._scheduler is not None:
+            await self._scheduler.acquire(self._tenant)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+        if self._scheduler is not None:
+            self._scheduler.release(self._tenant)
+        return False
+
+
+_tenant_scheduler: Optional[TenantScheduler] = None
+
+
+def get_tenant_scheduler() -> TenantScheduler:
+    """
+    Get the global tenant scheduler instance (singleton pattern).
+
+    Returns:
+        TenantScheduler: The global scheduler
+    """
+    global _tenant_scheduler
+    if _tenant_scheduler is None:
+        _tenant_scheduler = TenantScheduler(
+            capacity=settings.ibm_api_max_concurrent_calls,
+            cap=settings.tenant_max_concurrent_calls,
+        )
+        LOGGER.info(
+            "Tenant scheduler initialized: capacity=%d, cap per tenant=%d",
+            settings.ibm_api_max_concurrent_calls,
+            settings.tenant_max_concurrent_calls,
+        )
+    return _tenant_scheduler
+
+
+def _tenant_label(tenant: str) -> str:
+    """Shorten a tenant key (a token hash) for metric labels."""
+    return tenant[:12]
+
+
+def _collect_tenant_metrics() -> list[MetricFamily]:
+    """Report the in-flight and queued requests of every active tenant, labelled by shortened tenant key."""
+    if _tenant_scheduler is None:
+        return []
+    in_flight = MetricFamily(
+        "tenant_in_flight_requests", "IBM API requests in flight for a tenant", label_names=("tenant",)
+    )
+    queued = MetricFamily(
+        "tenant_queued_requests", "IBM API requests of a tenant waiting for a slot", label_names=("tenant",)
+    )
+    for tenant, stats in _tenant_scheduler.get_stats().items():
+        in_flight.add(stats["in_flight"], _tenant_label(tenant))
+        queued.add(stats["queued"], _tenant_label(tenant))
+    return [in_flight, queued]
+
+
+get_metrics_registry().register_collector("tenant_scheduler", _collect_tenant_metrics)
+
+
+def get_tenant_slot(authorization: Optional[str]) -> TenantSlot:
+    """
+    Get a slot of the global tenant scheduler for an upstream request.
+
+    Tenants are only scheduled in HTTP transport mode; otherwise, or when
+    fairness is disabled, the returned slot does not limit anything.
+
+    Args:
+        authorization: Authorization header of the request
+
+    Returns:
+        TenantSlot: Async context manager holding one of the tenant's slots
+    """
+    if not settings.tenant_fairness_enabled or settings.server_transport != "http":
+        return TenantSlot(None, ANONYMOUS_TENANT)
+    return get_tenant_scheduler().slot(get_tenant_key(authorization))
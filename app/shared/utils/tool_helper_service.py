@@ -4,17 +4,22 @@
 
 # This file has been modified with the assistance of IBM Bob AI Tool
 
-import json
 import re
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 
 from app.core.auth import get_access_token
+from app.core.auth_context import get_token_hash
 from app.core.settings import settings
 from app.services.constants import JSON_CONTENT_TYPE, JSON_PATCH_CONTENT_TYPE
 from app.shared.exceptions.base import ExternalAPIError, ServiceError
 from app.shared.logging.utils import LOGGER
 from app.shared.utils.http_client import get_http_client
+from app.shared.utils.json_codec import JSONDecodeError, get_json_codec
+from app.shared.utils.response_cache import get_response_cache
+
+# First character of a JSON object or array embedded in an error message
+_JSON_START_PATTERN = re.compile(r"[{\[]")
 
 
 def create_default_headers(
@@ -69,6 +74,9 @@ class ToolHelperService:
         headers: Dict[str, str] = create_default_headers(),
         params: Optional[Dict[str, Any]] = None,
         tool_name: Optional[str] = None,
+        single_flight: Optional[bool] = None,
+        fields: Optional[List[str]] = None,
+        hedge: bool = False,
     ) -> Dict[str, Any] | bytes:
         """
         Execute a GET request with authorization header and handle common error patterns.
@@ -79,21 +87,52 @@ class ToolHelperService:
             params: Query parameters
             timeout: Request timeout in seconds
             tool_name: Name of the tool making the request (for error messages)
+            single_flight: Share one upstream call with concurrent identical GETs
+                           of the same principal (defaults to settings.http_single_flight_enabled)
+            fields: Dot-separated paths of the response fields the tool reads, e.g.
+                    ["rows.metadata.name"]; the rest of the document is dropped after decoding
+            hedge: Send a second request when this one is slower than the endpoint's usual
+                   latency (only with settings.http_hedging_enabled), for lookups on the
+                   critical path of tool calls
 
         Returns:
-            Dict[str, Any]: JSON response
+            Dict[str, Any]: JSON response. Served from the response cache when the
+            endpoint has a cache policy in its service manifest.
 
         Raises:
             ExternalAPIError: If the request fails
             ServiceError: If the response status code is 404
         """
         headers["Authorization"] = await get_access_token()
-        try:
-            response_json = await self.http_client.get(
-                url=url, headers=headers, params=params
+        # Snapshot headers and params so a background cache refresh is not affected
+        # by callers reusing or mutating them
+        request_headers = dict(headers)
+        request_params = dict(params) if params is not None else None
+
+        async def _fetch() -> Dict[str, Any] | bytes:
+            return await self.http_client.get(
+                url=url,
+                headers=request_headers,
+                params=request_params,
+                single_flight=single_flight,
+                fields=fields,
+                hedge=hedge,
             )
 
-            return response_json
+        try:
+            policy = get_response_cache().get_policy(url) if settings.response_cache_enabled else None
+            if policy is None:
+                return await _fetch()
+
+            return await get_response_cache().get_or_fetch(
+                policy,
+                get_token_hash(request_headers["Authorization"]),
+                url,
+                request_params,
+                request_headers,
+                _fetch,
+                fields,
+            )
         except ExternalAPIError as e:
             LOGGER.error(
                 f"{tool_name or 'Request'} to {url} failed with error: {str(e)}"
@@ -111,6 +150,7 @@ class ToolHelperService:
         content: Optional[bytes] = None,
         files: Optional[Dict[str, Any]] = None,
         tool_name: Optional[str] = None,
+        fields: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """
         Internal helper for HTTP methods with request body (POST, PUT, PATCH).
@@ -125,6 +165,7 @@ class ToolHelperService:
             content: Optional raw bytes to send in the request body
             files: Multipart file uploads
             tool_name: Name of the tool making the request (for error messages)
+            fields: Dot-separated paths of the response fields to keep
             
         Returns:
             Dict[str, Any]: JSON response
@@ -133,6 +174,7 @@ class ToolHelperService:
             ExternalAPIError: If the request fails
         """
         headers["Authorization"] = await get_access_token()
+        self._invalidate_cached_responses(headers["Authorization"], url)
         try:
             # Get the appropriate HTTP client method
             client_method = getattr(self.http_client, method.value.lower())
@@ -144,6 +186,7 @@ class ToolHelperService:
                 params=params,
                 content=content,
                 files=files,
+                fields=fields,
             )
             return response_json
         except ExternalAPIError as e:
@@ -162,6 +205,7 @@ class ToolHelperService:
         content: Optional[bytes] = None,
         files: Optional[Dict[str, Any]] = None,
         tool_name: Optional[str] = None,
+        fields: Optional[List[str]] = None,
     ) -> Dict[str, Any] | bytes:
         """
         Execute a POST request with authorization header and handle common error patterns.
@@ -176,6 +220,8 @@ class ToolHelperService:
             files: Multipart file uploads. Dictionary mapping field names to file-like objects or tuples.
                    Format: {'field_name': file_object} or {'field_name': ('filename', file_object, 'content_type')}
             tool_name: Name of the tool making the request (for error messages)
+            fields: Dot-separated paths of the response fields the tool reads;
+                    the rest of the document is dropped after decoding
 
         Returns:
             Dict[str, Any]: JSON response
@@ -184,7 +230,7 @@ class ToolHelperService:
             ExternalAPIError: If the request fails
         """
         return await self._execute_request_with_body(
-            HTTPMethod.POST, url, headers, json, data, params, content, files, tool_name
+            HTTPMethod.POST, url, headers, json, data, params, content, files, tool_name, fields
         )
 
     async def execute_put_request(
@@ -281,6 +327,7 @@ class ToolHelperService:
             ServiceError: If the response status code is 404
         """
         headers["Authorization"] = await get_access_token()
+        self._invalidate_cached_responses(headers["Authorization"], url)
         try:
             response_json = await self.http_client.delete(
                 url=url, headers=headers, params=params
@@ -293,6 +340,11 @@ class ToolHelperService:
             )
             raise self._format_exception(e, HTTPMethod.DELETE, tool_name)
 
+    def _invalidate_cached_responses(self, authorization: str | None, url: str) -> None:
+        """Drop the caller's cached GET responses related to the path being written to."""
+        if settings.response_cache_enabled:
+            get_response_cache().invalidate(get_token_hash(authorization), url)
+
     def _format_exception(
         self,
         exception: ExternalAPIError,
@@ -566,9 +618,9 @@ class ToolHelperService:
     
     def _find_json_string(self, error_detail: str) -> str:
         """Find and extract JSON string from error detail."""
-        for i, char in enumerate(error_detail):
-            if char in ['{', '[']:
-                return error_detail[i:]
+        match = _JSON_START_PATTERN.search(error_detail)
+        if match:
+            return error_detail[match.start():]
         
         LOGGER.debug(f"No JSON found in error_detail: {error_detail[:100]}")
         return ""
@@ -576,8 +628,8 @@ class ToolHelperService:
     def _parse_json_safely(self, json_str: str) -> dict | list | None:
         """Parse JSON string safely, returning None on failure."""
         try:
-            return json.loads(json_str)
-        except (json.JSONDecodeError, TypeError) as e:
+            return get_json_codec().loads(json_str)
+        except (JSONDecodeError, TypeError) as e:
             LOGGER.error(f"Failed to parse error_detail as JSON: {e}. JSON string: {json_str[:200]}")
             return None
     
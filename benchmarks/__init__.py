@@ -0,0 +1,5 @@
+# Copyright [2026] [IBM]
+# Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+# See the LICENSE file in the project root for license information.
+
+"""Development benchmarks, run from the project root (see the benchmark-* targets of the Makefile); not packaged."""
@@ -0,0 +1,418 @@
+# Copyright [2026] [IBM]
+# Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+# See the LICENSE file in the project root for license information.
+
+"""
+HTTP/2 versus HTTP/1.1 benchmark for the upstream connection pool.
+
+Starts a local stand-in for a DI host that speaks HTTP/1.1 and HTTP/2 (over
+TLS with ALPN by default, or cleartext with ``--no-tls``) and answers every
+request after a fixed service time. Bursts of concurrent GETs are then sent
+through an ``httpx.AsyncClient`` configured like the shared client in each
+mode: the ``HTTP_*`` pool settings for HTTP/1.1, the ``HTTP2_*`` pool
+settings and per-host stream limit for HTTP/2.
+
+For each protocol the report lists the throughput, the latency percentiles
+and the connections (TLS handshakes) the server accepted.
+
+HTTP/2 needs the h2 package (``pip install ibm-watsonx-data-intelligence-mcp-server[http2]``).
+
+Usage::
+
+    python -m benchmarks.http2_benchmark --output http2.json
+    python -m benchmarks.http2_benchmark --requests 10000 --concurrency 400 --delay-ms 50
+"""
+
+import argparse
+import asyncio
+import contextlib
+import datetime
+import ipaddress
+import json
+import platform
+import ssl
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import httpx
+
+from app.core.settings import settings
+
+try:
+    import h2.config
+    import h2.connection
+    import h2.events
+    import h2.settings
+except ImportError:
+    h2 = None
+
+BENCHMARK_VERSION = 1
+
+PROTOCOLS = ("http1", "http2")
+
+# First bytes an HTTP/2 client sends on a cleartext connection (prior knowledge)
+_H2_PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+
+
+def _create_certificate(directory: Path) -> tuple[Path, Path]:
+    """Create a self-signed certificate for 127.0.0.1 and localhost."""
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=5))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName(
+                [x509.DNSName("localhost"), x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]
+            ),
+            critical=False,
+        )
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_file = directory / "cert.pem"
+    key_file = directory / "key.pem"
+    cert_file.write_bytes(certificate.public_bytes(serialization.Encoding.PEM))
+    key_file.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return cert_file, key_file
+
+
+class StandInServer:
+    """Local HTTP/1.1 and HTTP/2 server answering every request with the same JSON body after a delay."""
+
+    def __init__(self, delay_s: float, body: bytes, max_streams: int, ssl_context: Optional[ssl.SSLContext]) -> None:
+        self.delay_s = delay_s
+        self.body = body
+        self.max_streams = max_streams
+        self.ssl_context = ssl_context
+        self.connections = 0
+        self._server: Optional[asyncio.Server] = None
+        self._handlers: set[asyncio.Task] = set()
+
+    @property
+    def url(self) -> str:
+        port = self._server.sockets[0].getsockname()[1]
+        scheme = "https" if self.ssl_context else "http"
+        return f"{scheme}://127.0.0.1:{port}/v2/assets"
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0, ssl=self.ssl_context)
+
+    async def stop(self) -> None:
+        self._server.close()
+        # Clients have closed their connections, let the handlers finish
+        if self._handlers:
+            await asyncio.wait(self._handlers, timeout=5)
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        handler = asyncio.current_task()
+        self._handlers.add(handler)
+        try:
+            ssl_object = writer.get_extra_info("ssl_object")
+            if ssl_object is not None:
+                is_h2 = ssl_object.selected_alpn_protocol() == "h2"
+                initial = b""
+            else:
+                try:
+                    initial = await reader.readexactly(len(_H2_PREFACE))
+                except asyncio.IncompleteReadError as e:
+                    initial = e.partial
+                is_h2 = initial == _H2_PREFACE
+            if is_h2:
+                await self._serve_http2(reader, writer, initial)
+            else:
+                await self._serve_http1(reader, writer, initial)
+        except (ConnectionError, ssl.SSLError):
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError, ssl.SSLError):
+                await writer.wait_closed()
+            self._handlers.discard(handler)
+
+    async def _serve_http1(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, buffer: bytes) -> None:
+        head = (
+            b"HTTP/1.1 200 OK\r\ncontent-type: application/json\r\n"
+            b"content-length: " + str(len(self.body)).encode() + b"\r\n\r\n"
+        )
+        while True:
+            while b"\r\n\r\n" not in buffer:
+                chunk = await reader.read(65536)
+                if not chunk:
+                    return
+                buffer += chunk
+            # Benchmark requests are bodiless GETs
+            _, _, buffer = buffer.partition(b"\r\n\r\n")
+            await asyncio.sleep(self.delay_s)
+            writer.write(head + self.body)
+            await writer.drain()
+
+    async def _serve_http2(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, data: bytes) -> None:
+        connection = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False))
+        connection.initiate_connection()
+        connection.update_settings({h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: self.max_streams})
+        writer.write(connection.data_to_send())
+        window_updated = asyncio.Event()
+        responses: set[asyncio.Task] = set()
+
+        async def respond(stream_id: int) -> None:
+            await asyncio.sleep(self.delay_s)
+            connection.send_headers(
+                stream_id,
+                [(":status", "200"), ("content-type", "application/json"), ("content-length", str(len(self.body)))],
+            )
+            body = memoryview(self.body)
+            while body:
+                window = min(connection.local_flow_control_window(stream_id), connection.max_outbound_frame_size)
+                if window <= 0:
+                    writer.write(connection.data_to_send())
+                    window_updated.clear()
+                    await window_updated.wait()
+                    continue
+                connection.send_data(stream_id, body[:window].tobytes(), end_stream=len(body) <= window)
+                body = body[window:]
+            writer.write(connection.data_to_send())
+
+        try:
+            while True:
+                if data:
+                    for event in connection.receive_data(data):
+                        if isinstance(event, h2.events.RequestReceived):
+                            task = asyncio.create_task(respond(event.stream_id))
+                            responses.add(task)
+                            task.add_done_callback(responses.discard)
+                        elif isinstance(event, h2.events.WindowUpdated):
+                            window_updated.set()
+                        elif isinstance(event, h2.events.ConnectionTerminated):
+                            return
+                    writer.write(connection.data_to_send())
+                    await writer.drain()
+                data = await reader.read(65536)
+                if not data:
+                    return
+        finally:
+            for task in responses:
+                task.cancel()
+
+
+def _percentile(ordered: list[float], percentile: float) -> float:
+    """Value at the given percentile of sorted samples, in milliseconds."""
+    index = min(len(ordered) - 1, int(len(ordered) * percentile / 100))
+    return round(ordered[index] * 1000, 2)
+
+
+async def run_protocol(
+    protocol: str, server: StandInServer, requests: int, concurrency: int, verify: ssl.SSLContext | bool
+) -> dict[str, Any]:
+    """
+    Send bursts of concurrent GETs to the stand-in server over one protocol.
+
+    Args:
+        protocol: "http1" or "http2"
+        server: The running stand-in server
+        requests: Total number of requests
+        concurrency: Requests in flight at any time
+        verify: SSL context trusting the server's certificate, or False without TLS
+
+    Returns:
+        dict: Throughput, latency percentiles and connections accepted by the server
+    """
+    is_http2 = protocol == "http2"
+    if is_http2:
+        limits = httpx.Limits(
+            max_connections=settings.http2_max_connections,
+            max_keepalive_connections=settings.http2_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry,
+        )
+        # Same per-host cap as the shared client in HTTP/2 mode
+        streams = (
+            asyncio.Semaphore(settings.http2_max_streams_per_host)
+            if settings.http2_max_streams_per_host > 0
+            else contextlib.nullcontext()
+        )
+    else:
+        limits = httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry,
+        )
+        streams = contextlib.nullcontext()
+
+    connections_before = server.connections
+    latencies: list[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+    async with httpx.AsyncClient(
+        verify=verify,
+        limits=limits,
+        # Cleartext HTTP/2 is only used with prior knowledge, i.e. without HTTP/1.1
+        http1=not is_http2 or bool(verify),
+        http2=is_http2,
+        timeout=httpx.Timeout(settings.request_timeout_s),
+    ) as client:
+
+        async def worker() -> None:
+            nonlocal errors
+            for _ in remaining:
+                start = time.perf_counter()
+                try:
+                    async with streams:
+                        response = await client.get(server.url)
+                    if response.status_code != 200 or response.http_version != ("HTTP/2" if is_http2 else "HTTP/1.1"):
+                        errors += 1
+                        continue
+                except httpx.HTTPError:
+                    errors += 1
+                    continue
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "protocol": protocol,
+        "max_connections": limits.max_connections,
+        "requests": requests,
+        "errors": errors,
+        "elapsed_s": round(elapsed, 3),
+        "requests_per_s": round(len(latencies) / elapsed, 1) if elapsed else None,
+        "latency_ms": {
+            "mean": round(statistics.fmean(latencies) * 1000, 2),
+            "p50": _percentile(latencies, 50),
+            "p95": _percentile(latencies, 95),
+            "p99": _percentile(latencies, 99),
+            "max": round(latencies[-1] * 1000, 2),
+        }
+        if latencies
+        else None,
+        "connections": server.connections - connections_before,
+    }
+
+
+async def run_benchmark(
+    requests: int, concurrency: int, delay_ms: float, body_kb: int, max_streams: int, tls: bool
+) -> dict[str, Any]:
+    """
+    Benchmark HTTP/1.1 and HTTP/2 against a local stand-in server.
+
+    Args:
+        requests: Requests sent per protocol
+        concurrency: Requests in flight at any time
+        delay_ms: Service time of the stand-in server per request
+        body_kb: Size of the response body
+        max_streams: Concurrent streams the server allows per HTTP/2 connection
+        tls: Whether to use TLS, with HTTP/2 negotiated through ALPN
+
+    Returns:
+        dict: Results per protocol and the HTTP/2 speedup
+    """
+    body = json.dumps({"resources": [{"padding": "x" * 1000}] * max(body_kb, 1)}).encode("utf-8")
+    with tempfile.TemporaryDirectory() as directory:
+        server_context: Optional[ssl.SSLContext] = None
+        verify: ssl.SSLContext | bool = False
+        if tls:
+            cert_file, key_file = _create_certificate(Path(directory))
+            server_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+            server_context.load_cert_chain(cert_file, key_file)
+            server_context.set_alpn_protocols(["h2", "http/1.1"])
+            verify = ssl.create_default_context(cafile=str(cert_file))
+
+        server = StandInServer(delay_ms / 1000, body, max_streams, server_context)
+        await server.start()
+        try:
+            results = [await run_protocol(protocol, server, requests, concurrency, verify) for protocol in PROTOCOLS]
+        finally:
+            await server.stop()
+
+    http1, http2 = results
+    return {
+        "version": BENCHMARK_VERSION,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "httpx": httpx.__version__,
+        "h2": getattr(h2, "__version__", None),
+        "tls": tls,
+        "requests": requests,
+        "concurrency": concurrency,
+        "server_delay_ms": delay_ms,
+        "body_bytes": len(body),
+        "results": results,
+        "http2_throughput_speedup": (
+            round(http2["requests_per_s"] / http1["requests_per_s"], 2)
+            if http1["requests_per_s"] and http2["requests_per_s"]
+            else None
+        ),
+    }
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Compare HTTP/2 and HTTP/1.1 against a local stand-in server")
+    parser.add_argument("--requests", type=int, default=5000, help="Requests per protocol")
+    parser.add_argument("--concurrency", type=int, default=200, help="Requests in flight at any time")
+    parser.add_argument("--delay-ms", type=float, default=20.0, help="Service time of the stand-in server")
+    parser.add_argument("--body-kb", type=int, default=4, help="Size of the response body in KB")
+    parser.add_argument("--max-streams", type=int, default=128, help="Streams the server allows per HTTP/2 connection")
+    parser.add_argument("--no-tls", action="store_true", help="Use cleartext HTTP/1.1 and HTTP/2 (prior knowledge)")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    if h2 is None:
+        sys.exit("The h2 package is required for HTTP/2, install the 'http2' extra")
+
+    report = asyncio.run(
+        run_benchmark(
+            max(args.requests, 1),
+            max(args.concurrency, 1),
+            args.delay_ms,
+            args.body_kb,
+            max(args.max_streams, 1),
+            not args.no_tls,
+        )
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+    for result in report["results"]:
+        latency = result["latency_ms"] or {}
+        print(
+            f"{result['protocol']}: {result['requests_per_s']} req/s, p50 {latency.get('p50')} ms, "
+            f"p99 {latency.get('p99')} ms, {result['connections']} connections, {result['errors']} errors",
+            file=sys.stderr,
+        )
+    print(f"HTTP/2 throughput speedup: {report['http2_throughput_speedup']}x", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
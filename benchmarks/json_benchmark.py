@@ -0,0 +1,226 @@
+# Copyright [2026] [IBM]
+# Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+# See the LICENSE file in the project root for license information.
+
+"""
+JSON codec benchmark.
+
+Decodes and encodes payloads with every available codec and reports the
+median time per operation, the throughput and the speedup over the standard
+library. Payloads are recorded DI responses passed with ``--payload`` (files,
+or directories of ``*.json`` files); without them, synthetic payloads shaped
+like search, lineage and asset responses are generated.
+
+Usage::
+
+    python -m benchmarks.json_benchmark --payload recorded/ --output json.json
+    python -m benchmarks.json_benchmark --rows 5000
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from app.shared.utils.json_codec import StdlibJsonCodec, create_json_codec, orjson
+
+BENCHMARK_VERSION = 1
+
+
+def _search_response(rows: int, rng: random.Random) -> dict[str, Any]:
+    """Synthetic /v3/search response."""
+    return {
+        "size": rows,
+        "rows": [
+            {
+                "last_updated_at": 1700000000000 + i,
+                "artifact_id": f"{rng.getrandbits(128):032x}",
+                "metadata": {
+                    "name": f"CUSTOMER_TABLE_{i}",
+                    "description": "Customer master data, refreshed nightly from the CRM system. " * 2,
+                    "artifact_type": "data_asset",
+                    "tags": ["customer", "pii", f"domain_{i % 17}"],
+                    "modified_on": "2025-10-23T08:54:02.170Z",
+                },
+                "entity": {
+                    "assets": {
+                        "catalog_id": f"{rng.getrandbits(128):032x}",
+                        "resource_key": f"db2/schema/CUSTOMER_TABLE_{i}",
+                        "column_names": [f"COLUMN_{c}" for c in range(12)],
+                        "rating": rng.random() * 5,
+                    },
+                    "artifacts": {"global_id": f"{rng.getrandbits(64):016x}_{i}", "version_id": i},
+                },
+                "categories": {"primary_category_name": "Finance", "secondary_category_ids": [i, i + 1]},
+            }
+            for i in range(rows)
+        ],
+    }
+
+
+def _lineage_response(rows: int, rng: random.Random) -> dict[str, Any]:
+    """Synthetic query_lineage response."""
+    ids = [f"{rng.getrandbits(256):064x}" for _ in range(rows)]
+    return {
+        "assets_in_view": [
+            {
+                "id": asset_id,
+                "name": f"asset_{i}",
+                "type": "column" if i % 3 else "table",
+                "tags": [],
+                "hierarchical_path": [
+                    {"id": f"{rng.getrandbits(64):016x}", "name": name, "type": kind}
+                    for name, kind in (("db2prod", "database"), ("SALES", "schema"), (f"T{i % 50}", "table"))
+                ],
+                "properties": {"data_type": "VARCHAR", "length": 255, "nullable": True},
+            }
+            for i, asset_id in enumerate(ids)
+        ],
+        "edges_in_view": [
+            {"source": ids[i], "target": ids[(i * 7 + 1) % rows], "type": "direct", "is_inferred": False}
+            for i in range(rows)
+        ],
+    }
+
+
+def _asset_response(rows: int, rng: random.Random) -> dict[str, Any]:
+    """Synthetic asset with column profiles."""
+    return {
+        "metadata": {"asset_id": f"{rng.getrandbits(128):032x}", "name": "ORDERS", "asset_type": "data_asset"},
+        "entity": {
+            "data_asset": {
+                "columns": [
+                    {
+                        "name": f"COLUMN_{i}",
+                        "type": {"type": "decimal", "precision": 18, "scale": 2, "nullable": True},
+                        "profile": {
+                            "distinct_count": rng.randrange(10**6),
+                            "null_ratio": rng.random(),
+                            "top_values": [{"value": f"v{v}", "count": rng.randrange(1000)} for v in range(5)],
+                        },
+                    }
+                    for i in range(rows)
+                ]
+            }
+        },
+    }
+
+
+SYNTHETIC_PAYLOADS: dict[str, Callable[[int, random.Random], dict[str, Any]]] = {
+    "search": _search_response,
+    "lineage": _lineage_response,
+    "asset": _asset_response,
+}
+
+
+def load_payloads(paths: list[str]) -> dict[str, bytes]:
+    """
+    Load recorded payloads.
+
+    Args:
+        paths: JSON files, or directories whose ``*.json`` files are loaded
+
+    Returns:
+        dict[str, bytes]: Raw payloads by file name
+    """
+    payloads = {}
+    for path in map(Path, paths):
+        files = sorted(path.glob("*.json")) if path.is_dir() else [path]
+        for file in files:
+            payloads[file.name] = file.read_bytes()
+    return payloads
+
+
+def generate_payloads(rows: int, seed: int = 0) -> dict[str, bytes]:
+    """Generate the synthetic payloads with the given number of rows, assets or columns."""
+    rng = random.Random(seed)
+    return {name: json.dumps(factory(rows, rng)).encode("utf-8") for name, factory in SYNTHETIC_PAYLOADS.items()}
+
+
+def _time_ms(operation: Callable[[], Any], repeat: int) -> float:
+    """Median time of one call in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operation()
+        timings.append(time.perf_counter() - start)
+    return round(statistics.median(timings) * 1000, 3)
+
+
+def run_benchmark(payloads: dict[str, bytes], repeat: int) -> dict[str, Any]:
+    """
+    Benchmark every available codec on the payloads.
+
+    Args:
+        payloads: Raw JSON payloads by name
+        repeat: Number of timed calls per operation
+
+    Returns:
+        dict: Median decode and encode times per payload and codec, with throughput and speedup
+    """
+    codecs = [StdlibJsonCodec()] + ([create_json_codec("orjson")] if orjson is not None else [])
+    results = []
+    for name, raw in payloads.items():
+        value = StdlibJsonCodec().loads(raw)
+        entry: dict[str, Any] = {"payload": name, "size_kb": round(len(raw) / 1024, 1), "codecs": {}}
+        for codec in codecs:
+            decode_ms = _time_ms(lambda: codec.loads(raw), repeat)
+            encode_ms = _time_ms(lambda: codec.dumps(value), repeat)
+            entry["codecs"][codec.name] = {
+                "decode_ms": decode_ms,
+                "encode_ms": encode_ms,
+                "decode_mb_s": round(len(raw) / 2**20 / (decode_ms / 1000), 1) if decode_ms else None,
+            }
+        baseline = entry["codecs"][StdlibJsonCodec.name]
+        for codec_result in entry["codecs"].values():
+            codec_result["decode_speedup"] = round(baseline["decode_ms"] / codec_result["decode_ms"], 2)
+            codec_result["encode_speedup"] = round(baseline["encode_ms"] / codec_result["encode_ms"], 2)
+        results.append(entry)
+
+    return {
+        "version": BENCHMARK_VERSION,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "orjson": getattr(orjson, "__version__", None),
+        "repeat": repeat,
+        "payloads": results,
+    }
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Compare the JSON codecs on DI payloads")
+    parser.add_argument("--payload", action="append", default=[], help="Recorded JSON file or directory (repeatable)")
+    parser.add_argument("--rows", type=int, default=2000, help="Rows of the synthetic payloads")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed calls per operation")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    payloads = load_payloads(args.payload) if args.payload else generate_payloads(args.rows)
+    report = run_benchmark(payloads, max(args.repeat, 1))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+    if orjson is None:
+        print("orjson is not installed, only the standard library was measured", file=sys.stderr)
+    for entry in report["payloads"]:
+        summary = ", ".join(
+            f"{name} decode {r['decode_ms']:.2f} ms ({r['decode_speedup']}x) encode {r['encode_ms']:.2f} ms ({r['encode_speedup']}x)"
+            for name, r in entry["codecs"].items()
+        )
+        print(f"{entry['payload']} ({entry['size_kb']} KB): {summary}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
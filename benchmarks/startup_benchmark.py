@@ -0,0 +1,321 @@
+# Copyright [2026] [IBM]
+# Licensed under the Apache License, Version 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+# See the LICENSE file in the project root for license information.
+
+"""
+Startup benchmark for the MCP server.
+
+Every run starts a fresh interpreter with ``-X importtime`` that creates the
+server the way ``app.main`` does and records wall time and RSS after each
+startup phase:
+
+- ``import``: importing ``app.main`` (FastMCP, settings, registries)
+- ``discovery``: discovering the services and importing their tool and prompt
+  modules (only prompt modules when tools are loaded from the tool index)
+- ``registration``: creating the server and registering tools and prompts,
+  which builds the tools' pydantic schemas
+- ``list_tools``: the first ``list_tools`` call, as done on ``initialize``
+
+The import times reported by the interpreter are broken down per module, per
+package and per service. The result is written as JSON so it can be compared
+across releases; ``--budget-ms`` turns it into a cold-start check.
+
+Usage::
+
+    python -m benchmarks.startup_benchmark --runs 5 --output startup.json
+    python -m benchmarks.startup_benchmark --lazy --budget-ms 1500
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+BENCHMARK_VERSION = 1
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SERVICES_PACKAGE = "app.services"
+IMPORT_TIME_PREFIX = "import time:"
+
+
+def _get_rss_mb() -> float | None:
+    """Get the resident set size of this process, or its peak where the current value is not available."""
+    try:
+        with open("/proc/self/statm", "r", encoding="ascii") as f:
+            resident_pages = int(f.read().split()[1])
+        return round(resident_pages * os.sysconf("SC_PAGE_SIZE") / 2**20, 1)
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return round(max_rss / (2**20 if sys.platform == "darwin" else 2**10), 1)
+
+
+class _PhaseRecorder:
+    """Records wall time, RSS and loaded module count at the end of each phase."""
+
+    def __init__(self) -> None:
+        self.phases: list[dict[str, Any]] = []
+        self._started = time.perf_counter()
+        self._last = self._started
+
+    def record(self, name: str) -> None:
+        now = time.perf_counter()
+        self.phases.append(
+            {
+                "name": name,
+                "wall_ms": round((now - self._last) * 1000, 2),
+                "rss_mb": _get_rss_mb(),
+                "modules_loaded": len(sys.modules),
+            }
+        )
+        self._last = now
+
+    @property
+    def total_ms(self) -> float:
+        return round((self._last - self._started) * 1000, 2)
+
+
+def run_startup(lazy: bool | None) -> dict[str, Any]:
+    """
+    Create the server in this process and measure each startup phase.
+
+    Args:
+        lazy: Load tools from the tool index (None uses settings.lazy_tool_loading)
+
+    Returns:
+        dict: Phase measurements and tool/prompt counts of the run
+    """
+    recorder = _PhaseRecorder()
+
+    main = importlib.import_module("app.main")
+    recorder.record("import")
+
+    lazy_tools, system_prompts_loaded = main.load_services(lazy)
+    recorder.record("discovery")
+
+    mcp = main.build_server(lazy_tools, system_prompts_loaded)
+    recorder.record("registration")
+
+    tools = asyncio.run(mcp.list_tools())
+    recorder.record("list_tools")
+
+    return {
+        "phases": recorder.phases,
+        "total_ms": recorder.total_ms,
+        "tool_index_used": lazy_tools is not None,
+        "tools": len(tools),
+        "prompts": main.prompt_registry.get_registered_count(),
+    }
+
+
+def parse_import_times(stderr: str) -> list[dict[str, Any]]:
+    """
+    Parse the output of ``python -X importtime``.
+
+    Args:
+        stderr: Standard error of the interpreter
+
+    Returns:
+        list[dict]: One entry per imported module, in the order the interpreter
+                    reported them (children before their parent), with times in ms
+    """
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith(IMPORT_TIME_PREFIX):
+            continue
+        parts = line[len(IMPORT_TIME_PREFIX):].split("|", 2)
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            # Header line
+            continue
+        # Nested imports are indented by two spaces per level after the separator
+        name = parts[2][1:]
+        imports.append(
+            {
+                "module": name.strip(),
+                "level": (len(name) - len(name.lstrip())) // 2,
+                "self_ms": int(parts[0]) / 1000,
+                "cumulative_ms": int(parts[1]) / 1000,
+            }
+        )
+    return imports
+
+
+def _get_service_name(module: str) -> str | None:
+    """Get the service a module belongs to, e.g. "search" or "internal.lineage"."""
+    parts = module.split(".")
+    if module.startswith(SERVICES_PACKAGE + ".") and len(parts) > 2:
+        return ".".join(parts[2:4] if parts[2] == "internal" and len(parts) > 3 else parts[2:3])
+    return None
+
+
+def summarize_import_times(imports: list[dict[str, Any]], top: int) -> dict[str, Any]:
+    """
+    Break the import times of a run down per module, package and service.
+
+    Args:
+        imports: Modules as returned by parse_import_times
+        top: Number of most expensive modules to keep
+
+    Returns:
+        dict: ``modules`` (top modules by cumulative time), ``packages`` (self time per
+              top-level package, services counted separately) and ``services`` (self time
+              of a service's modules and of the third-party modules they imported first)
+    """
+    packages: dict[str, float] = {}
+    services: dict[str, float] = {}
+    # Reversed, the report lists every module before the modules it imported
+    ancestors: list[tuple[int, str]] = []
+    for entry in reversed(imports):
+        while ancestors and ancestors[-1][0] >= entry["level"]:
+            ancestors.pop()
+        ancestors.append((entry["level"], entry["module"]))
+
+        package = _get_service_name(entry["module"])
+        package = f"{SERVICES_PACKAGE}.{package}" if package else entry["module"].split(".")[0]
+        packages[package] = packages.get(package, 0.0) + entry["self_ms"]
+
+        # Charge the module to the nearest service that caused it to be imported
+        for _, ancestor in reversed(ancestors):
+            service = _get_service_name(ancestor)
+            if service:
+                services[service] = services.get(service, 0.0) + entry["self_ms"]
+                break
+
+    def _table(costs: dict[str, float], key: str) -> list[dict[str, Any]]:
+        ranked = sorted(costs.items(), key=lambda item: item[1], reverse=True)
+        return [{key: name, "self_ms": round(cost, 2)} for name, cost in ranked]
+
+    modules = sorted(imports, key=lambda entry: entry["cumulative_ms"], reverse=True)[:top]
+    return {
+        "total_ms": round(sum(entry["self_ms"] for entry in imports), 2),
+        "modules": [
+            {"module": e["module"], "self_ms": e["self_ms"], "cumulative_ms": e["cumulative_ms"]}
+            for e in modules
+        ],
+        "packages": _table(packages, "package"),
+        "services": _table(services, "service"),
+    }
+
+
+def _run_worker(lazy: bool | None) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    """Run one startup in a fresh interpreter and return its measurements and import times."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        result_file = Path(tmp_dir) / "startup.json"
+        command = [sys.executable, "-X", "importtime", "-m", __spec__.name, "--worker", "--result-file", str(result_file)]
+        if lazy is not None:
+            command.append("--lazy" if lazy else "--eager")
+        process = subprocess.run(command, cwd=PROJECT_ROOT, capture_output=True, text=True, check=False)
+        if process.returncode != 0 or not result_file.is_file():
+            raise RuntimeError(f"Startup benchmark worker failed (exit code {process.returncode}):\n{process.stderr[-4000:]}")
+        with open(result_file, "r", encoding="utf-8") as f:
+            return json.load(f), parse_import_times(process.stderr)
+
+
+def _median(values: list[float | None]) -> float | None:
+    values = [v for v in values if v is not None]
+    return round(statistics.median(values), 2) if values else None
+
+
+def run_benchmark(runs: int, lazy: bool | None, top: int) -> dict[str, Any]:
+    """
+    Run the startup benchmark.
+
+    Args:
+        runs: Number of fresh interpreters to start
+        lazy: Load tools from the tool index (None uses settings.lazy_tool_loading)
+        top: Number of most expensive modules to report
+
+    Returns:
+        dict: Per-run measurements, per-phase medians and the import breakdown of the median run
+    """
+    results = []
+    for run in range(runs):
+        result, imports = _run_worker(lazy)
+        results.append((result, imports))
+        print(f"Run {run + 1}/{runs}: {result['total_ms']:.0f} ms", file=sys.stderr)
+
+    phase_names = [phase["name"] for phase in results[0][0]["phases"]]
+    phases = []
+    for position, name in enumerate(phase_names):
+        measured = [result["phases"][position] for result, _ in results]
+        phases.append(
+            {
+                "name": name,
+                "wall_ms": _median([phase["wall_ms"] for phase in measured]),
+                "wall_ms_min": min(phase["wall_ms"] for phase in measured),
+                "wall_ms_max": max(phase["wall_ms"] for phase in measured),
+                "rss_mb": _median([phase["rss_mb"] for phase in measured]),
+                "modules_loaded": measured[-1]["modules_loaded"],
+            }
+        )
+
+    # Import times are reported for the run whose total is the median
+    ranked = sorted(results, key=lambda item: item[0]["total_ms"])
+    median_result, median_imports = ranked[len(ranked) // 2]
+    return {
+        "version": BENCHMARK_VERSION,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "runs": runs,
+        "tool_index_used": median_result["tool_index_used"],
+        "tools": median_result["tools"],
+        "prompts": median_result["prompts"],
+        "total_ms": _median([result["total_ms"] for result, _ in results]),
+        "phases": phases,
+        "imports": summarize_import_times(median_imports, top),
+        "samples": [result for result, _ in results],
+    }
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Measure the startup time of the MCP server")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--lazy", dest="lazy", action="store_true", default=None, help="Load tools from the tool index")
+    mode.add_argument("--eager", dest="lazy", action="store_false", help="Import all tool modules")
+    parser.add_argument("--runs", type=int, default=3, help="Number of fresh interpreters to start")
+    parser.add_argument("--top", type=int, default=30, help="Number of most expensive modules to report")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    parser.add_argument("--budget-ms", type=float, help="Exit with status 1 if the median startup takes longer")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--result-file", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        result = run_startup(args.lazy)
+        with open(args.result_file, "w", encoding="utf-8") as f:
+            json.dump(result, f)
+        return
+
+    report = run_benchmark(max(args.runs, 1), args.lazy, args.top)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+    summary = ", ".join(f"{phase['name']} {phase['wall_ms']:.0f} ms" for phase in report["phases"])
+    print(f"Startup: {report['total_ms']:.0f} ms ({summary})", file=sys.stderr)
+    if args.budget_ms is not None and report["total_ms"] > args.budget_ms:
+        print(f"❌ Startup exceeds the budget of {args.budget_ms:.0f} ms", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()